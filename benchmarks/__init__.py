@@ -0,0 +1 @@
+"""Benchmarks for Voice Assistant Manager (not shipped with the integration)."""
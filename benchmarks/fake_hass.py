@@ -0,0 +1,615 @@
+"""In-memory Home Assistant stand-in for benchmarks and load runs.
+
+Provides just enough of ``hass`` to drive the integration's real modules
+in-process, with no network: entity, device and area registries,
+``states``, the event bus and dispatcher, ``config_entries`` for HomeKit
+bridges, ``config.path``, services, an in-memory ``Store``, executor jobs
+and a websocket connection shim. The ``homeassistant`` package must be
+installed (the integration imports it), but no Home Assistant instance is
+started.
+
+Registry lookups are redirected with ``patch_hass()``, which replaces the
+registry ``async_get`` helpers, the storage ``Store`` and the HomeKit
+reload timer for the duration of a ``with`` block.
+
+Typical use::
+
+    hass = FakeHass()
+    populate_registries(hass, 10_000)
+    with patch_hass(hass):
+        await async_setup_integration(hass)
+        connection = FakeConnection(hass)
+        state = await connection.async_call("get_state")
+"""
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import importlib
+import json
+import random
+import tempfile
+from collections.abc import Awaitable, Callable, Coroutine, Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, ClassVar
+from unittest.mock import patch
+
+INTEGRATION = "custom_components.voice_assistant_manager"
+
+# Rough mix of a real install; sensors dominate
+DOMAIN_WEIGHTS = {
+    "sensor": 40,
+    "binary_sensor": 15,
+    "light": 10,
+    "switch": 10,
+    "button": 5,
+    "cover": 3,
+    "climate": 2,
+    "media_player": 3,
+    "fan": 2,
+    "lock": 1,
+    "camera": 1,
+    "scene": 3,
+    "script": 3,
+    "update": 2,
+}
+
+# (original_device_class, unit) of synthetic sensors, with weights; only
+# some of these get a HomeKit accessory
+SENSOR_KINDS = {
+    ("temperature", "°C"): 20,
+    ("humidity", "%"): 10,
+    ("illuminance", "lx"): 5,
+    ("power", "W"): 20,
+    ("energy", "kWh"): 20,
+    ("battery", "%"): 15,
+    (None, None): 10,
+}
+
+
+@dataclass
+class FakeEntity:
+    """Entity registry entry with the fields the integration reads."""
+
+    entity_id: str
+    unique_id: str
+    platform: str
+    device_id: str | None = None
+    area_id: str | None = None
+    name: str | None = None
+    original_name: str | None = None
+    disabled_by: str | None = None
+    hidden_by: str | None = None
+    entity_category: str | None = None
+    device_class: str | None = None
+    original_device_class: str | None = None
+    unit_of_measurement: str | None = None
+    supported_features: int = 0
+
+    @property
+    def disabled(self) -> bool:
+        """Return True if the entity is disabled."""
+        return self.disabled_by is not None
+
+    @property
+    def domain(self) -> str:
+        """Return the entity domain."""
+        return self.entity_id.split(".")[0]
+
+
+@dataclass
+class FakeDevice:
+    """Device registry entry."""
+
+    id: str
+    name: str
+    area_id: str | None = None
+    name_by_user: str | None = None
+    manufacturer: str | None = None
+    model: str | None = None
+    disabled_by: str | None = None
+
+    @property
+    def disabled(self) -> bool:
+        """Return True if the device is disabled."""
+        return self.disabled_by is not None
+
+
+@dataclass
+class FakeArea:
+    """Area registry entry."""
+
+    id: str
+    name: str
+
+
+class FakeEntityRegistry:
+    """Entity registry keyed by entity ID."""
+
+    def __init__(self) -> None:
+        self.entities: dict[str, FakeEntity] = {}
+
+    def async_get(self, entity_id: str) -> FakeEntity | None:
+        return self.entities.get(entity_id)
+
+
+class FakeDeviceRegistry:
+    """Device registry keyed by device ID."""
+
+    def __init__(self) -> None:
+        self.devices: dict[str, FakeDevice] = {}
+
+    def async_get(self, device_id: str) -> FakeDevice | None:
+        return self.devices.get(device_id)
+
+
+class FakeAreaRegistry:
+    """Area registry keyed by area ID."""
+
+    def __init__(self) -> None:
+        self.areas: dict[str, FakeArea] = {}
+
+    def async_get_area(self, area_id: str) -> FakeArea | None:
+        return self.areas.get(area_id)
+
+    def async_list_areas(self) -> list[FakeArea]:
+        return list(self.areas.values())
+
+
+@dataclass
+class FakeState:
+    """State object with attributes."""
+
+    entity_id: str
+    state: str
+    attributes: dict[str, Any] = field(default_factory=dict)
+
+
+class FakeStates:
+    """State machine stand-in."""
+
+    def __init__(self) -> None:
+        self._states: dict[str, FakeState] = {}
+
+    def get(self, entity_id: str) -> FakeState | None:
+        return self._states.get(entity_id)
+
+    def async_entity_ids(self, domain: str | None = None) -> list[str]:
+        return [s.entity_id for s in self.async_all(domain)]
+
+    def async_all(self, domain: str | None = None) -> list[FakeState]:
+        if domain is None:
+            return list(self._states.values())
+        return [s for s in self._states.values() if s.entity_id.startswith(f"{domain}.")]
+
+    def async_set(self, entity_id: str, state: str, attributes: dict[str, Any] | None = None) -> None:
+        self._states[entity_id] = FakeState(entity_id, state, attributes or {})
+
+
+@dataclass
+class FakeConfigEntry:
+    """Config entry stand-in (used for HomeKit bridges)."""
+
+    entry_id: str
+    domain: str
+    title: str
+    data: dict[str, Any] = field(default_factory=dict)
+    options: dict[str, Any] = field(default_factory=dict)
+    loaded: bool = False
+    update_listeners: list[Callable[[Any, FakeConfigEntry], Awaitable[None]]] = field(
+        default_factory=list
+    )
+
+
+async def _async_homekit_update_listener(hass: FakeHass, entry: FakeConfigEntry) -> None:
+    """Like HomeKit's own update listener: reload on every options change."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
+class FakeConfigEntries:
+    """config_entries stand-in; setups and unloads succeed immediately.
+
+    Loaded HomeKit entries reload from an update listener on every options
+    update, like the real integration. ``reloads`` records every setup,
+    i.e. every (re)start of a bridge.
+    """
+
+    def __init__(self, hass: FakeHass) -> None:
+        self.hass = hass
+        self.entries: dict[str, FakeConfigEntry] = {}
+        self.reloads: list[str] = []
+
+    def async_entries(self, domain: str | None = None) -> list[FakeConfigEntry]:
+        return [e for e in self.entries.values() if domain is None or e.domain == domain]
+
+    def async_get_entry(self, entry_id: str) -> FakeConfigEntry | None:
+        return self.entries.get(entry_id)
+
+    def async_update_entry(self, entry: FakeConfigEntry, *, options: dict[str, Any] | None = None, **_: Any) -> bool:
+        if options is None or options == entry.options:
+            return False
+        entry.options = options
+        # Like the real one, announce the change (drift tracker, registry index)
+        from homeassistant.config_entries import (
+            SIGNAL_CONFIG_ENTRY_CHANGED,
+            ConfigEntryChange,
+        )
+        from homeassistant.helpers.dispatcher import async_dispatcher_send
+
+        async_dispatcher_send(
+            self.hass, SIGNAL_CONFIG_ENTRY_CHANGED, ConfigEntryChange.UPDATED, entry
+        )
+        for listener in entry.update_listeners:
+            self.hass.async_create_task(listener(self.hass, entry))
+        return True
+
+    async def async_unload(self, entry_id: str) -> bool:
+        entry = self.entries[entry_id]
+        # Listeners are registered with async_on_unload, so unload drops them
+        entry.update_listeners.clear()
+        entry.loaded = False
+        return True
+
+    async def async_setup(self, entry_id: str) -> bool:
+        entry = self.entries[entry_id]
+        if entry.loaded:
+            return False
+        entry.loaded = True
+        if entry.domain == "homekit":
+            entry.update_listeners.append(_async_homekit_update_listener)
+        self.reloads.append(entry_id)
+        return True
+
+    async def async_reload(self, entry_id: str) -> bool:
+        await self.async_unload(entry_id)
+        return await self.async_setup(entry_id)
+
+
+class FakeStore:
+    """In-memory replacement for homeassistant.helpers.storage.Store.
+
+    Data is kept JSON-encoded so load and save still pay for
+    serialization, like the real store does.
+    """
+
+    _files: ClassVar[dict[str, str]] = {}
+
+    def __init__(self, hass: Any, version: int, key: str, **_: Any) -> None:
+        self.key = key
+        self.version = version
+
+    async def async_load(self) -> Any:
+        raw = self._files.get(self.key)
+        return None if raw is None else json.loads(raw)["data"]
+
+    async def async_save(self, data: Any) -> None:
+        self._files[self.key] = json.dumps({"version": self.version, "data": data})
+
+    @classmethod
+    def clear(cls) -> None:
+        cls._files.clear()
+
+
+@dataclass
+class FakeEvent:
+    """Bus event."""
+
+    event_type: str
+    data: dict[str, Any] = field(default_factory=dict)
+
+
+class FakeBus:
+    """Event bus stand-in; listeners are called synchronously."""
+
+    def __init__(self) -> None:
+        self._listeners: dict[str, list[Callable[[FakeEvent], Any]]] = {}
+
+    def async_listen(self, event_type: str, listener: Callable[[FakeEvent], Any], **_: Any) -> Callable[[], None]:
+        self._listeners.setdefault(event_type, []).append(listener)
+        return lambda: self._listeners[event_type].remove(listener)
+
+    def async_fire(self, event_type: str, event_data: dict[str, Any] | None = None, **_: Any) -> None:
+        event = FakeEvent(event_type, event_data or {})
+        for listener in list(self._listeners.get(event_type, [])):
+            listener(event)
+
+
+class FakeConfig:
+    """hass.config stand-in rooted in a temporary directory."""
+
+    def __init__(self, config_dir: str | None = None) -> None:
+        if config_dir is None:
+            self._tempdir = tempfile.TemporaryDirectory(prefix="vam-fake-")
+            config_dir = self._tempdir.name
+        self.config_dir = config_dir
+
+    def path(self, *parts: str) -> str:
+        return str(Path(self.config_dir, *parts))
+
+
+class FakeServices:
+    """Service registry stand-in that records calls."""
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, str, dict[str, Any]]] = []
+
+    async def async_call(self, domain: str, service: str, service_data: dict[str, Any] | None = None, **_: Any) -> None:
+        self.calls.append((domain, service, service_data or {}))
+
+
+@dataclass
+class FakeUser:
+    """Authenticated user of a websocket connection."""
+
+    id: str = "bench-user"
+    is_admin: bool = True
+
+
+class FakeHass:
+    """Minimal ``hass`` object for driving the integration in-process."""
+
+    def __init__(self, config_dir: str | None = None) -> None:
+        self.data: dict[str, Any] = {}
+        self.states = FakeStates()
+        self.bus = FakeBus()
+        self.config = FakeConfig(config_dir)
+        self.services = FakeServices()
+        self.config_entries = FakeConfigEntries(self)
+        self.entity_registry = FakeEntityRegistry()
+        self.device_registry = FakeDeviceRegistry()
+        self.area_registry = FakeAreaRegistry()
+        self._tasks: set[asyncio.Future] = set()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        return asyncio.get_running_loop()
+
+    def _track(self, future: asyncio.Future) -> asyncio.Future:
+        self._tasks.add(future)
+        future.add_done_callback(self._tasks.discard)
+        return future
+
+    def async_create_task(self, target: Coroutine[Any, Any, Any], name: str | None = None, **_: Any) -> asyncio.Task:
+        return self._track(self.loop.create_task(target, name=name))
+
+    def async_create_background_task(self, target: Coroutine[Any, Any, Any], name: str, **_: Any) -> asyncio.Task:
+        return self._track(self.loop.create_task(target, name=name))
+
+    def async_add_executor_job(self, target: Callable[..., Any], *args: Any) -> asyncio.Future:
+        return self._track(self.loop.run_in_executor(None, target, *args))
+
+    def async_run_hass_job(self, job: Any, *args: Any, **_: Any) -> asyncio.Task | None:
+        result = job.target(*args)
+        if asyncio.iscoroutine(result):
+            return self.async_create_task(result)
+        return None
+
+    async def async_block_till_done(self) -> None:
+        """Wait until every task created through the fake has finished.
+
+        Timers (debounced HomeKit reloads) are not waited for.
+        """
+        while self._tasks:
+            await asyncio.gather(*list(self._tasks), return_exceptions=True)
+
+
+class FakeConnection:
+    """Websocket connection shim.
+
+    Collects every message a handler sends in ``messages`` and keeps the
+    unsubscribe callbacks of subscriptions in ``subscriptions``, like
+    ``ActiveConnection``.
+    """
+
+    def __init__(self, hass: FakeHass, user: FakeUser | None = None) -> None:
+        self.hass = hass
+        self.user = user or FakeUser()
+        self.subscriptions: dict[int, Callable[[], None]] = {}
+        self.messages: list[dict[str, Any]] = []
+        self._last_id = 0
+        self._pending: dict[int, asyncio.Future[dict[str, Any]]] = {}
+
+    def send_message(self, message: dict[str, Any] | str | bytes) -> None:
+        if isinstance(message, (str, bytes)):
+            # Pre-serialized result (construct_result_message)
+            message = json.loads(message)
+        self.messages.append(message)
+        if message["type"] == "result" and (future := self._pending.pop(message["id"], None)):
+            future.set_result(message)
+
+    def send_result(self, msg_id: int, result: Any | None = None) -> None:
+        self.send_message({"id": msg_id, "type": "result", "success": True, "result": result})
+
+    def send_event(self, msg_id: int, event: Any | None = None) -> None:
+        self.send_message({"id": msg_id, "type": "event", "event": event})
+
+    def send_error(self, msg_id: int, code: str, message: str, **_: Any) -> None:
+        self.send_message(
+            {"id": msg_id, "type": "result", "success": False, "error": {"code": code, "message": message}}
+        )
+
+    def async_handle_exception(self, msg: dict[str, Any], err: Exception) -> None:
+        self.send_error(msg["id"], "unknown_error", f"{type(err).__name__}: {err}")
+
+    def async_close(self) -> None:
+        """Cancel all subscriptions, as closing the socket does."""
+        while self.subscriptions:
+            _, unsub = self.subscriptions.popitem()
+            unsub()
+
+    async def async_call(self, command: str, **fields: Any) -> dict[str, Any]:
+        """Run a websocket command through its registered handler.
+
+        The message is validated against the command's schema, the handler
+        (including its admin check and async response task) runs as it would
+        in Home Assistant, and the command's result message is returned as
+        soon as it is sent; other connections' commands keep running.
+
+        Args:
+            command: Command type; the ``voice_assistant_manager/`` prefix
+                may be left out.
+            **fields: Message fields besides ``id`` and ``type``.
+
+        Returns:
+            The result message ({"id", "type", "success", "result"|"error"}).
+        """
+        from homeassistant.components.websocket_api.const import DOMAIN as WS_DOMAIN
+
+        handlers = self.hass.data[WS_DOMAIN]
+        if command not in handlers:
+            command = f"voice_assistant_manager/{command}"
+        handler, schema = handlers[command]
+
+        self._last_id += 1
+        msg = {"id": self._last_id, "type": command, **fields}
+        if schema is not False:
+            msg = schema(msg)
+
+        future = self._pending[msg["id"]] = self.hass.loop.create_future()
+        handler(self.hass, self, msg)
+        return await future
+
+
+def _call_later(hass: FakeHass, delay: float, action: Callable[[Any], None]) -> Callable[[], None]:
+    """async_call_later stand-in based on loop.call_later."""
+    handle = hass.loop.call_later(delay, action, None)
+    return handle.cancel
+
+
+@contextlib.contextmanager
+def patch_hass(hass: FakeHass) -> Iterator[FakeHass]:
+    """Point the registry helpers, Store and reload timer at the fake."""
+    for module in ("storage", "homekit_reload"):
+        importlib.import_module(f"{INTEGRATION}.{module}")
+    with contextlib.ExitStack() as stack:
+        for module, registry in (
+            ("entity_registry", hass.entity_registry),
+            ("device_registry", hass.device_registry),
+            ("area_registry", hass.area_registry),
+        ):
+            stack.enter_context(
+                patch(f"homeassistant.helpers.{module}.async_get", lambda _hass, r=registry: r)
+            )
+        stack.enter_context(patch(f"{INTEGRATION}.storage.Store", FakeStore))
+        stack.enter_context(patch(f"{INTEGRATION}.homekit_reload.async_call_later", _call_later))
+        yield hass
+
+
+async def async_setup_integration(hass: FakeHass) -> None:
+    """Set up the integration like async_setup_entry, without the panel.
+
+    Must run inside ``patch_hass(hass)``.
+    """
+    from custom_components.voice_assistant_manager.api import (
+        async_register_websocket_api,
+    )
+    from custom_components.voice_assistant_manager.const import DOMAIN
+    from custom_components.voice_assistant_manager.homekit_drift import (
+        HomeKitDriftTracker,
+    )
+    from custom_components.voice_assistant_manager.registry_index import RegistryIndex
+    from custom_components.voice_assistant_manager.storage import (
+        VoiceAssistantManagerStorage,
+    )
+
+    storage = VoiceAssistantManagerStorage(hass)
+    await storage.async_load()
+    registry_index = RegistryIndex(hass)
+    registry_index.async_setup()
+    homekit_drift = HomeKitDriftTracker(hass, storage)
+    homekit_drift.async_setup()
+    hass.data[DOMAIN] = {
+        "storage": storage,
+        "registry_index": registry_index,
+        "homekit_drift": homekit_drift,
+    }
+    async_register_websocket_api(hass)
+
+
+async def async_unload_integration(hass: FakeHass) -> None:
+    """Unload the integration set up by async_setup_integration."""
+    from custom_components.voice_assistant_manager import async_unload_entry
+
+    await async_unload_entry(hass, None)
+    await hass.async_block_till_done()
+
+
+def populate_registries(
+    hass: FakeHass,
+    entities: int,
+    fanout: int = 4,
+    seed: int = 0,
+) -> None:
+    """Fill the fake registries with a synthetic install.
+
+    Args:
+        hass: The fake to fill.
+        entities: Number of entities.
+        fanout: Entities per device (about 10% of entities have no device).
+        seed: Random seed, so runs are comparable.
+    """
+    rng = random.Random(seed)
+    # Separate stream, so entity IDs do not depend on the sensor kinds
+    kind_rng = random.Random(seed + 1)
+    domains = list(DOMAIN_WEIGHTS)
+    weights = list(DOMAIN_WEIGHTS.values())
+    sensor_kinds = list(SENSOR_KINDS)
+    sensor_weights = list(SENSOR_KINDS.values())
+
+    area_count = max(5, entities // 200)
+    for index in range(area_count):
+        area_id = f"area_{index}"
+        hass.area_registry.areas[area_id] = FakeArea(area_id, f"Area {index}")
+    area_ids = list(hass.area_registry.areas)
+
+    device_id: str | None = None
+    for index in range(entities):
+        if index % fanout == 0:
+            device_id = f"device_{index // fanout}"
+            hass.device_registry.devices[device_id] = FakeDevice(
+                id=device_id,
+                name=f"Device {index // fanout}",
+                area_id=rng.choice(area_ids),
+                manufacturer="Bench",
+                model=f"M{index % 7}",
+            )
+
+        domain = rng.choices(domains, weights)[0]
+        entity_id = f"{domain}.bench_{index}"
+        has_device = rng.random() >= 0.1
+        entity = FakeEntity(
+            entity_id=entity_id,
+            unique_id=f"bench-{index}",
+            platform=rng.choice(("mqtt", "zha", "hue", "template")),
+            device_id=device_id if has_device else None,
+            area_id=None if has_device else rng.choice(area_ids),
+            original_name=f"Bench {domain} {index}",
+            disabled_by="user" if rng.random() < 0.05 else None,
+            entity_category="diagnostic" if rng.random() < 0.05 else None,
+        )
+        if domain == "sensor":
+            kind = kind_rng.choices(sensor_kinds, sensor_weights)[0]
+            entity.original_device_class, entity.unit_of_measurement = kind
+        elif domain == "cover":
+            entity.supported_features = 15
+        hass.entity_registry.entities[entity_id] = entity
+        if not entity.disabled:
+            hass.states.async_set(
+                entity_id, "on", {"friendly_name": entity.original_name}
+            )
+
+
+def add_homekit_bridge(hass: FakeHass, entry_id: str = "homekit_bridge", port: int = 21064) -> FakeConfigEntry:
+    """Add a HomeKit bridge config entry."""
+    entry = FakeConfigEntry(
+        entry_id=entry_id,
+        domain="homekit",
+        title=f"HASS Bridge {entry_id}",
+        data={"name": f"HASS Bridge {entry_id}", "port": port},
+        options={"mode": "bridge", "filter": {}},
+        loaded=True,
+        update_listeners=[_async_homekit_update_listener],
+    )
+    hass.config_entries.entries[entry_id] = entry
+    return entry
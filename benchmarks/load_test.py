@@ -0,0 +1,191 @@
+"""High-volume websocket API load test for Voice Assistant Manager.
+
+Sets up the integration on the in-memory ``hass`` stand-in and lets a
+number of concurrent clients send a weighted mix of websocket commands
+through the real handlers (schema validation, admin check, async response
+task). Reports per-command latency percentiles, error counts, payload
+sizes and overall throughput as JSON.
+
+Usage (from the repository root, with ``homeassistant`` installed):
+
+    python -m benchmarks.load_test --entities 10000 --clients 8 --requests 200
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from benchmarks.fake_hass import (
+    FakeConnection,
+    FakeHass,
+    async_unload_integration,
+    patch_hass,
+)
+from benchmarks.run import async_configure
+
+# (command, weight); the panel mostly reads and makes small edits
+COMMAND_MIX: list[tuple[str, int]] = [
+    ("get_state", 40),
+    ("get_state_compact", 10),
+    ("toggle_override", 15),
+    ("set_alias", 15),
+    ("preview_yaml", 10),
+    ("plan_homekit", 5),
+    ("write_files", 3),
+    ("sync_homekit", 2),
+]
+
+MessageFactory = Callable[[random.Random, list[str]], tuple[str, dict[str, Any]]]
+
+MESSAGES: dict[str, MessageFactory] = {
+    "get_state": lambda rng, ids: ("get_state", {}),
+    "get_state_compact": lambda rng, ids: ("get_state", {"format": "compact"}),
+    "toggle_override": lambda rng, ids: (
+        "toggle_override",
+        {"entity_id": rng.choice(ids), "assistant": rng.choice(("google", "alexa"))},
+    ),
+    "set_alias": lambda rng, ids: (
+        "set_alias",
+        {"entity_id": rng.choice(ids), "alias": f"Load {rng.randrange(1000)}", "assistant": "google"},
+    ),
+    "preview_yaml": lambda rng, ids: (
+        "preview_yaml",
+        {"assistant": rng.choice(("google", "alexa"))},
+    ),
+    "plan_homekit": lambda rng, ids: ("plan_homekit", {}),
+    "write_files": lambda rng, ids: ("write_files", {"force_homekit": True}),
+    "sync_homekit": lambda rng, ids: ("sync_homekit", {"force": True}),
+}
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    """Return the pct-th percentile (nearest rank) of values."""
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+async def _async_client(
+    hass: FakeHass,
+    client: int,
+    requests: int,
+    entity_ids: list[str],
+    seed: int,
+    samples: dict[str, dict[str, list[Any]]],
+) -> None:
+    """Send a random command mix over one connection."""
+    rng = random.Random(seed + client)
+    connection = FakeConnection(hass)
+    names = [name for name, _ in COMMAND_MIX]
+    weights = [weight for _, weight in COMMAND_MIX]
+
+    for _ in range(requests):
+        name = rng.choices(names, weights)[0]
+        command, fields = MESSAGES[name](rng, entity_ids)
+        start = time.perf_counter()
+        reply = await connection.async_call(command, **fields)
+        elapsed = (time.perf_counter() - start) * 1000
+
+        sample = samples.setdefault(name, {"latency": [], "bytes": [], "errors": []})
+        sample["latency"].append(elapsed)
+        sample["bytes"].append(len(json.dumps(reply, default=str)))
+        if not reply["success"]:
+            sample["errors"].append(reply["error"]["code"])
+
+    connection.async_close()
+
+
+async def async_run(
+    entities: int, fanout: int, clients: int, requests: int, seed: int
+) -> dict[str, Any]:
+    """Run the load test and return the report."""
+    hass = FakeHass()
+    samples: dict[str, dict[str, list[Any]]] = {}
+
+    with patch_hass(hass):
+        await async_configure(hass, entities, fanout, seed)
+        entity_ids = sorted(hass.entity_registry.entities)
+
+        start = time.perf_counter()
+        await asyncio.gather(
+            *(
+                _async_client(hass, client, requests, entity_ids, seed, samples)
+                for client in range(clients)
+            )
+        )
+        wall = time.perf_counter() - start
+
+        await async_unload_integration(hass)
+
+    commands = {}
+    for name, sample in sorted(samples.items()):
+        latency = sample["latency"]
+        commands[name] = {
+            "count": len(latency),
+            "errors": len(sample["errors"]),
+            "error_codes": sorted(set(sample["errors"])),
+            "mean_ms": round(statistics.fmean(latency), 3),
+            "p50_ms": round(_percentile(latency, 50), 3),
+            "p95_ms": round(_percentile(latency, 95), 3),
+            "p99_ms": round(_percentile(latency, 99), 3),
+            "max_ms": round(max(latency), 3),
+            "mean_bytes": round(statistics.fmean(sample["bytes"])),
+        }
+
+    total = sum(command["count"] for command in commands.values())
+    return {
+        "meta": {
+            "timestamp": datetime.now(UTC).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "entities": entities,
+            "fanout": fanout,
+            "clients": clients,
+            "requests_per_client": requests,
+            "seed": seed,
+        },
+        "total": {
+            "requests": total,
+            "errors": sum(command["errors"] for command in commands.values()),
+            "wall_s": round(wall, 3),
+            "requests_per_s": round(total / wall, 1) if wall else None,
+        },
+        "commands": commands,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Parse arguments, run the load test and write the JSON report."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--entities", type=int, default=10_000, help="entity count (default: %(default)s)")
+    parser.add_argument("--fanout", type=int, default=4, help="entities per device (default: %(default)s)")
+    parser.add_argument("--clients", type=int, default=8, help="concurrent connections (default: %(default)s)")
+    parser.add_argument("--requests", type=int, default=200, help="requests per client (default: %(default)s)")
+    parser.add_argument("--seed", type=int, default=0, help="random seed (default: %(default)s)")
+    parser.add_argument("--output", type=Path, help="write the JSON report here instead of stdout")
+    args = parser.parse_args(argv)
+
+    report = asyncio.run(
+        async_run(args.entities, args.fanout, args.clients, args.requests, args.seed)
+    )
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(output + "\n", encoding="utf-8")
+    else:
+        print(output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,282 @@
+"""Synthetic-registry benchmarks for Voice Assistant Manager.
+
+Builds synthetic entity, device and area registries against the in-memory
+``hass`` stand-in and times the hot paths of the integration:
+
+- YAMLGenerator.generate_google_yaml / generate_alexa_yaml
+- HomeKitManager.async_sync_from_voice_assistant_manager
+- api._get_entities_data (the get_state entity catalog)
+- storage save and load
+
+Results (wall time per run and tracemalloc peak) are printed as JSON.
+
+Usage (from the repository root, with ``homeassistant`` installed):
+
+    python -m benchmarks.run --sizes 1000,10000,50000 --fanout 4 --output results.json
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from benchmarks.fake_hass import (
+    FakeHass,
+    FakeStore,
+    add_homekit_bridge,
+    async_setup_integration,
+    async_unload_integration,
+    patch_hass,
+    populate_registries,
+)
+
+DEFAULT_SIZES = (1_000, 10_000, 50_000)
+
+Benchmark = Callable[[], Awaitable[Any]]
+
+
+async def async_configure(hass: FakeHass, size: int, fanout: int, seed: int) -> None:
+    """Populate the fake and set up and configure the integration on it.
+
+    Google uses exclude mode with a few excluded domains and entities,
+    Alexa include mode with domains plus entities, and HomeKit include
+    mode with about 100 entities and a few devices (within the bridge's
+    accessory limit). Must run inside ``patch_hass(hass)``.
+    """
+    from custom_components.voice_assistant_manager.const import DOMAIN, MODE_SEPARATE
+
+    rng = random.Random(seed)
+    populate_registries(hass, size, fanout=fanout, seed=seed)
+    bridge = add_homekit_bridge(hass)
+
+    FakeStore.clear()
+    await async_setup_integration(hass)
+    storage = hass.data[DOMAIN]["storage"]
+    await storage.async_set_mode(MODE_SEPARATE)
+
+    entity_ids = sorted(hass.entity_registry.entities)
+    device_ids = sorted(hass.device_registry.devices)
+    homekit_candidates = [
+        e for e in entity_ids if e.split(".")[0] in ("light", "switch", "cover", "lock")
+    ]
+
+    await storage.async_set_filter_config(
+        {
+            "filter_mode": "exclude",
+            "domains": ["update", "button"],
+            "entities": rng.sample(entity_ids, size // 50),
+            "devices": rng.sample(device_ids, min(len(device_ids), 20)),
+            "overrides": rng.sample(entity_ids, 10),
+        },
+        "google",
+    )
+    await storage.async_set_filter_config(
+        {
+            "filter_mode": "include",
+            "domains": ["light", "switch"],
+            "entities": rng.sample(entity_ids, size // 100),
+            "devices": [],
+            "overrides": [],
+        },
+        "alexa",
+    )
+    await storage.async_set_filter_config(
+        {
+            "filter_mode": "include",
+            "domains": [],
+            "entities": rng.sample(homekit_candidates, min(len(homekit_candidates), 100)),
+            "devices": rng.sample(device_ids, 3),
+            "overrides": [],
+        },
+        "homekit",
+    )
+    await storage.async_set_aliases_bulk(
+        {e: f"Alias {i}" for i, e in enumerate(rng.sample(entity_ids, size // 20))},
+        "google",
+    )
+    await storage.async_set_google_settings(
+        {
+            "enabled": True,
+            "project_id": "bench-project",
+            "service_account_path": "SERVICE_ACCOUNT.JSON",
+        }
+    )
+    await storage.async_set_alexa_settings(
+        {"enabled": True, "advanced_yaml": "locale: en-US\nendpoint: https://example.invalid"}
+    )
+    await storage.async_set_homekit_entry_id(bridge.entry_id)
+
+
+async def async_build_scenario(
+    hass: FakeHass, size: int, fanout: int, seed: int
+) -> dict[str, Any]:
+    """Configure the integration and return the objects the benchmarks use."""
+    from custom_components.voice_assistant_manager.const import DOMAIN
+    from custom_components.voice_assistant_manager.homekit_manager import HomeKitManager
+    from custom_components.voice_assistant_manager.yaml_generator import YAMLGenerator
+
+    await async_configure(hass, size, fanout, seed)
+    storage = hass.data[DOMAIN]["storage"]
+    registry_index = hass.data[DOMAIN]["registry_index"]
+
+    return {
+        "hass": hass,
+        "storage": storage,
+        "registry_index": registry_index,
+        "generator": YAMLGenerator(hass, storage),
+        "homekit": HomeKitManager(hass, storage, registry_index),
+    }
+
+
+def build_benchmarks(scenario: dict[str, Any]) -> dict[str, Benchmark]:
+    """Return the benchmarks for a scenario, by name."""
+    from custom_components.voice_assistant_manager.api import _get_entities_data
+    from custom_components.voice_assistant_manager.storage import (
+        VoiceAssistantManagerStorage,
+    )
+
+    hass = scenario["hass"]
+    storage = scenario["storage"]
+    generator = scenario["generator"]
+    homekit = scenario["homekit"]
+    registry_index = scenario["registry_index"]
+
+    async def google_yaml() -> Any:
+        return generator.generate_google_yaml()
+
+    async def alexa_yaml() -> Any:
+        return generator.generate_alexa_yaml()
+
+    async def homekit_sync() -> Any:
+        # A registry change invalidates the cached view, as in real use
+        registry_index.revision += 1
+        return await homekit.async_sync_from_voice_assistant_manager(force=True)
+
+    async def entities_data() -> Any:
+        return _get_entities_data(hass)
+
+    async def storage_save() -> Any:
+        return await storage.async_save()
+
+    async def storage_load() -> Any:
+        return await VoiceAssistantManagerStorage(hass).async_load()
+
+    return {
+        "google_yaml": google_yaml,
+        "alexa_yaml": alexa_yaml,
+        "homekit_sync": homekit_sync,
+        "entities_data": entities_data,
+        "storage_save": storage_save,
+        "storage_load": storage_load,
+    }
+
+
+async def async_measure(benchmark: Benchmark, repeat: int) -> dict[str, Any]:
+    """Time a benchmark and measure its peak allocation.
+
+    One warm-up run, ``repeat`` timed runs, then one run under tracemalloc
+    (kept separate because tracing slows everything down).
+    """
+    await benchmark()
+
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await benchmark()
+        timings.append((time.perf_counter() - start) * 1000)
+
+    tracemalloc.start()
+    try:
+        await benchmark()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "runs": repeat,
+        "min_ms": round(min(timings), 3),
+        "median_ms": round(statistics.median(timings), 3),
+        "max_ms": round(max(timings), 3),
+        "peak_kib": round(peak / 1024, 1),
+    }
+
+
+async def async_run(
+    sizes: list[int], fanout: int, repeat: int, seed: int, only: set[str] | None
+) -> dict[str, Any]:
+    """Run all benchmarks for all sizes and return the report."""
+    results = []
+    for size in sizes:
+        hass = FakeHass()
+        with patch_hass(hass):
+            start = time.perf_counter()
+            scenario = await async_build_scenario(hass, size, fanout, seed)
+            setup_ms = (time.perf_counter() - start) * 1000
+            for name, benchmark in build_benchmarks(scenario).items():
+                if only and name not in only:
+                    continue
+                measured = await async_measure(benchmark, repeat)
+                results.append({"entities": size, "benchmark": name, **measured})
+                print(
+                    f"{size:>7} {name:<15} median {measured['median_ms']:>10.3f} ms"
+                    f"  peak {measured['peak_kib']:>10.1f} KiB",
+                    file=sys.stderr,
+                )
+            scenario["homekit"].async_shutdown()
+            await async_unload_integration(hass)
+        results.append(
+            {"entities": size, "benchmark": "setup", "runs": 1, "min_ms": round(setup_ms, 3)}
+        )
+
+    return {
+        "meta": {
+            "timestamp": datetime.now(UTC).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "fanout": fanout,
+            "repeat": repeat,
+            "seed": seed,
+        },
+        "results": results,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Parse arguments, run the benchmarks and write the JSON report."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--sizes",
+        default=",".join(str(size) for size in DEFAULT_SIZES),
+        help="comma-separated entity counts (default: %(default)s)",
+    )
+    parser.add_argument("--fanout", type=int, default=4, help="entities per device (default: %(default)s)")
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs per benchmark (default: %(default)s)")
+    parser.add_argument("--seed", type=int, default=0, help="random seed (default: %(default)s)")
+    parser.add_argument("--only", help="comma-separated benchmark names to run")
+    parser.add_argument("--output", type=Path, help="write the JSON report here instead of stdout")
+    args = parser.parse_args(argv)
+
+    sizes = [int(size) for size in args.sizes.split(",") if size]
+    only = set(args.only.split(",")) if args.only else None
+    report = asyncio.run(async_run(sizes, args.fanout, args.repeat, args.seed, only))
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(output + "\n", encoding="utf-8")
+    else:
+        print(output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
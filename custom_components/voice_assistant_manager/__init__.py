@@ -7,7 +7,7 @@ from __future__ import annotations
 
 import logging
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.components import frontend
 from homeassistant.components.http import StaticPathConfig
@@ -18,11 +18,14 @@ from homeassistant.core import HomeAssistant
 from .api import async_register_websocket_api
 from .const import (
     DOMAIN,
+    LIVE_OPTIONS,
     PANEL_ICON,
     PANEL_NAME,
     PANEL_TITLE,
     VERSION,
 )
+from .homekit_drift import HomeKitDriftTracker
+from .registry_index import RegistryIndex
 from .storage import VoiceAssistantManagerStorage
 
 if TYPE_CHECKING:
@@ -62,12 +65,23 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     # Store entry reference
     hass.data[DOMAIN]["entry"] = entry
+    hass.data[DOMAIN]["reload_config"] = _reload_config(entry)
 
     # Initialize storage
     storage = VoiceAssistantManagerStorage(hass)
     await storage.async_load()
     hass.data[DOMAIN]["storage"] = storage
 
+    # Track registry changes so derived data can be cached per revision
+    registry_index = RegistryIndex(hass)
+    registry_index.async_setup()
+    hass.data[DOMAIN]["registry_index"] = registry_index
+
+    # Detect HomeKit bridge edits made outside Voice Assistant Manager
+    homekit_drift = HomeKitDriftTracker(hass, storage)
+    homekit_drift.async_setup()
+    hass.data[DOMAIN]["homekit_drift"] = homekit_drift
+
     # Register static path for frontend
     await _async_register_panel(hass)
 
@@ -101,8 +115,25 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     # Clean up data
     if DOMAIN in hass.data:
+        registry_index = hass.data[DOMAIN].pop("registry_index", None)
+        if registry_index is not None:
+            registry_index.async_unload()
+        homekit_drift = hass.data[DOMAIN].pop("homekit_drift", None)
+        if homekit_drift is not None:
+            homekit_drift.async_unload()
+        hass.data[DOMAIN].pop("state_cache", None)
+        hass.data[DOMAIN].pop("preview_cache", None)
+        hass.data[DOMAIN].pop("preview_tracker", None)
+        hass.data[DOMAIN].pop("metrics", None)
+        homekit_manager = hass.data[DOMAIN].pop("homekit_manager", None)
+        if homekit_manager is not None:
+            homekit_manager.async_shutdown()
+        bulk_sessions = hass.data[DOMAIN].pop("bulk_sessions", None)
+        if bulk_sessions is not None:
+            bulk_sessions.async_shutdown()
         hass.data[DOMAIN].pop("storage", None)
         hass.data[DOMAIN].pop("entry", None)
+        hass.data[DOMAIN].pop("reload_config", None)
 
     return True
 
@@ -110,13 +141,31 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 async def async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Handle options update.
 
+    The entry is reloaded unless only LIVE_OPTIONS changed: those are read
+    on every use, and a reload would needlessly re-register the panel and
+    drop the caches and registry listeners.
+
     Args:
         hass: Home Assistant instance.
         entry: Config entry with updated options.
     """
+    reload_config = _reload_config(entry)
+    if hass.data[DOMAIN].get("reload_config") == reload_config:
+        _LOGGER.debug("Only live options changed, not reloading")
+        return
     await hass.config_entries.async_reload(entry.entry_id)
 
 
+def _reload_config(entry: ConfigEntry) -> dict[str, Any]:
+    """Return the parts of an entry whose change requires a reload."""
+    return {
+        "data": dict(entry.data),
+        "options": {
+            key: value for key, value in entry.options.items() if key not in LIVE_OPTIONS
+        },
+    }
+
+
 async def _async_register_panel(hass: HomeAssistant) -> None:
     """Register the Voice Assistant Manager panel.
 
@@ -5,13 +5,14 @@ frontend panel to communicate with the backend.
 """
 from __future__ import annotations
 
+import asyncio
 import logging
 from datetime import datetime
 from typing import Any
 
 import voluptuous as vol
 from homeassistant.components import websocket_api
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import (
     area_registry as ar,
 )
@@ -21,25 +22,51 @@ from homeassistant.helpers import (
 from homeassistant.helpers import (
     entity_registry as er,
 )
+from homeassistant.helpers.json import json_bytes
 
+from .bulk_session import BulkSessionManager
 from .const import (
+    ALEXA_YAML_PATH,
     ASSISTANT_ALEXA,
     ASSISTANT_GOOGLE,
     ASSISTANT_HOMEKIT,
+    CONF_WRITE_FILES_SLOW_THRESHOLD,
+    DEFAULT_WRITE_FILES_SLOW_THRESHOLD,
     DOMAIN,
+    ENTITY_FORMAT_COMPACT,
+    ENTITY_FORMAT_FULL,
     FILTER_MODE_EXCLUDE,
     FILTER_MODE_INCLUDE,
+    GOOGLE_YAML_PATH,
+    HOMEKIT_SHARD_KEY_AREA,
+    HOMEKIT_SHARD_KEYS,
     HOMEKIT_SUPPORTED_DOMAINS,
+    MAX_BATCH_OPERATIONS,
     MAX_BULK_ENTITIES,
     MODE_LINKED,
     MODE_SEPARATE,
+    STORAGE_SCOPES,
 )
-from .exceptions import HomeKitError, ValidationError, VoiceManagerError
+from .exceptions import (
+    HomeKitDriftError,
+    HomeKitError,
+    RevisionConflictError,
+    ValidationError,
+    VoiceManagerError,
+)
+from .filter_optimizer import optimize_filter_config
+from .homekit_drift import HomeKitDriftTracker
 from .homekit_manager import HomeKitManager
+from .metrics import Trace, get_metrics, track_command, unwrap_connection
+from .preview_cache import PreviewCache, preview_cache_key
+from .preview_tracker import PreviewRequest, PreviewTracker
+from .registry_index import RegistryIndex
 from .validators import (
     validate_alexa_settings,
     validate_alias,
     validate_assistant,
+    validate_device_id,
+    validate_domain,
     validate_domains,
     validate_entity_id,
     validate_entity_ids,
@@ -52,6 +79,91 @@ from .yaml_generator import YAMLGenerator
 
 _LOGGER = logging.getLogger(__name__)
 
+ASSISTANT_SCHEMA = vol.In([ASSISTANT_GOOGLE, ASSISTANT_ALEXA, ASSISTANT_HOMEKIT])
+
+# Section revisions (scope -> revision) a mutating command is based on
+EXPECTED_REVISION_SCHEMA = {vol.In(STORAGE_SCOPES): int}
+
+BULK_ACTIONS = [
+    "exclude",
+    "unexclude",
+    "set_alias",
+    "clear_alias",
+    "exclude_domain",
+    "exclude_device",
+    "add_override",
+    "remove_override",
+]
+
+# save_all / save_delta message keys and the assistant they target
+FILTER_CONFIG_KEYS: dict[str, str | None] = {
+    "filter_config": None,
+    "google_filter_config": ASSISTANT_GOOGLE,
+    "alexa_filter_config": ASSISTANT_ALEXA,
+    "homekit_filter_config": ASSISTANT_HOMEKIT,
+}
+ALIAS_KEYS: dict[str, str | None] = {
+    "aliases": None,
+    "google_aliases": ASSISTANT_GOOGLE,
+    "alexa_aliases": ASSISTANT_ALEXA,
+}
+
+FILTER_LIST_VALIDATORS = {
+    "domains": validate_domain,
+    "entities": validate_entity_id,
+    "devices": validate_device_id,
+    "overrides": validate_entity_id,
+}
+
+# Delta schemas for save_delta
+LIST_DELTA_SCHEMA = {
+    vol.Optional("add"): [str],
+    vol.Optional("remove"): [str],
+}
+FILTER_DELTA_SCHEMA = {
+    vol.Optional("filter_mode"): vol.In([FILTER_MODE_EXCLUDE, FILTER_MODE_INCLUDE]),
+    vol.Optional("domains"): LIST_DELTA_SCHEMA,
+    vol.Optional("entities"): LIST_DELTA_SCHEMA,
+    vol.Optional("devices"): LIST_DELTA_SCHEMA,
+    vol.Optional("overrides"): LIST_DELTA_SCHEMA,
+}
+ALIAS_DELTA_SCHEMA = {
+    vol.Optional("set"): {str: str},
+    vol.Optional("delete"): [str],
+}
+
+# Per-operation schemas for the batch command
+BATCH_OPERATION_SCHEMAS: dict[str, vol.Schema] = {
+    "set_filter_mode": vol.Schema({
+        vol.Required("op"): "set_filter_mode",
+        vol.Required("filter_mode"): vol.In([FILTER_MODE_EXCLUDE, FILTER_MODE_INCLUDE]),
+        vol.Optional("assistant"): ASSISTANT_SCHEMA,
+    }),
+    "set_domains": vol.Schema({
+        vol.Required("op"): "set_domains",
+        vol.Required("domains"): [str],
+        vol.Optional("assistant"): ASSISTANT_SCHEMA,
+    }),
+    "toggle_override": vol.Schema({
+        vol.Required("op"): "toggle_override",
+        vol.Required("entity_id"): str,
+        vol.Optional("assistant"): ASSISTANT_SCHEMA,
+    }),
+    "set_alias": vol.Schema({
+        vol.Required("op"): "set_alias",
+        vol.Required("entity_id"): str,
+        vol.Required("alias"): str,
+        vol.Optional("assistant"): ASSISTANT_SCHEMA,
+    }),
+    "bulk_update": vol.Schema({
+        vol.Required("op"): "bulk_update",
+        vol.Required("action"): vol.In(BULK_ACTIONS),
+        vol.Required("entity_ids"): vol.All([str], vol.Length(max=MAX_BULK_ENTITIES)),
+        vol.Optional("value"): str,
+        vol.Optional("assistant"): ASSISTANT_SCHEMA,
+    }),
+}
+
 
 def async_register_websocket_api(hass: HomeAssistant) -> None:
     """Register all WebSocket API commands.
@@ -66,6 +178,7 @@ def async_register_websocket_api(hass: HomeAssistant) -> None:
     # Filter config endpoints
     websocket_api.async_register_command(hass, websocket_set_filter_mode)
     websocket_api.async_register_command(hass, websocket_set_filter_config)
+    websocket_api.async_register_command(hass, websocket_optimize_filter)
     websocket_api.async_register_command(hass, websocket_set_domains)
     websocket_api.async_register_command(hass, websocket_toggle_override)
 
@@ -73,9 +186,17 @@ def async_register_websocket_api(hass: HomeAssistant) -> None:
     websocket_api.async_register_command(hass, websocket_set_alias)
     websocket_api.async_register_command(hass, websocket_bulk_update)
 
+    # Batch endpoints
+    websocket_api.async_register_command(hass, websocket_batch)
+    websocket_api.async_register_command(hass, websocket_bulk_session_open)
+    websocket_api.async_register_command(hass, websocket_bulk_session_chunk)
+    websocket_api.async_register_command(hass, websocket_bulk_session_commit)
+    websocket_api.async_register_command(hass, websocket_bulk_session_abort)
+
     # Settings endpoints
     websocket_api.async_register_command(hass, websocket_set_settings)
     websocket_api.async_register_command(hass, websocket_save_all)
+    websocket_api.async_register_command(hass, websocket_save_delta)
 
     # YAML generation endpoints
     websocket_api.async_register_command(hass, websocket_preview_yaml)
@@ -84,7 +205,10 @@ def async_register_websocket_api(hass: HomeAssistant) -> None:
     # HomeKit endpoints
     websocket_api.async_register_command(hass, websocket_get_homekit_bridges)
     websocket_api.async_register_command(hass, websocket_set_homekit_bridge)
+    websocket_api.async_register_command(hass, websocket_set_homekit_sharding)
     websocket_api.async_register_command(hass, websocket_sync_homekit)
+    websocket_api.async_register_command(hass, websocket_plan_homekit)
+    websocket_api.async_register_command(hass, websocket_subscribe_homekit_drift)
     websocket_api.async_register_command(hass, websocket_import_homekit)
 
     # System endpoints
@@ -99,10 +223,40 @@ def _get_storage(hass: HomeAssistant):
     return hass.data[DOMAIN]["storage"]
 
 
+def _send_revision_conflict(
+    connection: websocket_api.ActiveConnection,
+    msg_id: int,
+    storage,
+    err: RevisionConflictError,
+) -> None:
+    """Reject a stale write with the current revisions and changed sections.
+
+    The result carries the content of the conflicting sections (keyed like
+    get_state), so the client can rebase without reloading everything.
+    """
+    connection.send_result(msg_id, {
+        "success": False,
+        "error": "revision_conflict",
+        "message": str(err),
+        "revision": err.revision,
+        "revisions": storage.revisions,
+        "conflicts": err.conflicts,
+        "delta": storage.get_sections(err.conflicts),
+    })
+
+
+def _get_registry_index(hass: HomeAssistant) -> RegistryIndex:
+    """Get the registry index instance."""
+    return hass.data[DOMAIN]["registry_index"]
+
+
 def _get_known_entity_ids(hass: HomeAssistant) -> set[str]:
-    """Return all entity IDs known to HA (registry + current states)."""
-    registry = er.async_get(hass)
-    return set(registry.entities) | set(hass.states.async_entity_ids())
+    """Return all entity IDs known to HA (registry + current states).
+
+    The set is maintained incrementally by the registry index and shared by
+    all pruning calls; it must not be modified.
+    """
+    return _get_registry_index(hass).known_entity_ids
 
 
 def _prune_filter_config(hass: HomeAssistant, config: dict) -> dict:
@@ -122,16 +276,354 @@ def _prune_aliases(hass: HomeAssistant, aliases: dict[str, str]) -> dict[str, st
     return {k: v for k, v in aliases.items() if k in known}
 
 
+def _build_bulk_operation(
+    hass: HomeAssistant,
+    action: str,
+    entity_ids: list[str],
+    value: str,
+    assistant: str | None,
+) -> dict[str, Any]:
+    """Build a storage bulk_update operation from validated input.
+
+    Device exclusions are resolved to device IDs here, since storage has
+    no access to the entity registry.
+
+    Raises:
+        ValidationError: If set_alias is requested without a value.
+    """
+    operation: dict[str, Any] = {
+        "op": "bulk_update",
+        "action": action,
+        "entity_ids": entity_ids,
+        "value": value,
+        "assistant": assistant,
+    }
+
+    if action == "set_alias" and not value:
+        raise ValidationError("Alias value is required")
+
+    if action == "exclude_device":
+        ent_reg = er.async_get(hass)
+        devices = set()
+        for entity_id in entity_ids:
+            entity = ent_reg.async_get(entity_id)
+            if entity and entity.device_id:
+                devices.add(entity.device_id)
+        operation["device_ids"] = sorted(devices)
+
+    return operation
+
+
+def _validate_batch_operation(
+    hass: HomeAssistant, operation: dict[str, Any]
+) -> dict[str, Any]:
+    """Validate one batch operation and normalize it for storage.
+
+    Raises:
+        ValidationError: If the operation is unknown or invalid.
+    """
+    op = operation.get("op")
+    schema = BATCH_OPERATION_SCHEMAS.get(op)
+    if schema is None:
+        raise ValidationError(f"Unknown operation: {op}")
+
+    try:
+        operation = schema(operation)
+    except vol.Invalid as err:
+        raise ValidationError(str(err)) from err
+
+    assistant = validate_assistant(operation.get("assistant"))
+
+    if op == "set_filter_mode":
+        return {
+            "op": op,
+            "filter_mode": validate_filter_mode(operation["filter_mode"]),
+            "assistant": assistant,
+        }
+
+    if op == "set_domains":
+        return {
+            "op": op,
+            "domains": validate_domains(operation["domains"]),
+            "assistant": assistant,
+        }
+
+    if op == "toggle_override":
+        return {
+            "op": op,
+            "entity_id": validate_entity_id(operation["entity_id"]),
+            "assistant": assistant,
+        }
+
+    if op == "set_alias":
+        return {
+            "op": op,
+            "entity_id": validate_entity_id(operation["entity_id"]),
+            "alias": validate_alias(operation["alias"]),
+            "assistant": assistant,
+        }
+
+    return _build_bulk_operation(
+        hass,
+        operation["action"],
+        validate_entity_ids(operation["entity_ids"]),
+        validate_alias(operation.get("value", "")),
+        assistant,
+    )
+
+
+def _validate_filter_delta(
+    hass: HomeAssistant, changes: dict[str, Any]
+) -> dict[str, Any]:
+    """Validate a filter config delta, touching only the changed items.
+
+    Added entity IDs that no longer exist in HA are dropped, mirroring the
+    pruning done by save_all.
+
+    Raises:
+        ValidationError: If any changed item is invalid.
+    """
+    validated: dict[str, Any] = {}
+    if "filter_mode" in changes:
+        validated["filter_mode"] = validate_filter_mode(changes["filter_mode"])
+
+    for list_key, validator in FILTER_LIST_VALIDATORS.items():
+        if list_key not in changes:
+            continue
+        add = [validator(value) for value in changes[list_key].get("add", [])]
+        remove = [validator(value) for value in changes[list_key].get("remove", [])]
+        if add and list_key in ("entities", "overrides"):
+            known = _get_known_entity_ids(hass)
+            add = [entity_id for entity_id in add if entity_id in known]
+        validated[list_key] = {"add": add, "remove": remove}
+
+    return validated
+
+
+def _validate_alias_delta(
+    hass: HomeAssistant, changes: dict[str, Any]
+) -> dict[str, Any]:
+    """Validate an alias delta, touching only the changed keys.
+
+    Setting an empty alias deletes it. Aliases for entity IDs that no longer
+    exist in HA are dropped.
+
+    Raises:
+        ValidationError: If any changed item is invalid.
+    """
+    to_set: dict[str, str] = {}
+    to_delete = [validate_entity_id(entity_id) for entity_id in changes.get("delete", [])]
+
+    for entity_id, alias in changes.get("set", {}).items():
+        validated_entity_id = validate_entity_id(entity_id)
+        validated_alias = validate_alias(alias)
+        if validated_alias:
+            to_set[validated_entity_id] = validated_alias
+        else:
+            to_delete.append(validated_entity_id)
+
+    return {
+        "set": _prune_aliases(hass, to_set) if to_set else {},
+        "delete": to_delete,
+    }
+
+
+def _build_preview_overlay(
+    hass: HomeAssistant, storage, msg: dict[str, Any]
+) -> dict[str, Any]:
+    """Validate the pending config sent with a preview into a storage overlay.
+
+    Filter configs and aliases are keyed by the storage section they target
+    (following the current mode, like save_all). Settings are merged over
+    the stored ones.
+
+    Raises:
+        ValidationError: If any pending value is invalid.
+    """
+    overlay: dict[str, Any] = {}
+
+    for key, assistant in FILTER_CONFIG_KEYS.items():
+        if key in msg:
+            overlay[storage.section_key("filter_config", assistant)] = _prune_filter_config(
+                hass, validate_filter_config(msg[key])
+            )
+
+    for key, assistant in ALIAS_KEYS.items():
+        if key in msg:
+            aliases = {}
+            for entity_id, alias in msg[key].items():
+                validated_alias = validate_alias(alias)
+                if validated_alias:
+                    aliases[validate_entity_id(entity_id)] = validated_alias
+            overlay[storage.section_key("aliases", assistant)] = _prune_aliases(hass, aliases)
+
+    if "google_settings" in msg:
+        overlay["google_settings"] = {
+            **storage.get_google_settings(),
+            **validate_google_settings(msg["google_settings"]),
+        }
+    if "alexa_settings" in msg:
+        overlay["alexa_settings"] = {
+            **storage.get_alexa_settings(),
+            **validate_alexa_settings(msg["alexa_settings"]),
+        }
+
+    return overlay
+
+
+def _get_preview_cache(hass: HomeAssistant) -> PreviewCache:
+    """Get or create the preview result cache."""
+    if "preview_cache" not in hass.data[DOMAIN]:
+        hass.data[DOMAIN]["preview_cache"] = PreviewCache()
+    return hass.data[DOMAIN]["preview_cache"]
+
+
+def _get_preview_tracker(hass: HomeAssistant) -> PreviewTracker:
+    """Get or create the preview request tracker."""
+    if "preview_tracker" not in hass.data[DOMAIN]:
+        hass.data[DOMAIN]["preview_tracker"] = PreviewTracker()
+    return hass.data[DOMAIN]["preview_tracker"]
+
+
+async def _async_render_preview(
+    hass: HomeAssistant,
+    generator: YAMLGenerator,
+    assistant: str,
+    request: PreviewRequest,
+) -> tuple[str, list[str]] | None:
+    """Render a preview for an assistant, reusing a cached result if possible.
+
+    The configuration is built on the event loop (it reads the registries);
+    only the YAML dump runs in the executor, where a newer preview can
+    cancel it.
+
+    Args:
+        hass: Home Assistant instance.
+        generator: Generator holding the effective (pending) config.
+        assistant: The assistant type.
+        request: The in-flight preview request.
+
+    Returns:
+        Tuple of (yaml_content, warnings), or None if the request was
+        superseded.
+    """
+    cache = _get_preview_cache(hass)
+    key = preview_cache_key(
+        assistant,
+        _get_registry_index(hass).revision,
+        generator.get_preview_inputs(assistant),
+    )
+
+    cached = cache.get(key)
+    if cached is not None:
+        return cached
+
+    if request.superseded:
+        return None
+
+    if assistant == ASSISTANT_GOOGLE:
+        config, warnings = generator.build_google_config()
+    else:
+        config, warnings = generator.build_alexa_config()
+
+    yaml_content = ""
+    if config is not None:
+        request.future = hass.async_add_executor_job(generator.render_yaml, config)
+        try:
+            yaml_content = await request.future
+        except asyncio.CancelledError:
+            if request.superseded:
+                return None
+            raise
+        finally:
+            request.future = None
+
+    cache.put(key, yaml_content, warnings)
+    return yaml_content, warnings
+
+
+async def _async_diff_preview(
+    hass: HomeAssistant,
+    generator: YAMLGenerator,
+    relative_path: str,
+    yaml_content: str,
+    request: PreviewRequest,
+) -> dict[str, Any] | None:
+    """Diff a rendered preview against the generated file on disk.
+
+    Args:
+        hass: Home Assistant instance.
+        generator: Generator that rendered the preview.
+        relative_path: Generated file path relative to the config dir.
+        yaml_content: Rendered YAML content.
+        request: The in-flight preview request.
+
+    Returns:
+        Dict with diff, exists, added_entities and removed_entities (diff
+        is None if nothing would be written), or None if the request was
+        superseded.
+    """
+    if not yaml_content:
+        return {"diff": None, "exists": None, "added_entities": 0, "removed_entities": 0}
+
+    if request.superseded:
+        return None
+
+    request.future = hass.async_add_executor_job(
+        generator.diff_with_file, relative_path, yaml_content
+    )
+    try:
+        return await request.future
+    except asyncio.CancelledError:
+        if request.superseded:
+            return None
+        raise
+    finally:
+        request.future = None
+
+
+def _get_homekit_drift(hass: HomeAssistant) -> HomeKitDriftTracker:
+    """Get the HomeKit drift tracker instance."""
+    return hass.data[DOMAIN]["homekit_drift"]
+
+
+def _send_homekit_drift(
+    connection: websocket_api.ActiveConnection,
+    msg_id: int,
+    err: HomeKitDriftError,
+) -> None:
+    """Answer a refused HomeKit sync with the detected drift."""
+    connection.send_result(
+        msg_id,
+        {
+            "success": False,
+            "error": "homekit_drift",
+            "message": str(err),
+            "drift": err.drift,
+        },
+    )
+
+
 def _get_homekit_manager(hass: HomeAssistant) -> HomeKitManager:
     """Get or create the HomeKit manager instance."""
     if "homekit_manager" not in hass.data[DOMAIN]:
         storage = _get_storage(hass)
-        hass.data[DOMAIN]["homekit_manager"] = HomeKitManager(hass, storage)
+        hass.data[DOMAIN]["homekit_manager"] = HomeKitManager(
+            hass, storage, _get_registry_index(hass)
+        )
     return hass.data[DOMAIN]["homekit_manager"]
 
 
+def _get_bulk_session_manager(hass: HomeAssistant) -> BulkSessionManager:
+    """Get or create the bulk session manager instance."""
+    if "bulk_sessions" not in hass.data[DOMAIN]:
+        hass.data[DOMAIN]["bulk_sessions"] = BulkSessionManager(hass)
+    return hass.data[DOMAIN]["bulk_sessions"]
+
+
 def _get_entities_data(hass: HomeAssistant) -> list[dict[str, Any]]:
     """Get all entities with their device and area information."""
+    get_metrics(hass).record_registry_scan("entities")
     ent_reg = er.async_get(hass)
     dev_reg = dr.async_get(hass)
     area_reg = ar.async_get(hass)
@@ -183,8 +675,67 @@ def _get_entities_data(hass: HomeAssistant) -> list[dict[str, Any]]:
     return entities
 
 
+def _get_entities_columnar(entities: list[dict[str, Any]]) -> dict[str, Any]:
+    """Convert the entity list to the compact columnar wire format.
+
+    Instead of one dict per entity repeating every key name and the full
+    device and area names, entity fields are sent as parallel arrays.
+    Domain, device and area are integer indexes into de-duplicated tables
+    (-1 when the entity has no device or area).
+
+    Args:
+        entities: Entity dicts as returned by _get_entities_data.
+
+    Returns:
+        Columnar entity catalog.
+    """
+    domains: dict[str, int] = {}
+    devices: dict[str, int] = {}
+    areas: dict[str, int] = {}
+    device_names: list[str | None] = []
+    area_names: list[str | None] = []
+
+    domain_index: list[int] = []
+    device_index: list[int] = []
+    area_index: list[int] = []
+
+    for entity in entities:
+        domain_index.append(domains.setdefault(entity["domain"], len(domains)))
+
+        device_id = entity["device_id"]
+        if device_id is None:
+            device_index.append(-1)
+        else:
+            if device_id not in devices:
+                devices[device_id] = len(devices)
+                device_names.append(entity["device_name"])
+            device_index.append(devices[device_id])
+
+        area_id = entity["area_id"]
+        if area_id is None:
+            area_index.append(-1)
+        else:
+            if area_id not in areas:
+                areas[area_id] = len(areas)
+                area_names.append(entity["area_name"])
+            area_index.append(areas[area_id])
+
+    return {
+        "entity_id": [entity["entity_id"] for entity in entities],
+        "name": [entity["name"] for entity in entities],
+        "platform": [entity["platform"] for entity in entities],
+        "domain": domain_index,
+        "device": device_index,
+        "area": area_index,
+        "domains": list(domains),
+        "devices": {"id": list(devices), "name": device_names},
+        "areas": {"id": list(areas), "name": area_names},
+    }
+
+
 def _get_devices_data(hass: HomeAssistant) -> list[dict[str, Any]]:
     """Get all devices."""
+    get_metrics(hass).record_registry_scan("devices")
     dev_reg = dr.async_get(hass)
     area_reg = ar.async_get(hass)
 
@@ -224,6 +775,7 @@ def _get_areas_data(hass: HomeAssistant) -> list[dict[str, Any]]:
 
 def _get_domains(hass: HomeAssistant) -> list[str]:
     """Get all unique domains from entities."""
+    get_metrics(hass).record_registry_scan("domains")
     ent_reg = er.async_get(hass)
     domains = set()
     for entity in ent_reg.entities.values():
@@ -233,36 +785,118 @@ def _get_domains(hass: HomeAssistant) -> list[str]:
     return sorted(domains)
 
 
+async def _async_build_state_payload(hass: HomeAssistant, entity_format: str) -> bytes:
+    """Build the get_state result and serialize it to JSON bytes."""
+    storage = _get_storage(hass)
+    hk_manager = _get_homekit_manager(hass)
+
+    state = storage.get_full_state()
+    entities = _get_entities_data(hass)
+    if entity_format == ENTITY_FORMAT_COMPACT:
+        state["entities"] = _get_entities_columnar(entities)
+    else:
+        state["entities"] = entities
+    state["entity_format"] = entity_format
+
+    # Yield between the registry walks so the loop stays responsive on large
+    # installs; get_state requests arriving meanwhile join this build
+    await asyncio.sleep(0)
+
+    state["devices"] = _get_devices_data(hass)
+    state["areas"] = _get_areas_data(hass)
+    state["domains"] = _get_domains(hass)
+
+    # Add HomeKit bridges info; the reload state is not tied to a revision,
+    # so it is only served by get_homekit_bridges
+    state["homekit_bridges"] = hk_manager.get_homekit_bridges(with_reload=False)
+    state["homekit_supported_domains"] = sorted(HOMEKIT_SUPPORTED_DOMAINS)
+    state["homekit_accessories"] = hk_manager.estimate_accessories()
+    state["homekit_drift"] = _get_homekit_drift(hass).async_get_drift()
+
+    return json_bytes(state)
+
+
+async def _async_get_state_payload(
+    hass: HomeAssistant, entity_format: str = ENTITY_FORMAT_FULL
+) -> bytes:
+    """Return the serialized get_state result for the current revision.
+
+    Payloads are cached per (storage revision, registry revision) and entity
+    format. Concurrent requests for the same key share a single in-flight
+    build (single-flight) instead of each rebuilding and re-encoding the
+    state.
+
+    Args:
+        hass: Home Assistant instance.
+        entity_format: Entity catalog wire format ('full' or 'compact').
+
+    Returns:
+        The JSON-encoded state.
+    """
+    cache: dict[str, Any] = hass.data[DOMAIN].setdefault("state_cache", {})
+    formats: dict[str, Any] = cache.setdefault(entity_format, {})
+    key = (_get_storage(hass).revision, _get_registry_index(hass).revision)
+
+    cached = formats.get("payload")
+    if cached is not None and cached[0] == key:
+        get_metrics(hass).record_cache("state", True)
+        return cached[1]
+
+    inflight = formats.get("inflight")
+    # Joining an in-flight build counts as a hit: nothing is rebuilt
+    get_metrics(hass).record_cache(
+        "state", inflight is not None and inflight[0] == key
+    )
+    if inflight is None or inflight[0] != key:
+        task = hass.async_create_task(
+            _async_build_state_payload(hass, entity_format),
+            "voice_assistant_manager_get_state",
+        )
+        inflight = (key, task)
+        formats["inflight"] = inflight
+
+        @callback
+        def _async_store_payload(done: asyncio.Task[bytes]) -> None:
+            """Cache the payload once the shared build finishes."""
+            if formats.get("inflight") is inflight:
+                formats.pop("inflight")
+            if not done.cancelled() and done.exception() is None:
+                formats["payload"] = (key, done.result())
+
+        task.add_done_callback(_async_store_payload)
+
+    # Shield so a cancelled caller does not cancel the build for the others
+    return await asyncio.shield(inflight[1])
+
+
 # ============ Core Endpoints ============
 
 @websocket_api.require_admin
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "voice_assistant_manager/get_state",
+        # Opt-in columnar entity catalog (much smaller on large installs)
+        vol.Optional("format", default=ENTITY_FORMAT_FULL): vol.In(
+            [ENTITY_FORMAT_FULL, ENTITY_FORMAT_COMPACT]
+        ),
     }
 )
 @websocket_api.async_response
+@track_command
 async def websocket_get_state(
     hass: HomeAssistant,
     connection: websocket_api.ActiveConnection,
     msg: dict[str, Any],
 ) -> None:
-    """Get full state including entities, devices, areas, and settings."""
-    try:
-        storage = _get_storage(hass)
-        hk_manager = _get_homekit_manager(hass)
+    """Get full state including entities, devices, areas, and settings.
 
-        state = storage.get_full_state()
-        state["entities"] = _get_entities_data(hass)
-        state["devices"] = _get_devices_data(hass)
-        state["areas"] = _get_areas_data(hass)
-        state["domains"] = _get_domains(hass)
-
-        # Add HomeKit bridges info
-        state["homekit_bridges"] = hk_manager.get_homekit_bridges()
-        state["homekit_supported_domains"] = sorted(HOMEKIT_SUPPORTED_DOMAINS)
-
-        connection.send_result(msg["id"], state)
+    The result is sent pre-serialized from the per-revision cache.
+    """
+    try:
+        payload = await _async_get_state_payload(hass, msg["format"])
+        connection.send_message(
+            websocket_api.messages.construct_result_message(msg["id"], payload)
+        )
     except Exception as err:
         _LOGGER.error("Failed to get state: %s", err)
         connection.send_error(msg["id"], "state_error", str(err))
@@ -272,10 +906,12 @@ async def websocket_get_state(
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "voice_assistant_manager/set_mode",
+        vol.Optional("expected_revision"): EXPECTED_REVISION_SCHEMA,
         vol.Required("mode"): vol.In([MODE_LINKED, MODE_SEPARATE]),
     }
 )
 @websocket_api.async_response
+@track_command
 async def websocket_set_mode(
     hass: HomeAssistant,
     connection: websocket_api.ActiveConnection,
@@ -285,8 +921,10 @@ async def websocket_set_mode(
     try:
         validated_mode = validate_mode(msg["mode"])
         storage = _get_storage(hass)
-        await storage.async_set_mode(validated_mode)
+        await storage.async_set_mode(validated_mode, msg.get("expected_revision"))
         connection.send_result(msg["id"], {"success": True, "mode": validated_mode})
+    except RevisionConflictError as err:
+        _send_revision_conflict(connection, msg["id"], _get_storage(hass), err)
     except ValidationError as err:
         connection.send_error(msg["id"], "validation_error", str(err))
     except Exception as err:
@@ -300,11 +938,13 @@ async def websocket_set_mode(
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "voice_assistant_manager/set_filter_mode",
+        vol.Optional("expected_revision"): EXPECTED_REVISION_SCHEMA,
         vol.Required("filter_mode"): vol.In([FILTER_MODE_EXCLUDE, FILTER_MODE_INCLUDE]),
         vol.Optional("assistant"): vol.In([ASSISTANT_GOOGLE, ASSISTANT_ALEXA, ASSISTANT_HOMEKIT]),
     }
 )
 @websocket_api.async_response
+@track_command
 async def websocket_set_filter_mode(
     hass: HomeAssistant,
     connection: websocket_api.ActiveConnection,
@@ -316,9 +956,14 @@ async def websocket_set_filter_mode(
         assistant = validate_assistant(msg.get("assistant"))
 
         storage = _get_storage(hass)
-        await storage.async_set_filter_mode(filter_mode, assistant)
+        async with storage.async_lock(
+            assistant, expected_revisions=msg.get("expected_revision")
+        ):
+            await storage.async_set_filter_mode(filter_mode, assistant)
 
         connection.send_result(msg["id"], {"success": True, "filter_mode": filter_mode})
+    except RevisionConflictError as err:
+        _send_revision_conflict(connection, msg["id"], _get_storage(hass), err)
     except ValidationError as err:
         connection.send_error(msg["id"], "validation_error", str(err))
     except Exception as err:
@@ -330,6 +975,7 @@ async def websocket_set_filter_mode(
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "voice_assistant_manager/set_filter_config",
+        vol.Optional("expected_revision"): EXPECTED_REVISION_SCHEMA,
         vol.Required("filter_config"): {
             vol.Optional("filter_mode"): vol.In([FILTER_MODE_EXCLUDE, FILTER_MODE_INCLUDE]),
             vol.Optional("domains"): [str],
@@ -341,6 +987,7 @@ async def websocket_set_filter_mode(
     }
 )
 @websocket_api.async_response
+@track_command
 async def websocket_set_filter_config(
     hass: HomeAssistant,
     connection: websocket_api.ActiveConnection,
@@ -351,22 +998,27 @@ async def websocket_set_filter_config(
         assistant = validate_assistant(msg.get("assistant"))
         storage = _get_storage(hass)
 
-        # Get current config and merge with new values
-        current = storage.get_filter_config(assistant)
-        new_config = msg["filter_config"]
-
-        merged = {
-            "filter_mode": new_config.get("filter_mode", current.get("filter_mode", FILTER_MODE_EXCLUDE)),
-            "domains": new_config.get("domains", current.get("domains", [])),
-            "entities": new_config.get("entities", current.get("entities", [])),
-            "devices": new_config.get("devices", current.get("devices", [])),
-            "overrides": new_config.get("overrides", current.get("overrides", [])),
-        }
+        async with storage.async_lock(
+            assistant, expected_revisions=msg.get("expected_revision")
+        ):
+            # Get current config and merge with new values
+            current = storage.get_filter_config(assistant)
+            new_config = msg["filter_config"]
+
+            merged = {
+                "filter_mode": new_config.get("filter_mode", current.get("filter_mode", FILTER_MODE_EXCLUDE)),
+                "domains": new_config.get("domains", current.get("domains", [])),
+                "entities": new_config.get("entities", current.get("entities", [])),
+                "devices": new_config.get("devices", current.get("devices", [])),
+                "overrides": new_config.get("overrides", current.get("overrides", [])),
+            }
 
-        validated_config = validate_filter_config(merged)
-        await storage.async_set_filter_config(validated_config, assistant)
+            validated_config = validate_filter_config(merged)
+            await storage.async_set_filter_config(validated_config, assistant)
 
         connection.send_result(msg["id"], {"success": True, "filter_config": validated_config})
+    except RevisionConflictError as err:
+        _send_revision_conflict(connection, msg["id"], _get_storage(hass), err)
     except ValidationError as err:
         connection.send_error(msg["id"], "validation_error", str(err))
     except Exception as err:
@@ -374,15 +1026,66 @@ async def websocket_set_filter_config(
         connection.send_error(msg["id"], "filter_config_error", str(err))
 
 
+@websocket_api.require_admin
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "voice_assistant_manager/optimize_filter",
+        vol.Optional("expected_revision"): EXPECTED_REVISION_SCHEMA,
+        vol.Optional("assistant"): vol.In([ASSISTANT_GOOGLE, ASSISTANT_ALEXA, ASSISTANT_HOMEKIT]),
+        # False: only report the compacted config (dry run)
+        vol.Optional("apply", default=False): bool,
+    }
+)
+@websocket_api.async_response
+@track_command
+async def websocket_optimize_filter(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Compact a filter config into fewer rules with identical exposure."""
+    storage = _get_storage(hass)
+    try:
+        assistant = validate_assistant(msg.get("assistant"))
+        view = _get_registry_index(hass).async_get_view()
+
+        if not msg["apply"]:
+            result = optimize_filter_config(view, storage.get_filter_config(assistant))
+            connection.send_result(msg["id"], {**result, "applied": False})
+            return
+
+        async with storage.async_lock(
+            assistant, expected_revisions=msg.get("expected_revision")
+        ):
+            result = optimize_filter_config(view, storage.get_filter_config(assistant))
+            if result["changed"]:
+                validated_config = validate_filter_config(result["filter_config"])
+                await storage.async_set_filter_config(validated_config, assistant)
+
+        connection.send_result(
+            msg["id"],
+            {**result, "applied": result["changed"], "revisions": storage.revisions},
+        )
+    except RevisionConflictError as err:
+        _send_revision_conflict(connection, msg["id"], storage, err)
+    except ValidationError as err:
+        connection.send_error(msg["id"], "validation_error", str(err))
+    except Exception as err:
+        _LOGGER.error("Failed to optimize filter config: %s", err)
+        connection.send_error(msg["id"], "filter_config_error", str(err))
+
+
 @websocket_api.require_admin
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "voice_assistant_manager/set_domains",
+        vol.Optional("expected_revision"): EXPECTED_REVISION_SCHEMA,
         vol.Required("domains"): [str],
         vol.Optional("assistant"): vol.In([ASSISTANT_GOOGLE, ASSISTANT_ALEXA, ASSISTANT_HOMEKIT]),
     }
 )
 @websocket_api.async_response
+@track_command
 async def websocket_set_domains(
     hass: HomeAssistant,
     connection: websocket_api.ActiveConnection,
@@ -394,9 +1097,14 @@ async def websocket_set_domains(
         assistant = validate_assistant(msg.get("assistant"))
 
         storage = _get_storage(hass)
-        await storage.async_set_domains(domains, assistant)
+        async with storage.async_lock(
+            assistant, expected_revisions=msg.get("expected_revision")
+        ):
+            await storage.async_set_domains(domains, assistant)
 
         connection.send_result(msg["id"], {"success": True, "domains": domains})
+    except RevisionConflictError as err:
+        _send_revision_conflict(connection, msg["id"], _get_storage(hass), err)
     except ValidationError as err:
         connection.send_error(msg["id"], "validation_error", str(err))
     except Exception as err:
@@ -408,11 +1116,13 @@ async def websocket_set_domains(
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "voice_assistant_manager/toggle_override",
+        vol.Optional("expected_revision"): EXPECTED_REVISION_SCHEMA,
         vol.Required("entity_id"): str,
         vol.Optional("assistant"): vol.In([ASSISTANT_GOOGLE, ASSISTANT_ALEXA, ASSISTANT_HOMEKIT]),
     }
 )
 @websocket_api.async_response
+@track_command
 async def websocket_toggle_override(
     hass: HomeAssistant,
     connection: websocket_api.ActiveConnection,
@@ -424,13 +1134,18 @@ async def websocket_toggle_override(
         assistant = validate_assistant(msg.get("assistant"))
 
         storage = _get_storage(hass)
-        added = await storage.async_toggle_override(entity_id, assistant)
+        async with storage.async_lock(
+            assistant, expected_revisions=msg.get("expected_revision")
+        ):
+            added = await storage.async_toggle_override(entity_id, assistant)
 
         connection.send_result(msg["id"], {
             "success": True,
             "entity_id": entity_id,
             "added": added,
         })
+    except RevisionConflictError as err:
+        _send_revision_conflict(connection, msg["id"], _get_storage(hass), err)
     except ValidationError as err:
         connection.send_error(msg["id"], "validation_error", str(err))
     except Exception as err:
@@ -444,12 +1159,14 @@ async def websocket_toggle_override(
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "voice_assistant_manager/set_alias",
+        vol.Optional("expected_revision"): EXPECTED_REVISION_SCHEMA,
         vol.Required("entity_id"): str,
         vol.Required("alias"): str,
         vol.Optional("assistant"): vol.In([ASSISTANT_GOOGLE, ASSISTANT_ALEXA, ASSISTANT_HOMEKIT]),
     }
 )
 @websocket_api.async_response
+@track_command
 async def websocket_set_alias(
     hass: HomeAssistant,
     connection: websocket_api.ActiveConnection,
@@ -462,12 +1179,17 @@ async def websocket_set_alias(
         validated_assistant = validate_assistant(msg.get("assistant"))
 
         storage = _get_storage(hass)
-        await storage.async_set_alias(
-            validated_entity_id,
-            validated_alias,
-            validated_assistant,
-        )
+        async with storage.async_lock(
+            validated_assistant, expected_revisions=msg.get("expected_revision")
+        ):
+            await storage.async_set_alias(
+                validated_entity_id,
+                validated_alias,
+                validated_assistant,
+            )
         connection.send_result(msg["id"], {"success": True})
+    except RevisionConflictError as err:
+        _send_revision_conflict(connection, msg["id"], _get_storage(hass), err)
     except ValidationError as err:
         connection.send_error(msg["id"], "validation_error", str(err))
     except Exception as err:
@@ -479,24 +1201,15 @@ async def websocket_set_alias(
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "voice_assistant_manager/bulk_update",
-        vol.Required("action"): vol.In(
-            [
-                "exclude",
-                "unexclude",
-                "set_alias",
-                "clear_alias",
-                "exclude_domain",
-                "exclude_device",
-                "add_override",
-                "remove_override",
-            ]
-        ),
+        vol.Optional("expected_revision"): EXPECTED_REVISION_SCHEMA,
+        vol.Required("action"): vol.In(BULK_ACTIONS),
         vol.Required("entity_ids"): vol.All([str], vol.Length(max=MAX_BULK_ENTITIES)),
         vol.Optional("value"): str,
         vol.Optional("assistant"): vol.In([ASSISTANT_GOOGLE, ASSISTANT_ALEXA, ASSISTANT_HOMEKIT]),
     }
 )
 @websocket_api.async_response
+@track_command
 async def websocket_bulk_update(
     hass: HomeAssistant,
     connection: websocket_api.ActiveConnection,
@@ -504,79 +1217,21 @@ async def websocket_bulk_update(
 ) -> None:
     """Perform bulk operations on entities."""
     try:
-        action = msg["action"]
-        entity_ids = validate_entity_ids(msg["entity_ids"])
-        value = validate_alias(msg.get("value", ""))
-        assistant = validate_assistant(msg.get("assistant"))
+        operation = _build_bulk_operation(
+            hass,
+            msg["action"],
+            validate_entity_ids(msg["entity_ids"]),
+            validate_alias(msg.get("value", "")),
+            validate_assistant(msg.get("assistant")),
+        )
 
         storage = _get_storage(hass)
-        config = storage.get_filter_config(assistant)
-
-        if action == "exclude":
-            # Add entities to exclusion list
-            current_entities = set(config.get("entities", []))
-            current_entities.update(entity_ids)
-            config["entities"] = list(current_entities)
-            await storage.async_set_filter_config(config, assistant)
-
-        elif action == "unexclude":
-            # Remove entities from exclusion list
-            current_entities = set(config.get("entities", []))
-            current_entities -= set(entity_ids)
-            config["entities"] = list(current_entities)
-            await storage.async_set_filter_config(config, assistant)
-
-        elif action == "add_override":
-            # Add entities to overrides list
-            current_overrides = set(config.get("overrides", []))
-            current_overrides.update(entity_ids)
-            config["overrides"] = list(current_overrides)
-            await storage.async_set_filter_config(config, assistant)
-
-        elif action == "remove_override":
-            # Remove entities from overrides list
-            current_overrides = set(config.get("overrides", []))
-            current_overrides -= set(entity_ids)
-            config["overrides"] = list(current_overrides)
-            await storage.async_set_filter_config(config, assistant)
-
-        elif action == "set_alias":
-            # Set the same alias for all selected entities
-            if not value or not value.strip():
-                raise ValidationError("Alias value is required")
-            new_aliases = {entity_id: value.strip() for entity_id in entity_ids}
-            await storage.async_set_aliases_bulk(new_aliases, assistant)
-
-        elif action == "clear_alias":
-            new_aliases = dict.fromkeys(entity_ids, "")
-            await storage.async_set_aliases_bulk(new_aliases, assistant)
-
-        elif action == "exclude_domain":
-            domains = set()
-            for entity_id in entity_ids:
-                domain = entity_id.split(".")[0]
-                domains.add(domain)
-
-            current_domains = set(config.get("domains", []))
-            current_domains.update(domains)
-            config["domains"] = list(current_domains)
-            await storage.async_set_filter_config(config, assistant)
-
-        elif action == "exclude_device":
-            ent_reg = er.async_get(hass)
-            devices = set()
-            for entity_id in entity_ids:
-                entity = ent_reg.async_get(entity_id)
-                if entity and entity.device_id:
-                    devices.add(entity.device_id)
-
-            current_devices = set(config.get("devices", []))
-            current_devices.update(devices)
-            config["devices"] = list(current_devices)
-            await storage.async_set_filter_config(config, assistant)
+        await storage.async_apply_batch([operation], msg.get("expected_revision"))
 
         connection.send_result(msg["id"], {"success": True})
 
+    except RevisionConflictError as err:
+        _send_revision_conflict(connection, msg["id"], _get_storage(hass), err)
     except ValidationError as err:
         connection.send_error(msg["id"], "validation_error", str(err))
     except Exception as err:
@@ -584,17 +1239,214 @@ async def websocket_bulk_update(
         connection.send_error(msg["id"], "bulk_update_error", str(err))
 
 
+@websocket_api.require_admin
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "voice_assistant_manager/batch",
+        vol.Optional("expected_revision"): EXPECTED_REVISION_SCHEMA,
+        vol.Required("operations"): vol.All(
+            [dict], vol.Length(min=1, max=MAX_BATCH_OPERATIONS)
+        ),
+    }
+)
+@websocket_api.async_response
+@track_command
+async def websocket_batch(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Apply an ordered list of operations atomically with a single save.
+
+    Each operation has an "op" key (set_filter_mode, set_domains,
+    toggle_override, set_alias or bulk_update) plus the fields of the
+    matching single-purpose command. All operations are validated before
+    anything is applied; if any of them fails, nothing is changed.
+    """
+    try:
+        operations = []
+        for index, operation in enumerate(msg["operations"]):
+            try:
+                operations.append(_validate_batch_operation(hass, operation))
+            except ValidationError as err:
+                raise ValidationError(f"Operation {index}: {err}") from err
+
+        storage = _get_storage(hass)
+        results = await storage.async_apply_batch(
+            operations, msg.get("expected_revision")
+        )
+
+        connection.send_result(msg["id"], {"success": True, "results": results})
+
+    except RevisionConflictError as err:
+        _send_revision_conflict(connection, msg["id"], _get_storage(hass), err)
+    except ValidationError as err:
+        connection.send_error(msg["id"], "validation_error", str(err))
+    except Exception as err:
+        _LOGGER.error("Failed to apply batch: %s", err)
+        connection.send_error(msg["id"], "batch_error", str(err))
+
+
+@websocket_api.require_admin
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "voice_assistant_manager/bulk_session/open",
+        vol.Required("action"): vol.In(BULK_ACTIONS),
+        vol.Optional("value"): str,
+        vol.Optional("assistant"): ASSISTANT_SCHEMA,
+    }
+)
+@websocket_api.async_response
+@track_command
+async def websocket_bulk_session_open(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Open a chunked bulk session for more than MAX_BULK_ENTITIES entities."""
+    try:
+        value = validate_alias(msg.get("value", ""))
+        if msg["action"] == "set_alias" and not value:
+            raise ValidationError("Alias value is required")
+
+        session = _get_bulk_session_manager(hass).async_open(
+            connection.user.id,
+            msg["action"],
+            value,
+            validate_assistant(msg.get("assistant")),
+        )
+        connection.send_result(msg["id"], {
+            "success": True,
+            "session_id": session.session_id,
+            "max_chunk_size": MAX_BULK_ENTITIES,
+        })
+    except ValidationError as err:
+        connection.send_error(msg["id"], "validation_error", str(err))
+    except Exception as err:
+        _LOGGER.error("Failed to open bulk session: %s", err)
+        connection.send_error(msg["id"], "bulk_session_error", str(err))
+
+
+@websocket_api.require_admin
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "voice_assistant_manager/bulk_session/chunk",
+        vol.Required("session_id"): str,
+        vol.Required("entity_ids"): vol.All([str], vol.Length(max=MAX_BULK_ENTITIES)),
+    }
+)
+@websocket_api.async_response
+@track_command
+async def websocket_bulk_session_chunk(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Validate a chunk of entity IDs and add it to a bulk session."""
+    try:
+        manager = _get_bulk_session_manager(hass)
+        session = manager.async_get(msg["session_id"], connection.user.id)
+        result = manager.async_add_chunk(session, msg["entity_ids"])
+        connection.send_result(msg["id"], {"success": True, **result})
+    except ValidationError as err:
+        connection.send_error(msg["id"], "validation_error", str(err))
+    except Exception as err:
+        _LOGGER.error("Failed to add bulk session chunk: %s", err)
+        connection.send_error(msg["id"], "bulk_session_error", str(err))
+
+
+@websocket_api.require_admin
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "voice_assistant_manager/bulk_session/commit",
+        vol.Optional("expected_revision"): EXPECTED_REVISION_SCHEMA,
+        vol.Required("session_id"): str,
+    }
+)
+@websocket_api.async_response
+@track_command
+async def websocket_bulk_session_commit(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Apply all chunks of a bulk session atomically with a single save."""
+    try:
+        manager = _get_bulk_session_manager(hass)
+        session = manager.async_get(msg["session_id"], connection.user.id)
+        # Block a second commit while this one runs; the session is only
+        # released once applied, so a failed commit can be retried
+        manager.async_begin_commit(session)
+        committed = False
+        try:
+            operation = _build_bulk_operation(
+                hass,
+                session.action,
+                list(session.entity_ids),
+                session.value,
+                session.assistant,
+            )
+            storage = _get_storage(hass)
+            await storage.async_apply_batch([operation], msg.get("expected_revision"))
+            committed = True
+        finally:
+            manager.async_end_commit(session, committed)
+
+        connection.send_result(msg["id"], {
+            "success": True,
+            "count": len(session.entity_ids),
+            "chunks": session.chunks,
+            "rejected": session.rejected,
+        })
+    except RevisionConflictError as err:
+        _send_revision_conflict(connection, msg["id"], _get_storage(hass), err)
+    except ValidationError as err:
+        connection.send_error(msg["id"], "validation_error", str(err))
+    except Exception as err:
+        _LOGGER.error("Failed to commit bulk session: %s", err)
+        connection.send_error(msg["id"], "bulk_session_error", str(err))
+
+
+@websocket_api.require_admin
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "voice_assistant_manager/bulk_session/abort",
+        vol.Required("session_id"): str,
+    }
+)
+@websocket_api.async_response
+@track_command
+async def websocket_bulk_session_abort(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Discard a bulk session without applying it."""
+    try:
+        manager = _get_bulk_session_manager(hass)
+        session = manager.async_get(msg["session_id"], connection.user.id)
+        manager.async_abort(session)
+        connection.send_result(msg["id"], {"success": True})
+    except ValidationError as err:
+        connection.send_error(msg["id"], "validation_error", str(err))
+    except Exception as err:
+        _LOGGER.error("Failed to abort bulk session: %s", err)
+        connection.send_error(msg["id"], "bulk_session_error", str(err))
+
+
 # ============ Settings Endpoints ============
 
 @websocket_api.require_admin
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "voice_assistant_manager/set_settings",
+        vol.Optional("expected_revision"): EXPECTED_REVISION_SCHEMA,
         vol.Required("assistant"): vol.In([ASSISTANT_GOOGLE, ASSISTANT_ALEXA]),
         vol.Required("settings"): dict,
     }
 )
 @websocket_api.async_response
+@track_command
 async def websocket_set_settings(
     hass: HomeAssistant,
     connection: websocket_api.ActiveConnection,
@@ -605,15 +1457,20 @@ async def websocket_set_settings(
         storage = _get_storage(hass)
         assistant = msg["assistant"]
 
-        if assistant == ASSISTANT_GOOGLE:
-            validated_settings = validate_google_settings(msg["settings"])
-            await storage.async_set_google_settings(validated_settings)
-        else:
-            validated_settings = validate_alexa_settings(msg["settings"])
-            await storage.async_set_alexa_settings(validated_settings)
+        async with storage.async_lock(
+            settings=True, expected_revisions=msg.get("expected_revision")
+        ):
+            if assistant == ASSISTANT_GOOGLE:
+                validated_settings = validate_google_settings(msg["settings"])
+                await storage.async_set_google_settings(validated_settings)
+            else:
+                validated_settings = validate_alexa_settings(msg["settings"])
+                await storage.async_set_alexa_settings(validated_settings)
 
         connection.send_result(msg["id"], {"success": True})
 
+    except RevisionConflictError as err:
+        _send_revision_conflict(connection, msg["id"], _get_storage(hass), err)
     except ValidationError as err:
         connection.send_error(msg["id"], "validation_error", str(err))
     except Exception as err:
@@ -625,6 +1482,7 @@ async def websocket_set_settings(
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "voice_assistant_manager/save_all",
+        vol.Optional("expected_revision"): EXPECTED_REVISION_SCHEMA,
         vol.Optional("filter_config"): {
             vol.Optional("filter_mode"): vol.In([FILTER_MODE_EXCLUDE, FILTER_MODE_INCLUDE]),
             vol.Optional("domains"): [str],
@@ -662,6 +1520,7 @@ async def websocket_set_settings(
     }
 )
 @websocket_api.async_response
+@track_command
 async def websocket_save_all(
     hass: HomeAssistant,
     connection: websocket_api.ActiveConnection,
@@ -671,67 +1530,85 @@ async def websocket_save_all(
     try:
         storage = _get_storage(hass)
 
-        # Save filter configs (prune entity IDs that no longer exist in HA)
-        if "filter_config" in msg:
-            validated_config = _prune_filter_config(hass, validate_filter_config(msg["filter_config"]))
-            await storage.async_set_filter_config(validated_config, None)
-
-        if "google_filter_config" in msg:
-            validated_config = _prune_filter_config(hass, validate_filter_config(msg["google_filter_config"]))
-            await storage.async_set_filter_config(validated_config, ASSISTANT_GOOGLE)
-
-        if "alexa_filter_config" in msg:
-            validated_config = _prune_filter_config(hass, validate_filter_config(msg["alexa_filter_config"]))
-            await storage.async_set_filter_config(validated_config, ASSISTANT_ALEXA)
-
-        if "homekit_filter_config" in msg:
-            validated_config = _prune_filter_config(hass, validate_filter_config(msg["homekit_filter_config"]))
-            await storage.async_set_filter_config(validated_config, ASSISTANT_HOMEKIT)
-
-        # Save aliases - use replace semantics so deleted aliases are actually removed
-        # Also prune aliases for entities that no longer exist
-        if "aliases" in msg:
-            validated = _prune_aliases(hass, {
-                validate_entity_id(k): validate_alias(v)
-                for k, v in msg["aliases"].items()
-            })
-            await storage.async_replace_aliases(validated, None)
-
-        if "google_aliases" in msg:
-            validated = _prune_aliases(hass, {
-                validate_entity_id(k): validate_alias(v)
-                for k, v in msg["google_aliases"].items()
-            })
-            await storage.async_replace_aliases(validated, ASSISTANT_GOOGLE)
-
-        if "alexa_aliases" in msg:
-            validated = _prune_aliases(hass, {
-                validate_entity_id(k): validate_alias(v)
-                for k, v in msg["alexa_aliases"].items()
-            })
-            await storage.async_replace_aliases(validated, ASSISTANT_ALEXA)
-
-        # Save settings
-        if "google_settings" in msg:
-            validated_settings = validate_google_settings(msg["google_settings"])
-            await storage.async_set_google_settings(validated_settings)
-
-        if "alexa_settings" in msg:
-            validated_settings = validate_alexa_settings(msg["alexa_settings"])
-            await storage.async_set_alexa_settings(validated_settings)
-
-        # Save HomeKit bridge
-        if "homekit_entry_id" in msg:
-            entry_id = msg["homekit_entry_id"]
-            if entry_id is not None:
-                hk_manager = _get_homekit_manager(hass)
-                bridge = hk_manager.get_bridge_config(entry_id)
-                if bridge is None:
-                    raise HomeKitError(f"HomeKit bridge not found: {entry_id}")
-            await storage.async_set_homekit_entry_id(entry_id)
+        # Hold every touched scope for the whole save so concurrent edits
+        # cannot interleave between its steps
+        assistants = [
+            assistant
+            for key, assistant in (*FILTER_CONFIG_KEYS.items(), *ALIAS_KEYS.items())
+            if key in msg
+        ]
+        settings = any(
+            key in msg for key in ("google_settings", "alexa_settings", "homekit_entry_id")
+        )
+        async with storage.async_lock(
+            *assistants,
+            settings=settings,
+            expected_revisions=msg.get("expected_revision"),
+        ):
+            # Save filter configs (prune entity IDs that no longer exist in HA)
+            if "filter_config" in msg:
+                validated_config = _prune_filter_config(hass, validate_filter_config(msg["filter_config"]))
+                await storage.async_set_filter_config(validated_config, None)
 
-        connection.send_result(msg["id"], {"success": True})
+            if "google_filter_config" in msg:
+                validated_config = _prune_filter_config(hass, validate_filter_config(msg["google_filter_config"]))
+                await storage.async_set_filter_config(validated_config, ASSISTANT_GOOGLE)
+
+            if "alexa_filter_config" in msg:
+                validated_config = _prune_filter_config(hass, validate_filter_config(msg["alexa_filter_config"]))
+                await storage.async_set_filter_config(validated_config, ASSISTANT_ALEXA)
 
+            if "homekit_filter_config" in msg:
+                validated_config = _prune_filter_config(hass, validate_filter_config(msg["homekit_filter_config"]))
+                await storage.async_set_filter_config(validated_config, ASSISTANT_HOMEKIT)
+
+            # Save aliases - use replace semantics so deleted aliases are actually removed
+            # Also prune aliases for entities that no longer exist
+            if "aliases" in msg:
+                validated = _prune_aliases(hass, {
+                    validate_entity_id(k): validate_alias(v)
+                    for k, v in msg["aliases"].items()
+                })
+                await storage.async_replace_aliases(validated, None)
+
+            if "google_aliases" in msg:
+                validated = _prune_aliases(hass, {
+                    validate_entity_id(k): validate_alias(v)
+                    for k, v in msg["google_aliases"].items()
+                })
+                await storage.async_replace_aliases(validated, ASSISTANT_GOOGLE)
+
+            if "alexa_aliases" in msg:
+                validated = _prune_aliases(hass, {
+                    validate_entity_id(k): validate_alias(v)
+                    for k, v in msg["alexa_aliases"].items()
+                })
+                await storage.async_replace_aliases(validated, ASSISTANT_ALEXA)
+
+            # Save settings
+            if "google_settings" in msg:
+                validated_settings = validate_google_settings(msg["google_settings"])
+                await storage.async_set_google_settings(validated_settings)
+
+            if "alexa_settings" in msg:
+                validated_settings = validate_alexa_settings(msg["alexa_settings"])
+                await storage.async_set_alexa_settings(validated_settings)
+
+            # Save HomeKit bridge
+            if "homekit_entry_id" in msg:
+                entry_id = msg["homekit_entry_id"]
+                if entry_id is not None:
+                    hk_manager = _get_homekit_manager(hass)
+                    bridge = hk_manager.get_bridge_config(entry_id)
+                    if bridge is None:
+                        raise HomeKitError(f"HomeKit bridge not found: {entry_id}")
+                await storage.async_set_homekit_entry_id(entry_id)
+
+        _get_homekit_drift(hass).async_refresh()
+        connection.send_result(msg["id"], {"success": True, "revisions": storage.revisions})
+
+    except RevisionConflictError as err:
+        _send_revision_conflict(connection, msg["id"], _get_storage(hass), err)
     except ValidationError as err:
         connection.send_error(msg["id"], "validation_error", str(err))
     except HomeKitError as err:
@@ -741,6 +1618,67 @@ async def websocket_save_all(
         connection.send_error(msg["id"], "save_all_error", str(err))
 
 
+@websocket_api.require_admin
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "voice_assistant_manager/save_delta",
+        vol.Optional("expected_revision"): EXPECTED_REVISION_SCHEMA,
+        vol.Optional("base_revision"): int,
+        vol.Optional("filter_config"): FILTER_DELTA_SCHEMA,
+        vol.Optional("google_filter_config"): FILTER_DELTA_SCHEMA,
+        vol.Optional("alexa_filter_config"): FILTER_DELTA_SCHEMA,
+        vol.Optional("homekit_filter_config"): FILTER_DELTA_SCHEMA,
+        vol.Optional("aliases"): ALIAS_DELTA_SCHEMA,
+        vol.Optional("google_aliases"): ALIAS_DELTA_SCHEMA,
+        vol.Optional("alexa_aliases"): ALIAS_DELTA_SCHEMA,
+    }
+)
+@websocket_api.async_response
+@track_command
+async def websocket_save_delta(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Save incremental changes instead of full filter configs and alias maps.
+
+    Filter lists take add/remove operations and alias maps take set/delete
+    operations. Only the changed items are validated and pruned. The save is
+    rejected if any content was edited since base_revision (the revision
+    returned by get_state), or if a section listed in expected_revision
+    changed.
+    """
+    storage = _get_storage(hass)
+    try:
+        delta: dict[str, Any] = {"filter_configs": {}, "aliases": {}}
+
+        for key, assistant in FILTER_CONFIG_KEYS.items():
+            if key in msg:
+                delta["filter_configs"][assistant] = _validate_filter_delta(hass, msg[key])
+
+        for key, assistant in ALIAS_KEYS.items():
+            if key in msg:
+                delta["aliases"][assistant] = _validate_alias_delta(hass, msg[key])
+
+        await storage.async_apply_delta(
+            delta, msg.get("base_revision"), msg.get("expected_revision")
+        )
+
+        connection.send_result(msg["id"], {
+            "success": True,
+            "revision": storage.content_revision,
+            "revisions": storage.revisions,
+        })
+
+    except RevisionConflictError as err:
+        _send_revision_conflict(connection, msg["id"], storage, err)
+    except ValidationError as err:
+        connection.send_error(msg["id"], "validation_error", str(err))
+    except Exception as err:
+        _LOGGER.error("Failed to save delta: %s", err)
+        connection.send_error(msg["id"], "save_delta_error", str(err))
+
+
 # ============ YAML Generation Endpoints ============
 
 @websocket_api.require_admin
@@ -748,6 +1686,8 @@ async def websocket_save_all(
     {
         vol.Required("type"): "voice_assistant_manager/preview_yaml",
         vol.Optional("assistant"): vol.In([ASSISTANT_GOOGLE, ASSISTANT_ALEXA]),
+        # Return a unified diff against the file on disk instead of the YAML
+        vol.Optional("diff", default=False): bool,
         # Optional pending config - same shape as save_all.
         # If provided, YAML is generated from this data without touching storage.
         vol.Optional("filter_config"): {
@@ -779,6 +1719,7 @@ async def websocket_save_all(
     }
 )
 @websocket_api.async_response
+@track_command
 async def websocket_preview_yaml(
     hass: HomeAssistant,
     connection: websocket_api.ActiveConnection,
@@ -787,102 +1728,118 @@ async def websocket_preview_yaml(
     """Preview generated YAML without writing to files.
 
     If pending config fields are included in the message, YAML is generated
-    from those values without persisting anything to storage.
+    from those values layered over a read-only snapshot of storage; live
+    storage is never modified.
+
+    With diff=True each assistant gets a unified diff against its generated
+    file on disk plus added/removed entity counts instead of the full YAML.
+
+    A newer preview for the same assistant on the same connection supersedes
+    this one: its pending executor work is cancelled and it answers with
+    {"superseded": True}.
     """
-    import copy
+    assistant = msg.get("assistant")
+    tracker = _get_preview_tracker(hass)
+    # Key on the socket itself, not on the per-command metrics wrapper
+    socket = unwrap_connection(connection)
+    request = tracker.start(socket, assistant)
 
     try:
         storage = _get_storage(hass)
-        generator = YAMLGenerator(hass, storage)
+        overlay = _build_preview_overlay(hass, storage, msg)
+        generator = YAMLGenerator(hass, storage, overlay)
 
-        # Check if the frontend sent pending (unsaved) config for preview
-        preview_keys = {
-            "filter_config", "google_filter_config", "alexa_filter_config",
-            "aliases", "google_aliases", "alexa_aliases",
-            "google_settings", "alexa_settings",
-        }
-        has_pending = any(k in msg for k in preview_keys)
+        targets = (
+            (ASSISTANT_GOOGLE, GOOGLE_YAML_PATH, generator.is_google_complete),
+            (ASSISTANT_ALEXA, ALEXA_YAML_PATH, generator.is_alexa_complete),
+        )
+        result = {}
 
-        original_data = None
-        if has_pending:
-            # Temporarily apply pending config in-memory; never written to disk
-            original_data = copy.deepcopy(storage._data)
-            if "filter_config" in msg:
-                storage._data["filter_config"] = _prune_filter_config(hass, validate_filter_config(msg["filter_config"]))
-            if "google_filter_config" in msg:
-                storage._data["google_filter_config"] = _prune_filter_config(hass, validate_filter_config(msg["google_filter_config"]))
-            if "alexa_filter_config" in msg:
-                storage._data["alexa_filter_config"] = _prune_filter_config(hass, validate_filter_config(msg["alexa_filter_config"]))
-            if "aliases" in msg:
-                storage._data["aliases"] = _prune_aliases(hass, {
-                    validate_entity_id(k): validate_alias(v)
-                    for k, v in msg["aliases"].items()
-                    if validate_alias(v)
-                })
-            if "google_aliases" in msg:
-                storage._data["google_aliases"] = _prune_aliases(hass, {
-                    validate_entity_id(k): validate_alias(v)
-                    for k, v in msg["google_aliases"].items()
-                    if validate_alias(v)
-                })
-            if "alexa_aliases" in msg:
-                storage._data["alexa_aliases"] = _prune_aliases(hass, {
-                    validate_entity_id(k): validate_alias(v)
-                    for k, v in msg["alexa_aliases"].items()
-                    if validate_alias(v)
-                })
-            if "google_settings" in msg:
-                storage._data["google_settings"] = validate_google_settings(msg["google_settings"])
-            if "alexa_settings" in msg:
-                storage._data["alexa_settings"] = validate_alexa_settings(msg["alexa_settings"])
+        for target, relative_path, is_complete in targets:
+            if assistant is not None and assistant != target:
+                continue
 
-        try:
-            assistant = msg.get("assistant")
-            result = {}
-
-            if assistant is None or assistant == ASSISTANT_GOOGLE:
-                google_yaml, google_warnings = generator.generate_google_yaml()
-                result["google"] = {
-                    "yaml": google_yaml,
-                    "warnings": google_warnings,
-                    "complete": storage.is_google_complete(),
-                }
-
-            if assistant is None or assistant == ASSISTANT_ALEXA:
-                alexa_yaml, alexa_warnings = generator.generate_alexa_yaml()
-                result["alexa"] = {
-                    "yaml": alexa_yaml,
-                    "warnings": alexa_warnings,
-                    "complete": storage.is_alexa_complete(),
-                }
-
-            connection.send_result(msg["id"], result)
-        finally:
-            # Always restore original storage data after temporary override
-            if original_data is not None:
-                storage._data = original_data
+            rendered = await _async_render_preview(hass, generator, target, request)
+            if rendered is None:
+                connection.send_result(msg["id"], {"superseded": True})
+                return
+            yaml_content, warnings = rendered
+
+            preview: dict[str, Any] = {
+                "warnings": warnings,
+                "complete": is_complete(),
+            }
+            if msg["diff"]:
+                diff = await _async_diff_preview(
+                    hass, generator, relative_path, yaml_content, request
+                )
+                if diff is None:
+                    connection.send_result(msg["id"], {"superseded": True})
+                    return
+                preview.update(diff)
+            else:
+                preview["yaml"] = yaml_content
+            result[target] = preview
+
+        connection.send_result(msg["id"], result)
 
     except Exception as err:
         _LOGGER.error("Failed to preview YAML: %s", err)
         connection.send_error(msg["id"], "preview_error", str(err))
+    finally:
+        tracker.finish(socket, assistant, request)
+
+
+def _log_slow_write_files(hass: HomeAssistant, trace: Trace) -> None:
+    """Log the stage timings of a write_files run above the slow threshold."""
+    entry = hass.data[DOMAIN].get("entry")
+    threshold = (
+        entry.options.get(CONF_WRITE_FILES_SLOW_THRESHOLD, DEFAULT_WRITE_FILES_SLOW_THRESHOLD)
+        if entry is not None
+        else DEFAULT_WRITE_FILES_SLOW_THRESHOLD
+    )
+    if not threshold or trace.total < threshold:
+        return
+
+    timings = trace.as_dict()
+    _LOGGER.warning(
+        "write_files took %.0f ms (slow threshold %.0f ms): %s",
+        timings["total_ms"],
+        threshold * 1000,
+        ", ".join(
+            f"{name} {duration:.0f} ms"
+            for name, duration in sorted(
+                timings["spans_ms"].items(), key=lambda item: -item[1]
+            )
+        ),
+    )
 
 
 @websocket_api.require_admin
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "voice_assistant_manager/write_files",
+        # Overwrite HomeKit bridges edited outside Voice Assistant Manager
+        vol.Optional("force_homekit", default=False): bool,
     }
 )
 @websocket_api.async_response
+@track_command
 async def websocket_write_files(
     hass: HomeAssistant,
     connection: websocket_api.ActiveConnection,
     msg: dict[str, Any],
 ) -> None:
-    """Write YAML files and sync HomeKit."""
+    """Write YAML files and sync HomeKit.
+
+    Every stage is timed; the breakdown is returned as "timings" and logged
+    when the run exceeds the configured slow threshold.
+    """
     try:
+        trace = Trace()
         storage = _get_storage(hass)
-        generator = YAMLGenerator(hass, storage)
+        with trace.span("snapshot"):
+            generator = YAMLGenerator(hass, storage)
 
         result = {
             "google": {"written": False, "error": None},
@@ -891,12 +1848,14 @@ async def websocket_write_files(
         }
 
         timestamp = datetime.now().isoformat()
+        # Timestamps of everything written, saved together at the end
+        generated: list[str] = []
 
         # Write Google YAML if complete
         if storage.is_google_complete():
             try:
-                await generator.async_write_google_yaml()
-                await storage.async_set_last_generated(ASSISTANT_GOOGLE, timestamp)
+                await generator.async_write_google_yaml(trace)
+                generated.append(ASSISTANT_GOOGLE)
                 result["google"]["written"] = True
                 _LOGGER.info("Google Assistant YAML written successfully")
             except VoiceManagerError as err:
@@ -911,8 +1870,8 @@ async def websocket_write_files(
         # Write Alexa YAML if complete
         if storage.is_alexa_complete():
             try:
-                await generator.async_write_alexa_yaml()
-                await storage.async_set_last_generated(ASSISTANT_ALEXA, timestamp)
+                await generator.async_write_alexa_yaml(trace)
+                generated.append(ASSISTANT_ALEXA)
                 result["alexa"]["written"] = True
                 _LOGGER.info("Alexa YAML written successfully")
             except VoiceManagerError as err:
@@ -928,10 +1887,17 @@ async def websocket_write_files(
         if storage.is_homekit_complete():
             try:
                 hk_manager = _get_homekit_manager(hass)
-                await hk_manager.async_sync_from_voice_assistant_manager()
-                await storage.async_set_last_generated(ASSISTANT_HOMEKIT, timestamp)
+                sync_result = await hk_manager.async_sync_from_voice_assistant_manager(
+                    force=msg["force_homekit"], trace=trace
+                )
+                generated.append(ASSISTANT_HOMEKIT)
                 result["homekit"]["written"] = True
+                result["homekit"]["changed"] = sync_result["changed"]
                 _LOGGER.info("HomeKit synced successfully")
+            except HomeKitDriftError as err:
+                _LOGGER.warning("HomeKit sync skipped: %s", err)
+                result["homekit"]["error"] = str(err)
+                result["homekit"]["drift"] = err.drift
             except HomeKitError as err:
                 _LOGGER.error("Failed to sync HomeKit: %s", err)
                 result["homekit"]["error"] = str(err)
@@ -941,6 +1907,12 @@ async def websocket_write_files(
         else:
             result["homekit"]["error"] = "No HomeKit bridge configured"
 
+        with trace.span("storage_save"):
+            await storage.async_set_last_generated_bulk(generated, timestamp)
+
+        result["timings"] = trace.as_dict()
+        _log_slow_write_files(hass, trace)
+
         connection.send_result(msg["id"], result)
 
     except Exception as err:
@@ -957,6 +1929,7 @@ async def websocket_write_files(
     }
 )
 @websocket_api.async_response
+@track_command
 async def websocket_get_homekit_bridges(
     hass: HomeAssistant,
     connection: websocket_api.ActiveConnection,
@@ -976,10 +1949,12 @@ async def websocket_get_homekit_bridges(
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "voice_assistant_manager/set_homekit_bridge",
+        vol.Optional("expected_revision"): EXPECTED_REVISION_SCHEMA,
         vol.Required("entry_id"): vol.Any(str, None),
     }
 )
 @websocket_api.async_response
+@track_command
 async def websocket_set_homekit_bridge(
     hass: HomeAssistant,
     connection: websocket_api.ActiveConnection,
@@ -997,8 +1972,14 @@ async def websocket_set_homekit_bridge(
             if bridge is None:
                 raise HomeKitError(f"HomeKit bridge not found: {entry_id}")
 
-        await storage.async_set_homekit_entry_id(entry_id)
+        async with storage.async_lock(
+            settings=True, expected_revisions=msg.get("expected_revision")
+        ):
+            await storage.async_set_homekit_entry_id(entry_id)
+        _get_homekit_drift(hass).async_refresh()
         connection.send_result(msg["id"], {"success": True, "entry_id": entry_id})
+    except RevisionConflictError as err:
+        _send_revision_conflict(connection, msg["id"], _get_storage(hass), err)
     except HomeKitError as err:
         connection.send_error(msg["id"], "homekit_error", str(err))
     except Exception as err:
@@ -1006,13 +1987,78 @@ async def websocket_set_homekit_bridge(
         connection.send_error(msg["id"], "homekit_error", str(err))
 
 
+@websocket_api.require_admin
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "voice_assistant_manager/set_homekit_sharding",
+        vol.Optional("expected_revision"): EXPECTED_REVISION_SCHEMA,
+        vol.Required("enabled"): bool,
+        vol.Optional("entry_ids", default=[]): [str],
+        vol.Optional("key", default=HOMEKIT_SHARD_KEY_AREA): vol.In(HOMEKIT_SHARD_KEYS),
+        vol.Optional("reset_assignments", default=False): bool,
+    }
+)
+@websocket_api.async_response
+@track_command
+async def websocket_set_homekit_sharding(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Configure sharding of HomeKit entities across several bridges.
+
+    Existing shard assignments are kept (so entities stay on their bridge)
+    unless the shard key changes or reset_assignments is set.
+    """
+    storage = _get_storage(hass)
+    try:
+        entry_ids = list(dict.fromkeys(msg["entry_ids"]))
+        if msg["enabled"] and not entry_ids:
+            raise HomeKitError("Sharding needs at least one HomeKit bridge")
+
+        hk_manager = _get_homekit_manager(hass)
+        for entry_id in entry_ids:
+            if hk_manager.get_bridge_config(entry_id) is None:
+                raise HomeKitError(f"HomeKit bridge not found: {entry_id}")
+
+        async with storage.async_lock(
+            settings=True, expected_revisions=msg.get("expected_revision")
+        ):
+            current = storage.get_homekit_sharding()
+            assignments = current.get("assignments", {})
+            if msg["reset_assignments"] or current.get("key") != msg["key"]:
+                assignments = {}
+            sharding = {
+                "enabled": msg["enabled"],
+                "entry_ids": entry_ids,
+                "key": msg["key"],
+                "assignments": assignments,
+            }
+            await storage.async_set_homekit_sharding(sharding)
+        _get_homekit_drift(hass).async_refresh()
+        connection.send_result(
+            msg["id"],
+            {"success": True, "sharding": sharding, "revisions": storage.revisions},
+        )
+    except RevisionConflictError as err:
+        _send_revision_conflict(connection, msg["id"], storage, err)
+    except HomeKitError as err:
+        connection.send_error(msg["id"], "homekit_error", str(err))
+    except Exception as err:
+        _LOGGER.error("Failed to set HomeKit sharding: %s", err)
+        connection.send_error(msg["id"], "homekit_error", str(err))
+
+
 @websocket_api.require_admin
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "voice_assistant_manager/sync_homekit",
+        # Overwrite bridges edited outside Voice Assistant Manager
+        vol.Optional("force", default=False): bool,
     }
 )
 @websocket_api.async_response
+@track_command
 async def websocket_sync_homekit(
     hass: HomeAssistant,
     connection: websocket_api.ActiveConnection,
@@ -1021,13 +2067,17 @@ async def websocket_sync_homekit(
     """Sync Voice Assistant Manager configuration to HomeKit bridge."""
     try:
         hk_manager = _get_homekit_manager(hass)
-        result = await hk_manager.async_sync_from_voice_assistant_manager()
+        result = await hk_manager.async_sync_from_voice_assistant_manager(
+            force=msg["force"]
+        )
 
         # Update timestamp
         storage = _get_storage(hass)
         await storage.async_set_last_generated(ASSISTANT_HOMEKIT, datetime.now().isoformat())
 
         connection.send_result(msg["id"], result)
+    except HomeKitDriftError as err:
+        _send_homekit_drift(connection, msg["id"], err)
     except HomeKitError as err:
         connection.send_error(msg["id"], "homekit_error", str(err))
     except Exception as err:
@@ -1035,13 +2085,39 @@ async def websocket_sync_homekit(
         connection.send_error(msg["id"], "homekit_error", str(err))
 
 
+@websocket_api.require_admin
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "voice_assistant_manager/plan_homekit",
+    }
+)
+@websocket_api.async_response
+@track_command
+async def websocket_plan_homekit(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Show what sync_homekit would change, without applying it."""
+    try:
+        hk_manager = _get_homekit_manager(hass)
+        connection.send_result(msg["id"], hk_manager.dry_run_sync())
+    except HomeKitError as err:
+        connection.send_error(msg["id"], "homekit_error", str(err))
+    except Exception as err:
+        _LOGGER.error("Failed to plan HomeKit sync: %s", err)
+        connection.send_error(msg["id"], "homekit_error", str(err))
+
+
 @websocket_api.require_admin
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "voice_assistant_manager/import_homekit",
+        vol.Optional("expected_revision"): EXPECTED_REVISION_SCHEMA,
     }
 )
 @websocket_api.async_response
+@track_command
 async def websocket_import_homekit(
     hass: HomeAssistant,
     connection: websocket_api.ActiveConnection,
@@ -1050,8 +2126,16 @@ async def websocket_import_homekit(
     """Import current HomeKit configuration into Voice Assistant Manager."""
     try:
         hk_manager = _get_homekit_manager(hass)
-        result = await hk_manager.async_import_from_homekit()
+        async with _get_storage(hass).async_lock(
+            ASSISTANT_HOMEKIT, expected_revisions=msg.get("expected_revision")
+        ):
+            result = await hk_manager.async_import_from_homekit()
+        # The import adopts any outside edits, so they are no longer drift
+        await hk_manager.async_accept_bridge_filters()
+        _get_homekit_drift(hass).async_refresh()
         connection.send_result(msg["id"], result)
+    except RevisionConflictError as err:
+        _send_revision_conflict(connection, msg["id"], _get_storage(hass), err)
     except HomeKitError as err:
         connection.send_error(msg["id"], "homekit_error", str(err))
     except Exception as err:
@@ -1059,6 +2143,36 @@ async def websocket_import_homekit(
         connection.send_error(msg["id"], "homekit_error", str(err))
 
 
+@websocket_api.require_admin
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "voice_assistant_manager/subscribe_homekit_drift",
+    }
+)
+@callback
+def websocket_subscribe_homekit_drift(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Stream drift changes of the managed HomeKit bridges.
+
+    The result carries the current drift; each later event carries the
+    entry_id and its new drift (None once the bridge is back in sync).
+    """
+    tracker = _get_homekit_drift(hass)
+
+    @callback
+    def _async_forward_drift(entry_id: str, drift: dict[str, Any] | None) -> None:
+        """Forward a drift change to the subscriber."""
+        connection.send_message(
+            websocket_api.event_message(msg["id"], {"entry_id": entry_id, "drift": drift})
+        )
+
+    connection.subscriptions[msg["id"]] = tracker.async_subscribe(_async_forward_drift)
+    connection.send_result(msg["id"], {"drift": tracker.async_get_drift()})
+
+
 # ============ System Endpoints ============
 
 @websocket_api.require_admin
@@ -1068,6 +2182,7 @@ async def websocket_import_homekit(
     }
 )
 @websocket_api.async_response
+@track_command
 async def websocket_check_config(
     hass: HomeAssistant,
     connection: websocket_api.ActiveConnection,
@@ -1093,6 +2208,7 @@ async def websocket_check_config(
     }
 )
 @websocket_api.async_response
+@track_command
 async def websocket_restart(
     hass: HomeAssistant,
     connection: websocket_api.ActiveConnection,
@@ -0,0 +1,238 @@
+"""Chunked bulk sessions for Voice Assistant Manager integration.
+
+A bulk session lets the panel upload more entity IDs than fit in a single
+bulk_update request (MAX_BULK_ENTITIES). Chunks are validated as they
+arrive; the whole session is then committed as one atomic apply and save.
+A session is only released once its commit succeeded, so a failed commit
+(e.g. a revision conflict) can be retried without uploading again.
+Sessions that are not committed are released after a timeout.
+"""
+from __future__ import annotations
+
+import logging
+import uuid
+from collections.abc import Callable
+from datetime import datetime
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from .const import (
+    BULK_SESSION_TIMEOUT,
+    MAX_BULK_SESSION_ENTITIES,
+    MAX_BULK_SESSIONS,
+)
+from .exceptions import ValidationError
+from .validators import validate_entity_id
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class BulkSession:
+    """State of one open bulk session.
+
+    Attributes:
+        session_id: Unique session identifier.
+        user_id: ID of the user who opened the session.
+        action: Bulk action to apply on commit.
+        value: Alias value for set_alias.
+        assistant: The assistant type or None for linked mode.
+        entity_ids: Validated entity IDs received so far (insertion ordered).
+        committing: True while a commit of the session is being applied.
+    """
+
+    def __init__(
+        self,
+        session_id: str,
+        user_id: str | None,
+        action: str,
+        value: str,
+        assistant: str | None,
+    ) -> None:
+        """Initialize the session."""
+        self.session_id = session_id
+        self.user_id = user_id
+        self.action = action
+        self.value = value
+        self.assistant = assistant
+        self.entity_ids: dict[str, None] = {}
+        self.chunks: int = 0
+        self.rejected: int = 0
+        self.committing = False
+        self.cancel_timeout: Callable[[], None] | None = None
+
+
+class BulkSessionManager:
+    """Manage open bulk sessions.
+
+    Attributes:
+        hass: Home Assistant instance.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the manager.
+
+        Args:
+            hass: Home Assistant instance.
+        """
+        self.hass = hass
+        self._sessions: dict[str, BulkSession] = {}
+
+    @callback
+    def async_open(
+        self,
+        user_id: str | None,
+        action: str,
+        value: str,
+        assistant: str | None,
+    ) -> BulkSession:
+        """Open a new bulk session.
+
+        Raises:
+            ValidationError: If too many sessions are already open.
+        """
+        if len(self._sessions) >= MAX_BULK_SESSIONS:
+            raise ValidationError(
+                f"Too many open bulk sessions (max {MAX_BULK_SESSIONS})"
+            )
+
+        session = BulkSession(uuid.uuid4().hex, user_id, action, value, assistant)
+        self._sessions[session.session_id] = session
+        self._async_schedule_timeout(session)
+        _LOGGER.debug("Opened bulk session %s (%s)", session.session_id, action)
+        return session
+
+    @callback
+    def async_get(self, session_id: str, user_id: str | None) -> BulkSession:
+        """Return an open session owned by the user.
+
+        Raises:
+            ValidationError: If the session does not exist or has expired.
+        """
+        session = self._sessions.get(session_id)
+        if session is None or session.user_id != user_id:
+            raise ValidationError(f"Unknown or expired bulk session: {session_id}")
+        return session
+
+    @callback
+    def async_add_chunk(
+        self, session: BulkSession, entity_ids: list[str]
+    ) -> dict[str, Any]:
+        """Validate a chunk of entity IDs and add the valid ones to the session.
+
+        Invalid IDs are reported back instead of failing the whole chunk.
+
+        Raises:
+            ValidationError: If the session is being committed or would
+                exceed its entity limit.
+        """
+        _check_not_committing(session)
+        accepted = []
+        rejected = []
+        for entity_id in entity_ids:
+            try:
+                accepted.append(validate_entity_id(entity_id))
+            except ValidationError as err:
+                rejected.append({"entity_id": entity_id, "error": str(err)})
+
+        new_ids = [entity_id for entity_id in accepted if entity_id not in session.entity_ids]
+        if len(session.entity_ids) + len(new_ids) > MAX_BULK_SESSION_ENTITIES:
+            raise ValidationError(
+                f"Too many entities in bulk session (max {MAX_BULK_SESSION_ENTITIES})"
+            )
+
+        session.entity_ids.update(dict.fromkeys(new_ids))
+        session.chunks += 1
+        session.rejected += len(rejected)
+        self._async_schedule_timeout(session)
+
+        return {
+            "accepted": len(accepted),
+            "rejected": rejected,
+            "total": len(session.entity_ids),
+        }
+
+    @callback
+    def async_begin_commit(self, session: BulkSession) -> None:
+        """Mark a session as committing.
+
+        The session stays open (without timing out) until async_end_commit.
+
+        Raises:
+            ValidationError: If the session is already being committed.
+        """
+        _check_not_committing(session)
+        session.committing = True
+        if session.cancel_timeout is not None:
+            session.cancel_timeout()
+            session.cancel_timeout = None
+
+    @callback
+    def async_end_commit(self, session: BulkSession, committed: bool) -> None:
+        """Finish a commit started with async_begin_commit.
+
+        Args:
+            session: The committing session.
+            committed: True to release the session, False to keep it open
+                for another commit attempt.
+        """
+        session.committing = False
+        if committed:
+            self.async_release(session.session_id)
+        elif self._sessions.get(session.session_id) is session:
+            self._async_schedule_timeout(session)
+
+    @callback
+    def async_abort(self, session: BulkSession) -> None:
+        """Discard a session that is not being committed.
+
+        Raises:
+            ValidationError: If a commit of the session is in progress.
+        """
+        _check_not_committing(session)
+        self.async_release(session.session_id)
+
+    @callback
+    def async_release(self, session_id: str) -> None:
+        """Release a session and cancel its timeout."""
+        session = self._sessions.pop(session_id, None)
+        if session is not None and session.cancel_timeout is not None:
+            session.cancel_timeout()
+            session.cancel_timeout = None
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Release all sessions."""
+        for session_id in list(self._sessions):
+            self.async_release(session_id)
+
+    @callback
+    def _async_schedule_timeout(self, session: BulkSession) -> None:
+        """(Re)start the inactivity timeout of a session."""
+        if session.cancel_timeout is not None:
+            session.cancel_timeout()
+
+        @callback
+        def _async_expire(_now: datetime) -> None:
+            """Release the session after inactivity."""
+            session.cancel_timeout = None
+            if self._sessions.get(session.session_id) is session:
+                _LOGGER.debug("Bulk session %s expired", session.session_id)
+                self.async_release(session.session_id)
+
+        session.cancel_timeout = async_call_later(
+            self.hass, BULK_SESSION_TIMEOUT, _async_expire
+        )
+
+
+def _check_not_committing(session: BulkSession) -> None:
+    """Raise if a session is being committed.
+
+    Raises:
+        ValidationError: If a commit of the session is in progress.
+    """
+    if session.committing:
+        raise ValidationError(
+            f"Bulk session is being committed: {session.session_id}"
+        )
@@ -8,7 +8,11 @@ from homeassistant import config_entries
 from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
 
-from .const import DOMAIN
+from .const import (
+    CONF_WRITE_FILES_SLOW_THRESHOLD,
+    DEFAULT_WRITE_FILES_SLOW_THRESHOLD,
+    DOMAIN,
+)
 
 
 class VoiceManagerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -60,5 +64,15 @@ class VoiceManagerOptionsFlow(config_entries.OptionsFlow):
 
         return self.async_show_form(
             step_id="init",
-            data_schema=vol.Schema({}),
+            data_schema=vol.Schema(
+                {
+                    vol.Optional(
+                        CONF_WRITE_FILES_SLOW_THRESHOLD,
+                        default=self.config_entry.options.get(
+                            CONF_WRITE_FILES_SLOW_THRESHOLD,
+                            DEFAULT_WRITE_FILES_SLOW_THRESHOLD,
+                        ),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0, max=600)),
+                }
+            ),
         )
@@ -23,12 +23,28 @@ FILTER_MODE_EXCLUDE: Final = "exclude"
 FILTER_MODE_INCLUDE: Final = "include"
 VALID_FILTER_MODES: Final = frozenset({FILTER_MODE_EXCLUDE, FILTER_MODE_INCLUDE})
 
+# Entity catalog wire formats (get_state)
+ENTITY_FORMAT_FULL: Final = "full"
+ENTITY_FORMAT_COMPACT: Final = "compact"
+
 # Assistant types
 ASSISTANT_GOOGLE: Final = "google"
 ASSISTANT_ALEXA: Final = "alexa"
 ASSISTANT_HOMEKIT: Final = "homekit"
 VALID_ASSISTANTS: Final = frozenset({ASSISTANT_GOOGLE, ASSISTANT_ALEXA, ASSISTANT_HOMEKIT})
 
+# Storage lock scopes: linked-mode sections, each assistant's own sections
+# (separate mode), and assistant settings / bridge selection / timestamps
+SCOPE_LINKED: Final = "linked"
+SCOPE_SETTINGS: Final = "settings"
+STORAGE_SCOPES: Final = (
+    SCOPE_LINKED,
+    ASSISTANT_GOOGLE,
+    ASSISTANT_ALEXA,
+    ASSISTANT_HOMEKIT,
+    SCOPE_SETTINGS,
+)
+
 # YAML output paths (relative to config dir)
 GOOGLE_YAML_PATH: Final = "packages/generated_google_assistant.yaml"
 ALEXA_YAML_PATH: Final = "packages/generated_alexa.yaml"
@@ -46,6 +62,30 @@ MAX_PIN_LENGTH: Final = 32
 
 # Bulk operation limits
 MAX_BULK_ENTITIES: Final = 500
+MAX_BATCH_OPERATIONS: Final = 200
+
+# Chunked bulk sessions (for bulk edits beyond MAX_BULK_ENTITIES)
+MAX_BULK_SESSIONS: Final = 10
+MAX_BULK_SESSION_ENTITIES: Final = 50000
+BULK_SESSION_TIMEOUT: Final = 120  # seconds of inactivity before release
+
+# YAML preview result cache (entries, LRU)
+PREVIEW_CACHE_SIZE: Final = 32
+
+# write_files runs slower than this (seconds) are logged with their stage
+# timings; configurable in the integration options (0 disables)
+CONF_WRITE_FILES_SLOW_THRESHOLD: Final = "write_files_slow_threshold"
+DEFAULT_WRITE_FILES_SLOW_THRESHOLD: Final = 5.0
+
+# Options read on every use; changing only these does not reload the entry
+LIVE_OPTIONS: Final = frozenset({CONF_WRITE_FILES_SLOW_THRESHOLD})
+
+# Runtime metrics histogram bucket upper bounds (last bucket is open-ended)
+METRICS_LATENCY_BUCKETS_MS: Final = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+METRICS_PAYLOAD_BUCKETS_BYTES: Final = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+# Message sizes that need an extra JSON encoding are measured for one call
+# of a command in this many
+METRICS_SIZE_SAMPLE_EVERY: Final = 10
 
 # Filter config structure
 DEFAULT_FILTER_CONFIG: dict = {
@@ -70,6 +110,23 @@ DEFAULT_ALEXA_SETTINGS: dict = {
     "advanced_yaml": "",
 }
 
+# HomeKit bridge reloads: requests within this window are merged into one
+HOMEKIT_RELOAD_DEBOUNCE: Final = 2.0  # seconds
+# Reload watchdog: each attempt (unload, wait for the port, setup) must
+# finish within the timeout; failed attempts are retried with backoff
+HOMEKIT_RELOAD_TIMEOUT: Final = 60.0  # seconds per attempt
+HOMEKIT_RELOAD_ATTEMPTS: Final = 3
+HOMEKIT_RELOAD_BACKOFF: Final = 5.0  # seconds, doubled after each attempt
+HOMEKIT_PORT_CHECK_ATTEMPTS: Final = 5
+HOMEKIT_PORT_CHECK_INTERVAL: Final = 0.5  # seconds, doubled after each check
+
+# HomeKit accessory budget: a bridge with more accessories fails at startup
+HOMEKIT_MAX_ACCESSORIES: Final = 150
+HOMEKIT_ACCESSORY_WARNING: Final = 135  # warn from here on
+ACCESSORIES_OK: Final = "ok"
+ACCESSORIES_WARNING: Final = "warning"
+ACCESSORIES_OVER: Final = "over"
+
 # HomeKit supported domains (for reference)
 HOMEKIT_SUPPORTED_DOMAINS: Final = frozenset({
     "alarm_control_panel", "climate", "cover", "fan", "humidifier",
@@ -78,6 +135,21 @@ HOMEKIT_SUPPORTED_DOMAINS: Final = frozenset({
     "script", "sensor", "valve",
 })
 
+# HomeKit multi-bridge sharding: exposed entities are partitioned across
+# several bridges by a stable key; assignments (key value -> entry ID) are
+# persisted so entities do not move between bridges (and need re-pairing)
+HOMEKIT_SHARD_KEY_AREA: Final = "area"
+HOMEKIT_SHARD_KEY_DOMAIN: Final = "domain"
+HOMEKIT_SHARD_KEYS: Final = (HOMEKIT_SHARD_KEY_AREA, HOMEKIT_SHARD_KEY_DOMAIN)
+HOMEKIT_SYNC_CONCURRENCY: Final = 2  # bridges updated at the same time
+
+DEFAULT_HOMEKIT_SHARDING: dict = {
+    "enabled": False,
+    "entry_ids": [],
+    "key": HOMEKIT_SHARD_KEY_AREA,
+    "assignments": {},
+}
+
 DEFAULT_DATA: dict = {
     "mode": MODE_LINKED,
     # Linked mode data (new v2 structure)
@@ -91,6 +163,9 @@ DEFAULT_DATA: dict = {
     "homekit_filter_config": DEFAULT_FILTER_CONFIG.copy(),
     # HomeKit bridge config
     "homekit_entry_id": None,  # auto-detected or user-selected bridge entry
+    "homekit_sharding": DEFAULT_HOMEKIT_SHARDING.copy(),
+    # HomeKit filter last written per bridge entry, to detect outside edits
+    "homekit_synced_filters": {},
     # Settings
     "google_settings": DEFAULT_GOOGLE_SETTINGS.copy(),
     "alexa_settings": DEFAULT_ALEXA_SETTINGS.copy(),
@@ -100,4 +175,6 @@ DEFAULT_DATA: dict = {
         "alexa": None,
         "homekit": None,
     },
+    # Per-scope section revisions (optimistic concurrency)
+    "revisions": {},
 }
@@ -0,0 +1,48 @@
+"""Diagnostics support for Voice Assistant Manager integration.
+
+Only runtime statistics are reported; no settings, paths or PINs are
+included.
+"""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN, VERSION
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry.
+
+    Args:
+        hass: Home Assistant instance.
+        entry: Config entry.
+
+    Returns:
+        Dict of runtime statistics.
+    """
+    domain_data = hass.data.get(DOMAIN, {})
+    storage = domain_data.get("storage")
+    registry_index = domain_data.get("registry_index")
+    preview_cache = domain_data.get("preview_cache")
+    metrics = domain_data.get("metrics")
+
+    return {
+        "version": VERSION,
+        "mode": storage.mode if storage is not None else None,
+        "storage_revision": storage.revision if storage is not None else None,
+        "registry_revision": (
+            registry_index.revision if registry_index is not None else None
+        ),
+        "known_entities": (
+            len(registry_index.known_entity_ids) if registry_index is not None else None
+        ),
+        "preview_cache": preview_cache.as_dict() if preview_cache is not None else None,
+        "storage_locks": storage.lock_stats() if storage is not None else None,
+        "storage_saves": storage.save_stats() if storage is not None else None,
+        "metrics": metrics.as_dict() if metrics is not None else None,
+    }
@@ -18,9 +18,41 @@ class StorageError(VoiceManagerError):
     """Storage operation error."""
 
 
+class RevisionConflictError(StorageError):
+    """Write rejected because it was based on a stale revision."""
+
+    def __init__(
+        self, message: str, revision: int, conflicts: list[str] | None = None
+    ) -> None:
+        """Initialize the error with the current revision.
+
+        Args:
+            message: Error message.
+            revision: Current storage content revision.
+            conflicts: Storage scopes whose section revision did not match.
+        """
+        super().__init__(message)
+        self.revision = revision
+        self.conflicts = conflicts or []
+
+
 class YAMLGenerationError(VoiceManagerError):
     """YAML generation error."""
 
 
 class HomeKitError(VoiceManagerError):
     """HomeKit integration error."""
+
+
+class HomeKitDriftError(HomeKitError):
+    """Sync refused because a bridge was edited outside Voice Assistant Manager."""
+
+    def __init__(self, message: str, drift: dict[str, dict]) -> None:
+        """Initialize the error with the detected drift.
+
+        Args:
+            message: Error message.
+            drift: Drift per HomeKit entry ID (see homekit_manager.compute_drift).
+        """
+        super().__init__(message)
+        self.drift = drift
@@ -0,0 +1,128 @@
+"""Filter config compaction for Voice Assistant Manager integration.
+
+Imports and accumulated bulk edits leave filter configs with long entity
+lists that could be written as a few domain or device rules plus
+overrides. The optimizer rewrites a filter config into a smaller rule set
+that exposes exactly the same entities for the current registry, which
+keeps storage, payloads and generated YAML small.
+"""
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Any
+
+from .const import FILTER_MODE_EXCLUDE
+
+if TYPE_CHECKING:
+    from .registry_index import RegistryView
+
+_LOGGER = logging.getLogger(__name__)
+
+FILTER_RULE_KEYS = ("domains", "entities", "devices", "overrides")
+
+
+def filter_rule_count(filter_config: dict[str, Any]) -> int:
+    """Return the number of rules (list entries) in a filter config."""
+    return sum(len(filter_config.get(key, [])) for key in FILTER_RULE_KEYS)
+
+
+def optimize_filter_config(
+    view: RegistryView, filter_config: dict[str, Any]
+) -> dict[str, Any]:
+    """Rewrite a filter config into a smaller equivalent rule set.
+
+    Exposure in both filter modes only depends on the set of enabled
+    entities that are matched and not overridden. That set is rebuilt
+    greedily, cheapest rules first:
+
+    1. A domain rule replaces the domain's entities when 1 + the
+       overrides it needs costs less than listing them.
+    2. A device rule replaces the remaining entities of a device under
+       the same condition.
+    3. What is left is listed as entities.
+
+    Overrides are whatever the chosen rules match but must not. Entity
+    entries and overrides that refer to entities which are not enabled
+    are kept as they are, so they still apply if the entity comes back.
+    The filter mode is never changed.
+
+    Args:
+        view: Registry view of the current registry.
+        filter_config: The filter config to compact.
+
+    Returns:
+        Dict with filter_config (the compacted config, or the original if
+        it could not be improved), rules_before, rules_after, changed and
+        verified (exposure compared with RegistryView.evaluate_filter).
+    """
+    enabled = set(view.enabled)
+    domains = set(filter_config.get("domains", []))
+    entities = set(filter_config.get("entities", []))
+    devices = set(filter_config.get("devices", []))
+    overrides = set(filter_config.get("overrides", []))
+
+    # Matched, not overridden, enabled entities: this alone decides exposure
+    target = (
+        view.entities_in_domains(domains) | entities | view.entities_of_devices(devices)
+    ) - overrides
+    target &= enabled
+
+    new_domains: set[str] = set()
+    for domain, members in view.by_domain.items():
+        selected = target.intersection(members)
+        if not selected:
+            continue
+        cost = 1 + len(members) - len(selected)
+        if cost < len(selected) or (cost == len(selected) and domain in domains):
+            new_domains.add(domain)
+
+    covered = view.entities_in_domains(new_domains)
+    remaining = target - covered
+
+    new_devices: set[str] = set()
+    candidates = sorted(
+        view.by_device.items(),
+        key=lambda item: -len(remaining.intersection(item[1])),
+    )
+    for device_id, members in candidates:
+        selected = remaining.intersection(members)
+        if not selected:
+            continue
+        # Members already matched by a chosen rule need no extra override
+        extra = set(members) - target - covered
+        cost = 1 + len(extra)
+        if cost < len(selected) or (cost == len(selected) and device_id in devices):
+            new_devices.add(device_id)
+            covered |= set(members)
+            remaining -= selected
+
+    new_entities = remaining | (entities - enabled)
+    new_overrides = ((covered | remaining) - target) | (overrides - enabled)
+
+    optimized = {
+        "filter_mode": filter_config.get("filter_mode", FILTER_MODE_EXCLUDE),
+        "domains": sorted(new_domains),
+        "entities": sorted(new_entities),
+        "devices": sorted(new_devices),
+        "overrides": sorted(new_overrides),
+    }
+
+    verified = view.evaluate_filter(optimized) == view.evaluate_filter(filter_config)
+    if not verified:
+        # Never hand out a config that exposes something else
+        _LOGGER.error("Filter optimization changed exposure, keeping the original config")
+        optimized = dict(filter_config)
+
+    rules_before = filter_rule_count(filter_config)
+    rules_after = filter_rule_count(optimized)
+    if rules_after >= rules_before:
+        optimized = dict(filter_config)
+        rules_after = rules_before
+
+    return {
+        "filter_config": optimized,
+        "rules_before": rules_before,
+        "rules_after": rules_after,
+        "changed": rules_after < rules_before,
+        "verified": verified,
+    }
@@ -95,6 +95,11 @@ export const en: Record<string, string> = {
   port: "Port",
   homekitEnabled: "HomeKit will be enabled after saving",
   homekitDisabled: "HomeKit disabled",
+  homekitAccessories: "Estimated accessories",
+  homekitAccessoriesWarning: "Close to the HomeKit limit",
+  homekitAccessoriesOver: "Over the HomeKit limit: sync will be refused",
+  homekitDrift: "Bridge options were changed in Home Assistant since the last sync. Import them, or confirm overwriting them when saving.",
+  homekitDriftConfirm: "The HomeKit bridge options were changed in Home Assistant since the last sync. Overwrite them with the Voice Assistant Manager configuration?",
   backToEntities: "Back to Entities",
   saveSettings: "Save Settings",
   saving: "Saving...",
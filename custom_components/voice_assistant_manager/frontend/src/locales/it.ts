@@ -95,6 +95,11 @@ export const it: Record<string, string> = {
   port: "Porta",
   homekitEnabled: "HomeKit verrà abilitato dopo il salvataggio",
   homekitDisabled: "HomeKit disabilitato",
+  homekitAccessories: "Accessori stimati",
+  homekitAccessoriesWarning: "Vicino al limite di HomeKit",
+  homekitAccessoriesOver: "Oltre il limite di HomeKit: la sincronizzazione verrà rifiutata",
+  homekitDrift: "Le opzioni del bridge sono state modificate in Home Assistant dall'ultima sincronizzazione. Importale, oppure conferma la sovrascrittura al salvataggio.",
+  homekitDriftConfirm: "Le opzioni del bridge HomeKit sono state modificate in Home Assistant dall'ultima sincronizzazione. Sovrascriverle con la configurazione di Voice Assistant Manager?",
   backToEntities: "Torna alle Entità",
   saveSettings: "Salva Impostazioni",
   saving: "Salvataggio...",
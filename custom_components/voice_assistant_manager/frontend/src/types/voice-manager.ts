@@ -39,6 +39,23 @@ export interface Entity {
   platform: string;
 }
 
+/**
+ * Columnar entity catalog returned by get_state with format: 'compact'.
+ * Per-entity fields are parallel arrays; domain/device/area are indexes
+ * into the de-duplicated tables (-1 = none).
+ */
+export interface CompactEntityCatalog {
+  entity_id: string[];
+  name: string[];
+  platform: string[];
+  domain: number[];
+  device: number[];
+  area: number[];
+  domains: string[];
+  devices: { id: string[]; name: (string | null)[] };
+  areas: { id: string[]; name: (string | null)[] };
+}
+
 export interface Device {
   id: string;
   name: string;
@@ -59,10 +76,85 @@ export interface HomeKitBridge {
   port: number;
   name: string;
   include_domains: string[];
+  include_entities: string[];
+  exclude_entities: string[];
+  /** Only set by get_homekit_bridges, not by get_state. */
+  reload?: HomeKitReloadState;
+}
+
+export interface HomeKitReloadState {
+  scheduled: boolean;
+  running: boolean;
+  pending: boolean;
+  /** A filter update is buffered and will be written by the next reload. */
+  update_pending: boolean;
+  requested: number;
+  completed: number;
+  coalesced: number;
+  failed: number;
+  timeouts: number;
+  /** Seconds the current reload has been running, null when idle. */
+  running_for: number | null;
+  last_reload: string | null;
+  last_error: string | null;
+  last_outcome: 'success' | 'failed' | 'timeout' | null;
+  last_duration: number | null;
+  last_attempts: number;
+}
+
+export type HomeKitShardKey = 'area' | 'domain';
+
+export type HomeKitAccessoryStatus = 'ok' | 'warning' | 'over';
+
+/** Estimated accessory count of a bridge after the next sync. */
+export interface HomeKitAccessoryEstimate {
+  entry_id: string;
+  title: string;
+  accessories: number;
+  limit: number;
+  status: HomeKitAccessoryStatus;
+}
+
+export interface HomeKitFilter {
+  include_domains: string[];
+  include_entities: string[];
+  exclude_domains: string[];
   exclude_entities: string[];
 }
 
+/** Result of plan_homekit: what sync_homekit would change. */
+export interface HomeKitSyncPlan {
+  sharded: boolean;
+  assignments: Record<string, string> | null;
+  allowed: boolean;
+  error: string | null;
+  warnings: string[];
+  would_reload: boolean;
+  bridges: Array<HomeKitAccessoryEstimate & {
+    filter: HomeKitFilter;
+    diff: Partial<Record<keyof HomeKitFilter, { added: string[]; removed: string[] }>>;
+    accessories_before: number;
+    accessory_delta: number;
+    would_reload: boolean;
+    drift: HomeKitDrift | null;
+  }>;
+}
+
+/** Outside edits of a bridge filter since the last sync, per changed key. */
+export type HomeKitDrift = Partial<Record<keyof HomeKitFilter, { added: string[]; removed: string[] }>>;
+
+export interface HomeKitSharding {
+  enabled: boolean;
+  entry_ids: string[];
+  key: HomeKitShardKey;
+  /** Shard key value (area ID or domain) -> HomeKit entry ID. */
+  assignments: Record<string, string>;
+}
+
 export interface VoiceManagerState {
+  revision: number;
+  /** Per-section revisions (linked, google, alexa, homekit, settings). */
+  revisions: Record<string, number>;
   mode: AssistantMode;
   filter_config: FilterConfig;
   aliases: Record<string, string>;
@@ -72,6 +164,7 @@ export interface VoiceManagerState {
   alexa_aliases: Record<string, string>;
   homekit_filter_config: FilterConfig;
   homekit_entry_id: string | null;
+  homekit_sharding: HomeKitSharding;
   google_settings: GoogleSettings;
   alexa_settings: AlexaSettings;
   last_generated: {
@@ -83,11 +176,15 @@ export interface VoiceManagerState {
   alexa_complete: boolean;
   homekit_complete: boolean;
   entities: Entity[];
+  entity_format?: 'full' | 'compact';
   devices: Device[];
   areas: Area[];
   domains: string[];
   homekit_bridges: HomeKitBridge[];
   homekit_supported_domains: string[];
+  homekit_accessories: HomeKitAccessoryEstimate[];
+  /** Drift per HomeKit entry ID; only bridges with drift are listed. */
+  homekit_drift: Record<string, HomeKitDrift>;
 }
 
 export interface Filters {
@@ -107,6 +204,8 @@ export interface ExposureResult {
 }
 
 export interface PreviewContent {
+  /** Set when a newer preview replaced this request; no content is included. */
+  superseded?: boolean;
   google?: {
     yaml: string;
     warnings: string[];
@@ -119,8 +218,56 @@ export interface PreviewContent {
   };
 }
 
+export interface PreviewDiff {
+  /** Unified diff against the file on disk; null if nothing would be written. */
+  diff: string | null;
+  exists: boolean | null;
+  added_entities: number;
+  removed_entities: number;
+  warnings: string[];
+  complete: boolean;
+}
+
+/** Result of preview_yaml with diff: true. */
+export interface PreviewDiffContent {
+  superseded?: boolean;
+  google?: PreviewDiff;
+  alexa?: PreviewDiff;
+}
+
+/** Result of a mutating command rejected because it was based on stale data. */
+export interface RevisionConflict {
+  success: false;
+  error: 'revision_conflict';
+  message: string;
+  revision: number;
+  revisions: Record<string, number>;
+  conflicts: string[];
+  delta: Partial<VoiceManagerState>;
+}
+
+/** Result of optimize_filter: a smaller rule set with identical exposure. */
+export interface OptimizeFilterResult {
+  filter_config: FilterConfig;
+  rules_before: number;
+  rules_after: number;
+  changed: boolean;
+  verified: boolean;
+  applied: boolean;
+  revisions?: Record<string, number>;
+}
+
 export interface WriteResult {
   google: { written: boolean; error: string | null };
   alexa: { written: boolean; error: string | null };
-  homekit: { written: boolean; error: string | null };
+  /** changed is false when the bridge filter was already up to date (no reload). */
+  homekit: {
+    written: boolean;
+    error: string | null;
+    changed?: boolean;
+    /** Set when the sync was refused because the bridge was edited outside the panel. */
+    drift?: Record<string, HomeKitDrift>;
+  };
+  /** Stage timings (exclusive ms per stage, e.g. "google.write", "storage_save"). */
+  timings: { total_ms: number; spans_ms: Record<string, number> };
 }
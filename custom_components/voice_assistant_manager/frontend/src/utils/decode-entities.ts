@@ -0,0 +1,26 @@
+/**
+ * Decode the columnar (compact) entity catalog into Entity objects
+ */
+import type { CompactEntityCatalog, Entity } from '../types';
+
+export function decodeCompactEntities(catalog: CompactEntityCatalog): Entity[] {
+  const { domains, devices, areas } = catalog;
+  const entities: Entity[] = new Array(catalog.entity_id.length);
+
+  for (let i = 0; i < catalog.entity_id.length; i++) {
+    const device = catalog.device[i];
+    const area = catalog.area[i];
+    entities[i] = {
+      entity_id: catalog.entity_id[i],
+      name: catalog.name[i],
+      domain: domains[catalog.domain[i]],
+      device_id: device >= 0 ? devices.id[device] : null,
+      device_name: device >= 0 ? devices.name[device] : null,
+      area_id: area >= 0 ? areas.id[area] : null,
+      area_name: area >= 0 ? areas.name[area] : null,
+      platform: catalog.platform[i],
+    };
+  }
+
+  return entities;
+}
@@ -1,2 +1,3 @@
 export { debounce } from './debounce';
+export { decodeCompactEntities } from './decode-entities';
 export { escapeHtml } from './escape-html';
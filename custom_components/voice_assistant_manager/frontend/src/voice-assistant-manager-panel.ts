@@ -12,7 +12,7 @@ import { LitElement, html, css, CSSResultGroup, TemplateResult } from 'lit';
 import { customElement, property, state } from 'lit/decorators.js';
 
 import { createTranslator, TranslateFunction } from './locales';
-import { debounce, escapeHtml } from './utils';
+import { debounce, decodeCompactEntities, escapeHtml } from './utils';
 import {
   sharedStyles,
   headerStyles,
@@ -29,17 +29,21 @@ import {
 import type {
   HomeAssistant,
   VoiceManagerState,
+  CompactEntityCatalog,
   FilterConfig,
   FilterMode,
   GoogleSettings,
   AlexaSettings,
   Entity,
   Area,
+  HomeKitAccessoryEstimate,
   HomeKitBridge,
   Filters,
   ExposureResult,
   PreviewContent,
+  RevisionConflict,
   Platform,
+  WriteResult,
 } from './types';
 
 const DEFAULT_FILTER_CONFIG: FilterConfig = {
@@ -192,7 +196,13 @@ export class VoiceAssistantManagerPanel extends LitElement {
     try {
       const result = await this.hass.callWS<VoiceManagerState>({
         type: 'voice_assistant_manager/get_state',
+        format: 'compact',
       });
+      if (result.entity_format === 'compact') {
+        result.entities = decodeCompactEntities(
+          result.entities as unknown as CompactEntityCatalog
+        );
+      }
       this._state = result;
       
       // Initialize pending settings
@@ -594,15 +604,22 @@ export class VoiceAssistantManagerPanel extends LitElement {
     return payload;
   }
 
+  /** Save pending changes, rejecting the save if another admin changed the same sections. */
+  private async _savePending(): Promise<void> {
+    const result = await this.hass.callWS<{ success: boolean } | RevisionConflict>({
+      type: 'voice_assistant_manager/save_all',
+      ...this._buildSavePayload(),
+      ...(this._state?.revisions ? { expected_revision: this._state.revisions } : {}),
+    });
+    if (!result.success) {
+      throw new Error((result as RevisionConflict).message + ' - reload to see the latest changes');
+    }
+  }
+
   private async _saveAllSettings(): Promise<void> {
     this._saving = true;
     try {
-      const payload = {
-        type: 'voice_assistant_manager/save_all',
-        ...this._buildSavePayload(),
-      };
-
-      await this.hass.callWS(payload as { type: string; [key: string]: unknown });
+      await this._savePending();
       await this._loadState();
       this._hasUnsavedChanges = false;
       alert(this._t('settingsSaved'));
@@ -681,6 +698,8 @@ export class VoiceAssistantManagerPanel extends LitElement {
         type: 'voice_assistant_manager/preview_yaml',
         ...this._buildSavePayload(),
       });
+      // A newer preview is on its way; keep waiting for that one
+      if (result.superseded) return;
       this._previewContent = result;
       this._previewDialog = true;
     } catch (error) {
@@ -694,23 +713,28 @@ export class VoiceAssistantManagerPanel extends LitElement {
     try {
       // First, save all pending changes if any
       if (this._hasUnsavedChanges) {
-        const payload = {
-          type: 'voice_assistant_manager/save_all',
-          ...this._buildSavePayload(),
-        };
-
-        await this.hass.callWS(payload as { type: string; [key: string]: unknown });
+        await this._savePending();
         this._hasUnsavedChanges = false;
       }
       
       // Then write files
-      const result = await this.hass.callWS<{
-        google: { written: boolean; error: string | null };
-        alexa: { written: boolean; error: string | null };
-        homekit: { written: boolean; error: string | null };
-      }>({
+      const result = await this.hass.callWS<WriteResult>({
         type: 'voice_assistant_manager/write_files',
       });
+
+      // The bridge was edited outside the panel: only overwrite it if asked to
+      if (result.homekit?.drift && confirm(this._t('homekitDriftConfirm'))) {
+        try {
+          await this.hass.callWS({
+            type: 'voice_assistant_manager/sync_homekit',
+            force: true,
+          });
+          result.homekit = { written: true, error: null };
+        } catch (error) {
+          console.error('Failed to sync HomeKit:', error);
+          result.homekit = { written: false, error: (error as Error).message };
+        }
+      }
       
       let message = this._t('configSaved') + '\n';
       if (result.google?.written) message += '- ' + this._t('googleOk') + '\n';
@@ -1452,6 +1476,12 @@ export class VoiceAssistantManagerPanel extends LitElement {
             <p style="color: var(--vm-success); font-size: 13px; margin-top: 8px;">
               ✓ ${this._t('homekitEnabled')}
             </p>
+            ${this._renderAccessoryEstimates()}
+            ${this._state?.homekit_drift?.[effectiveBridge] ? html`
+              <p style="color: var(--vm-warning); font-size: 13px; margin-top: 4px;">
+                ⚠ ${this._t('homekitDrift')}
+              </p>
+            ` : ''}
           ` : html`
             <p style="color: var(--vm-text-secondary); font-size: 13px; margin-top: 8px;">
               ${this._t('homekitDisabled')}
@@ -1462,6 +1492,21 @@ export class VoiceAssistantManagerPanel extends LitElement {
     `;
   }
 
+  private _renderAccessoryEstimates(): TemplateResult {
+    const estimates = this._state?.homekit_accessories || [];
+    return html`
+      ${estimates.map((estimate: HomeKitAccessoryEstimate) => html`
+        <p style="color: ${estimate.status === 'ok'
+          ? 'var(--vm-text-secondary)'
+          : estimate.status === 'warning' ? 'var(--vm-warning)' : 'var(--vm-error)'}; font-size: 13px; margin-top: 4px;">
+          ${escapeHtml(estimate.title)}: ${this._t('homekitAccessories')} ${estimate.accessories}/${estimate.limit}
+          ${estimate.status === 'warning' ? html` · ${this._t('homekitAccessoriesWarning')}` : ''}
+          ${estimate.status === 'over' ? html` · ${this._t('homekitAccessoriesOver')}` : ''}
+        </p>
+      `)}
+    `;
+  }
+
   private _renderFooter(): TemplateResult {
     if (this._activeTab === 'settings') {
       return html`
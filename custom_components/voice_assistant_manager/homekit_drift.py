@@ -0,0 +1,142 @@
+"""HomeKit Bridge drift tracking for Voice Assistant Manager integration.
+
+Bridge options can also be edited in Home Assistant's own HomeKit UI.
+Every sync records the filter it wrote per bridge; this module listens for
+config entry updates of the managed bridges and compares the bridge's
+current filter against that record, so outside edits are reported as
+drift instead of being silently overwritten by the next sync.
+"""
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.config_entries import (
+    SIGNAL_CONFIG_ENTRY_CHANGED,
+    ConfigEntry,
+    ConfigEntryChange,
+)
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+
+from .homekit_manager import HOMEKIT_DOMAIN, compute_drift, managed_entry_ids
+
+if TYPE_CHECKING:
+    from .storage import VoiceAssistantManagerStorage
+
+_LOGGER = logging.getLogger(__name__)
+
+DriftListener = Callable[[str, "dict[str, Any] | None"], None]
+
+
+class HomeKitDriftTracker:
+    """Track drift of the managed HomeKit bridges.
+
+    Only the bridge whose config entry changed is re-checked; listeners are
+    told when a bridge's drift appears, changes or goes away.
+
+    Attributes:
+        hass: Home Assistant instance.
+        storage: Voice Assistant Manager storage instance.
+    """
+
+    def __init__(self, hass: HomeAssistant, storage: VoiceAssistantManagerStorage) -> None:
+        """Initialize the tracker.
+
+        Args:
+            hass: Home Assistant instance.
+            storage: Voice Assistant Manager storage instance.
+        """
+        self.hass = hass
+        self.storage = storage
+        self._drift: dict[str, dict[str, Any]] = {}
+        self._listeners: list[DriftListener] = []
+        self._unsub: Callable[[], None] | None = None
+
+    @callback
+    def async_setup(self) -> None:
+        """Check the managed bridges and listen for config entry updates."""
+        self.async_refresh()
+        self._unsub = async_dispatcher_connect(
+            self.hass, SIGNAL_CONFIG_ENTRY_CHANGED, self._async_config_entry_changed
+        )
+
+    @callback
+    def async_unload(self) -> None:
+        """Stop listening and drop all listeners."""
+        if self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+        self._listeners.clear()
+
+    @callback
+    def async_get_drift(self) -> dict[str, dict[str, Any]]:
+        """Return the drift of the managed bridges that have any."""
+        managed = managed_entry_ids(self.storage)
+        return {
+            entry_id: drift
+            for entry_id, drift in self._drift.items()
+            if entry_id in managed
+        }
+
+    @callback
+    def async_subscribe(self, listener: DriftListener) -> Callable[[], None]:
+        """Call listener(entry_id, drift) whenever a bridge's drift changes.
+
+        Returns:
+            Callback that removes the listener.
+        """
+        self._listeners.append(listener)
+
+        @callback
+        def _async_remove() -> None:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+        return _async_remove
+
+    @callback
+    def async_refresh(self) -> None:
+        """Re-check every managed bridge (after a sync, import or selection change)."""
+        for entry_id in managed_entry_ids(self.storage):
+            self._async_check(entry_id)
+
+    @callback
+    def _async_config_entry_changed(
+        self, change: ConfigEntryChange, entry: ConfigEntry
+    ) -> None:
+        """Re-check a managed bridge when its config entry changes."""
+        if entry.domain != HOMEKIT_DOMAIN:
+            return
+        if entry.entry_id in managed_entry_ids(self.storage):
+            self._async_check(entry.entry_id)
+
+    @callback
+    def _async_check(self, entry_id: str) -> None:
+        """Recompute the drift of one bridge and notify on change."""
+        entry = self.hass.config_entries.async_get_entry(entry_id)
+        if entry is None:
+            drift = None
+        else:
+            drift = compute_drift(
+                (entry.options or {}).get("filter", {}),
+                self.storage.get_homekit_synced_filters().get(entry_id),
+            )
+
+        if drift == self._drift.get(entry_id):
+            return
+
+        if drift is None:
+            self._drift.pop(entry_id, None)
+            _LOGGER.debug("HomeKit bridge %s is back in sync", entry_id)
+        else:
+            self._drift[entry_id] = drift
+            _LOGGER.info(
+                "HomeKit bridge %s was changed outside Voice Assistant Manager: %s",
+                entry_id,
+                ", ".join(sorted(drift)),
+            )
+
+        for listener in list(self._listeners):
+            listener(entry_id, drift)
@@ -5,20 +5,33 @@ through Home Assistant's config_entries system.
 """
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers import entity_registry as er
 
 from .const import (
+    ACCESSORIES_OK,
+    ACCESSORIES_OVER,
+    ACCESSORIES_WARNING,
     FILTER_MODE_EXCLUDE,
     FILTER_MODE_INCLUDE,
+    HOMEKIT_ACCESSORY_WARNING,
+    HOMEKIT_MAX_ACCESSORIES,
+    HOMEKIT_SHARD_KEY_AREA,
+    HOMEKIT_SHARD_KEY_DOMAIN,
     HOMEKIT_SUPPORTED_DOMAINS,
+    HOMEKIT_SYNC_CONCURRENCY,
 )
-from .exceptions import HomeKitError
+from .exceptions import HomeKitDriftError, HomeKitError
+from .homekit_reload import HomeKitReloadScheduler
+from .metrics import Trace, trace_span
 
 if TYPE_CHECKING:
+    from homeassistant.helpers.entity_registry import RegistryEntry
+
+    from .registry_index import RegistryIndex, RegistryView
     from .storage import VoiceManagerStorage
 
 _LOGGER = logging.getLogger(__name__)
@@ -26,6 +39,415 @@ _LOGGER = logging.getLogger(__name__)
 # HomeKit integration domain
 HOMEKIT_DOMAIN = "homekit"
 
+# Entity filter keys of a HomeKit entry's options["filter"]
+HOMEKIT_FILTER_KEYS = (
+    "include_domains",
+    "include_entities",
+    "exclude_domains",
+    "exclude_entities",
+)
+
+# Sensor device classes and units HomeKit has an accessory type for; other
+# sensors (power, energy, ...) get no accessory
+HOMEKIT_SENSOR_DEVICE_CLASSES = frozenset({
+    "temperature", "humidity", "pm10", "pm25", "nitrogen_dioxide",
+    "volatile_organic_compounds", "gas", "carbon_monoxide", "carbon_dioxide",
+    "illuminance",
+})
+HOMEKIT_SENSOR_UNITS = frozenset({"°C", "°F", "lx"})
+# HomeKit also matches these in a sensor's entity ID
+HOMEKIT_SENSOR_ID_HINTS = ("pm10", "pm25", "gas", "co2")
+# CoverEntityFeature OPEN | CLOSE | SET_POSITION | SET_TILT_POSITION
+HOMEKIT_COVER_FEATURES = 1 | 2 | 4 | 128
+
+
+def normalize_homekit_filter(entity_filter: dict[str, Any]) -> dict[str, list[str]]:
+    """Return a HomeKit entity filter in a canonical form for comparison.
+
+    Missing keys become empty lists; lists are deduplicated and sorted.
+    """
+    return {
+        key: sorted(set(entity_filter.get(key) or []))
+        for key in HOMEKIT_FILTER_KEYS
+    }
+
+
+def compute_drift(
+    current: dict[str, Any], synced: dict[str, list[str]] | None
+) -> dict[str, dict[str, list[str]]] | None:
+    """Compare a bridge's current filter with the one last synced to it.
+
+    Args:
+        current: The bridge's current HomeKit entity filter.
+        synced: The normalized filter last written, or None if the bridge
+            was never synced.
+
+    Returns:
+        Added/removed values per changed filter key, or None if there is
+        no drift (or no baseline to compare against).
+    """
+    if synced is None:
+        return None
+
+    current = normalize_homekit_filter(current)
+    synced = normalize_homekit_filter(synced)
+    drift = {
+        key: {
+            "added": sorted(set(current[key]) - set(synced[key])),
+            "removed": sorted(set(synced[key]) - set(current[key])),
+        }
+        for key in HOMEKIT_FILTER_KEYS
+        if current[key] != synced[key]
+    }
+    return drift or None
+
+
+def managed_entry_ids(storage: VoiceManagerStorage) -> list[str]:
+    """Return the HomeKit entry IDs Voice Assistant Manager writes to."""
+    sharding = storage.get_homekit_sharding()
+    if sharding.get("enabled"):
+        return list(sharding.get("entry_ids", []))
+    entry_id = storage.get_homekit_entry_id()
+    return [entry_id] if entry_id else []
+
+
+def creates_homekit_accessory(entity: RegistryEntry) -> bool:
+    """Return whether HomeKit would create an accessory for an entity.
+
+    Mirrors the registry-visible part of HomeKit's accessory type choice:
+    sensors need a supported device class, unit or entity ID hint, covers
+    need an open/close, position or tilt feature. Entities of other
+    domains are assumed to get an accessory.
+    """
+    domain = entity.entity_id.split(".")[0]
+    if domain == "sensor":
+        device_class = entity.device_class or entity.original_device_class
+        return (
+            device_class in HOMEKIT_SENSOR_DEVICE_CLASSES
+            or entity.unit_of_measurement in HOMEKIT_SENSOR_UNITS
+            or any(hint in entity.entity_id for hint in HOMEKIT_SENSOR_ID_HINTS)
+        )
+    if domain == "cover":
+        return bool((entity.supported_features or 0) & HOMEKIT_COVER_FEATURES)
+    return True
+
+
+def _accessory_weight(view: RegistryView, entity_ids: list[str]) -> int:
+    """Return how many of the entities would become HomeKit accessories."""
+    return sum(1 for entity_id in entity_ids if entity_id not in view.no_accessory)
+
+
+def _group_entities(
+    view: RegistryView, entity_ids: list[str], shard_key: str
+) -> dict[str, list[str]]:
+    """Group entities by area (no area: "") or by domain."""
+    groups: dict[str, list[str]] = {}
+    for entity_id in entity_ids:
+        if shard_key == HOMEKIT_SHARD_KEY_AREA:
+            group = view.area_of.get(entity_id) or ""
+        else:
+            group = entity_id.split(".")[0]
+        groups.setdefault(group, []).append(entity_id)
+    return groups
+
+
+def _shard_groups(
+    view: RegistryView, entity_ids: set[str], shard_key: str
+) -> dict[str, list[str]]:
+    """Group exposed entities for sharding, splitting groups too big for a bridge.
+
+    Entities are grouped by shard_key. A group estimated at more than
+    HOMEKIT_ACCESSORY_WARNING accessories is split by the other key (domain
+    within an area, area within a domain) into "<group>/<subgroup>"; a
+    subgroup still over that is cut into consecutive chunks of its sorted
+    entity IDs, "<group>/<subgroup>#<n>". Groups within the budget keep
+    their plain name, so their stored assignment stays valid.
+    """
+    other_key = (
+        HOMEKIT_SHARD_KEY_DOMAIN
+        if shard_key == HOMEKIT_SHARD_KEY_AREA
+        else HOMEKIT_SHARD_KEY_AREA
+    )
+    result: dict[str, list[str]] = {}
+
+    for group, members in _group_entities(view, sorted(entity_ids), shard_key).items():
+        if _accessory_weight(view, members) <= HOMEKIT_ACCESSORY_WARNING:
+            result[group] = members
+            continue
+
+        for subgroup, sub_members in _group_entities(view, members, other_key).items():
+            name = f"{group}/{subgroup}"
+            if _accessory_weight(view, sub_members) <= HOMEKIT_ACCESSORY_WARNING:
+                result[name] = sub_members
+                continue
+
+            chunks: list[list[str]] = [[]]
+            weight = 0
+            for entity_id in sub_members:
+                accessory = entity_id not in view.no_accessory
+                if accessory and weight == HOMEKIT_ACCESSORY_WARNING:
+                    chunks.append([])
+                    weight = 0
+                chunks[-1].append(entity_id)
+                weight += accessory
+            for index, chunk in enumerate(chunks, 1):
+                result[f"{name}#{index}"] = chunk
+
+    return result
+
+
+def compute_shards(
+    view: RegistryView,
+    entity_ids: set[str],
+    entry_ids: list[str],
+    shard_key: str,
+    assignments: dict[str, str],
+) -> tuple[dict[str, list[str]], dict[str, str]]:
+    """Partition exposed entities across HomeKit bridges.
+
+    Entities are grouped by area or domain, and a group goes to one
+    bridge as a whole; groups too big for one bridge are split first (see
+    _shard_groups). Groups keep their previous bridge while it is still
+    part of the shard set, so an entity never moves between bridges (which
+    would require re-pairing it in the Home app). New groups are placed,
+    largest first, on the bridge with the fewest estimated accessories.
+
+    Args:
+        view: Registry view used to look up entity areas.
+        entity_ids: Entities exposed to HomeKit.
+        entry_ids: HomeKit entry IDs to shard across (non-empty).
+        shard_key: HOMEKIT_SHARD_KEY_AREA or HOMEKIT_SHARD_KEY_DOMAIN.
+        assignments: Previous group -> entry ID assignments.
+
+    Returns:
+        Tuple of (entity IDs per entry ID, updated assignments).
+    """
+    groups = _shard_groups(view, entity_ids, shard_key)
+    weights = {group: _accessory_weight(view, members) for group, members in groups.items()}
+
+    shards: dict[str, list[str]] = {entry_id: [] for entry_id in entry_ids}
+    loads = dict.fromkeys(entry_ids, 0)
+    new_assignments: dict[str, str] = {}
+    unassigned: list[str] = []
+
+    for group, members in groups.items():
+        entry_id = assignments.get(group)
+        if entry_id in shards:
+            shards[entry_id].extend(members)
+            loads[entry_id] += weights[group]
+            new_assignments[group] = entry_id
+        else:
+            unassigned.append(group)
+
+    # Largest groups first, ties by name, so the result is deterministic
+    unassigned.sort(key=lambda group: (-weights[group], -len(groups[group]), group))
+    for group in unassigned:
+        entry_id = min(entry_ids, key=lambda eid: (loads[eid], len(shards[eid]), eid))
+        shards[entry_id].extend(groups[group])
+        loads[entry_id] += weights[group]
+        new_assignments[group] = entry_id
+
+    return (
+        {entry_id: sorted(members) for entry_id, members in shards.items()},
+        new_assignments,
+    )
+
+
+def build_bridge_filter(view: RegistryView, filter_config: dict[str, Any]) -> dict[str, list[str]]:
+    """Map a Voice Assistant Manager filter config to a HomeKit entity filter.
+
+    Each exposed domain is written the cheaper way, as in
+    optimize_filter_config: as an include_domains entry when 1 + the
+    exclude_entities it needs is less than the number of entities it
+    exposes, otherwise as include_entities (a listed domain only picks up
+    new entities on the next sync). Entities are otherwise only listed
+    where the domains alone are wrong: include_entities for entities
+    outside the included domains (explicit or device selections,
+    re-included overrides) and exclude_entities for entities inside them.
+    Entities outside HOMEKIT_SUPPORTED_DOMAINS are left out.
+
+    Args:
+        view: Registry view used to expand devices and size domains.
+        filter_config: Voice Assistant Manager filter config.
+
+    Returns:
+        Dict with all HOMEKIT_FILTER_KEYS as sorted lists.
+    """
+    filter_mode = filter_config.get("filter_mode", FILTER_MODE_EXCLUDE)
+    vm_domains = set(filter_config.get("domains", []))
+    vm_overrides = set(filter_config.get("overrides", []))
+    matched = set(filter_config.get("entities", [])) | view.entities_of_devices(
+        filter_config.get("devices", [])
+    )
+
+    if filter_mode == FILTER_MODE_EXCLUDE:
+        # All supported domains except the excluded ones; matched entities
+        # are hidden and overrides in excluded domains are added back
+        include_domains = HOMEKIT_SUPPORTED_DOMAINS - vm_domains
+        exclude_entities = matched - vm_overrides
+        include_entities = _in_domains(vm_overrides, vm_domains)
+    else:
+        # Exactly the selected domains plus the selected entities; overrides
+        # are hidden
+        include_domains = vm_domains & HOMEKIT_SUPPORTED_DOMAINS
+        exclude_entities = vm_overrides
+        include_entities = matched - vm_overrides
+
+    exclude_entities = _in_domains(exclude_entities, include_domains)
+    include_entities = _in_domains(
+        include_entities, HOMEKIT_SUPPORTED_DOMAINS - include_domains
+    )
+
+    for domain in sorted(include_domains):
+        members = set(view.by_domain.get(domain, ()))
+        exclusions = _in_domains(exclude_entities, {domain})
+        exposed = members - exclusions
+        if 1 + len(exclusions) < len(exposed):
+            continue
+        # Listing the domain's entities is no larger than the domain rule
+        include_domains = include_domains - {domain}
+        exclude_entities -= exclusions
+        include_entities |= exposed
+
+    if not (include_domains or include_entities):
+        return expose_nothing_filter(view)
+
+    return {
+        "include_domains": sorted(include_domains),
+        "include_entities": sorted(include_entities),
+        "exclude_domains": [],
+        "exclude_entities": sorted(exclude_entities),
+    }
+
+
+def _in_domains(entity_ids: set[str], domains: set[str] | frozenset[str]) -> set[str]:
+    """Return the entity IDs that belong to one of the given domains."""
+    return {entity_id for entity_id in entity_ids if entity_id.split(".")[0] in domains}
+
+
+def expose_nothing_filter(view: RegistryView) -> dict[str, list[str]]:
+    """Return a HomeKit filter that exposes no current entity.
+
+    An entity filter without any include exposes everything, so an empty
+    selection is expressed by excluding every domain in the registry.
+    """
+    return {
+        "include_domains": [],
+        "include_entities": [],
+        "exclude_domains": sorted(view.by_domain),
+        "exclude_entities": [],
+    }
+
+
+def homekit_filter_entities(view: RegistryView, entity_filter: dict[str, Any]) -> set[str]:
+    """Return the supported entities a HomeKit entity filter exposes.
+
+    Follows the rules of Home Assistant's entity filter: without any
+    include, everything not excluded passes; include_entities always pass;
+    include_domains pass unless the entity is excluded.
+
+    Args:
+        view: Registry view of the enabled entities.
+        entity_filter: HomeKit filter (include/exclude domains/entities).
+
+    Returns:
+        Set of exposed entity IDs within HOMEKIT_SUPPORTED_DOMAINS.
+    """
+    universe = view.entities_in_domains(HOMEKIT_SUPPORTED_DOMAINS)
+    include_domains = set(entity_filter.get("include_domains") or [])
+    include_entities = set(entity_filter.get("include_entities") or [])
+    exclude_domains = set(entity_filter.get("exclude_domains") or [])
+    exclude_entities = set(entity_filter.get("exclude_entities") or [])
+
+    if not (include_domains or include_entities):
+        return {
+            entity_id for entity_id in universe
+            if entity_id not in exclude_entities
+            and entity_id.split(".")[0] not in exclude_domains
+        }
+
+    exposed = include_entities & universe
+    if include_domains:
+        exposed |= (
+            view.entities_in_domains(include_domains & HOMEKIT_SUPPORTED_DOMAINS)
+            - exclude_entities
+        )
+    elif exclude_domains:
+        exposed |= {
+            entity_id for entity_id in universe
+            if entity_id.split(".")[0] not in exclude_domains
+            and entity_id not in exclude_entities
+        }
+    return exposed
+
+
+def estimate_homekit_accessories(view: RegistryView, entity_filter: dict[str, Any]) -> int:
+    """Estimate how many accessories a bridge with this filter would create.
+
+    HomeKit skips hidden and config/diagnostic entities unless they are
+    explicitly included, and creates no accessory for entities without a
+    matching accessory type (see creates_homekit_accessory), so those are
+    not counted.
+    """
+    include_entities = set(entity_filter.get("include_entities") or [])
+    exposed = homekit_filter_entities(view, entity_filter) - view.no_accessory
+    return len(exposed - (view.auxiliary - include_entities))
+
+
+def accessory_status(accessories: int) -> str:
+    """Classify an accessory count against the HomeKit bridge limit."""
+    if accessories > HOMEKIT_MAX_ACCESSORIES:
+        return ACCESSORIES_OVER
+    if accessories >= HOMEKIT_ACCESSORY_WARNING:
+        return ACCESSORIES_WARNING
+    return ACCESSORIES_OK
+
+
+def _bridge_estimate(bridge: dict[str, Any]) -> dict[str, Any]:
+    """Return the accessory estimate fields of a planned bridge."""
+    return {
+        key: bridge[key]
+        for key in ("entry_id", "title", "accessories", "limit", "status")
+    }
+
+
+def _check_accessory_budget(plan: dict[str, Any]) -> tuple[str | None, list[str]]:
+    """Check a sync plan against the HomeKit accessory limit.
+
+    Only a bridge that would go over the limit with more accessories than
+    it has now blocks the sync. A bridge that is already over and does not
+    grow only warns, so syncs that reduce exposure are never refused.
+
+    Returns:
+        Tuple of (error if a bridge would newly exceed the limit, else None;
+        warnings for bridges close to or still over it).
+    """
+    error = None
+    over = [bridge for bridge in plan["bridges"] if bridge["status"] == ACCESSORIES_OVER]
+    growing = [
+        bridge for bridge in over
+        if bridge["accessories"] > bridge["accessories_before"]
+    ]
+    if growing:
+        error = (
+            "Sync would exceed the HomeKit limit of "
+            f"{HOMEKIT_MAX_ACCESSORIES} accessories: "
+            + ", ".join(f"{bridge['title']} ({bridge['accessories']})" for bridge in growing)
+        )
+
+    warnings = [
+        f"HomeKit bridge {bridge['title']} is close to the accessory limit "
+        f"({bridge['accessories']}/{HOMEKIT_MAX_ACCESSORIES})"
+        for bridge in plan["bridges"]
+        if bridge["status"] == ACCESSORIES_WARNING
+    ] + [
+        f"HomeKit bridge {bridge['title']} stays over the accessory limit "
+        f"({bridge['accessories']}/{HOMEKIT_MAX_ACCESSORIES})"
+        for bridge in over
+        if bridge not in growing
+    ]
+    return error, warnings
+
 
 class HomeKitManager:
     """Manage HomeKit Bridge configuration through config_entries.
@@ -34,30 +456,49 @@ class HomeKitManager:
     - Finding HomeKit bridge entries
     - Reading bridge configuration
     - Updating bridge configuration
-    - Reloading the integration after changes
+    - Reloading the integration after changes (debounced per bridge)
 
     Attributes:
         hass: Home Assistant instance.
         storage: Voice Assistant Manager storage instance.
+        registry_index: Registry index used to evaluate filters.
+        reload_scheduler: Per-bridge reload scheduler.
     """
 
-    def __init__(self, hass: HomeAssistant, storage: VoiceManagerStorage) -> None:
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        storage: VoiceManagerStorage,
+        registry_index: RegistryIndex,
+    ) -> None:
         """Initialize the HomeKit manager.
 
         Args:
             hass: Home Assistant instance.
             storage: Voice Assistant Manager storage instance.
+            registry_index: Registry index used to evaluate filters.
         """
         self.hass = hass
         self.storage = storage
+        self.registry_index = registry_index
+        self.reload_scheduler = HomeKitReloadScheduler(hass, self._async_write_filter)
+
+    def async_shutdown(self) -> None:
+        """Cancel scheduled bridge reloads."""
+        self.reload_scheduler.async_shutdown()
 
-    def get_homekit_bridges(self) -> list[dict[str, Any]]:
+    def get_homekit_bridges(self, with_reload: bool = True) -> list[dict[str, Any]]:
         """Get all HomeKit bridge entries (mode=bridge, not accessory).
 
         Only returns entries from the 'homekit' integration that are configured
         as bridges (not accessory mode). This excludes Apple TV and other
         HomeKit-related integrations.
 
+        Args:
+            with_reload: Include each bridge's reload state. It changes
+                without a storage or registry revision, so cached payloads
+                leave it out.
+
         Returns:
             List of bridge info dicts with entry_id, title, port, and config.
         """
@@ -76,14 +517,18 @@ class HomeKitManager:
                 continue
 
             port = data.get("port")
-            bridges.append({
+            bridge = {
                 "entry_id": entry.entry_id,
                 "title": entry.title,
                 "port": port,
                 "name": data.get("name", entry.title),
                 "include_domains": options.get("filter", {}).get("include_domains", []),
+                "include_entities": options.get("filter", {}).get("include_entities", []),
                 "exclude_entities": options.get("filter", {}).get("exclude_entities", []),
-            })
+            }
+            if with_reload:
+                bridge["reload"] = self.reload_scheduler.async_get_state(entry.entry_id)
+            bridges.append(bridge)
 
         return bridges
 
@@ -121,16 +566,32 @@ class HomeKitManager:
         entry_id: str,
         include_domains: list[str] | None = None,
         exclude_entities: list[str] | None = None,
-    ) -> None:
-        """Update HomeKit bridge configuration and reload.
+        include_entities: list[str] | None = None,
+        exclude_domains: list[str] | None = None,
+        trace: Trace | None = None,
+    ) -> dict[str, Any] | None:
+        """Schedule a HomeKit bridge filter update.
+
+        The filter is buffered and written by the reload scheduler once
+        the debounce window has passed, while the bridge is unloaded, so
+        several updates in quick succession write the options once and
+        restart the bridge only once. Nothing is scheduled if the
+        resulting filter equals the one already written or buffered
+        (ignoring order and duplicates).
 
         Args:
             entry_id: The config entry ID.
             include_domains: Domains to expose (HomeKit whitelist).
             exclude_entities: Entities to exclude from exposed domains.
+            include_entities: Entities to expose regardless of domain.
+            exclude_domains: Domains to hide.
+            trace: Optional trace receiving the homekit.reload_schedule stage.
+
+        Returns:
+            The bridge's reload queue state, or None if nothing changed.
 
         Raises:
-            HomeKitError: If the entry is not found or update fails.
+            HomeKitError: If the entry is not found or is not a HomeKit entry.
         """
         entry = self.hass.config_entries.async_get_entry(entry_id)
         if entry is None:
@@ -139,124 +600,362 @@ class HomeKitManager:
         if entry.domain != HOMEKIT_DOMAIN:
             raise HomeKitError(f"Entry {entry_id} is not a HomeKit entry")
 
-        # Get current options
-        current_options = dict(entry.options) if entry.options else {}
-        current_filter = dict(current_options.get("filter", {}))
+        # Build on the filter still waiting to be written, if any
+        written_filter = (entry.options or {}).get("filter", {})
+        pending_filter = self.reload_scheduler.async_get_pending_filter(entry_id)
+        current_filter = dict(pending_filter if pending_filter is not None else written_filter)
 
         # Update filter
         if include_domains is not None:
             current_filter["include_domains"] = include_domains
         if exclude_entities is not None:
             current_filter["exclude_entities"] = exclude_entities
+        if include_entities is not None:
+            current_filter["include_entities"] = include_entities
+        if exclude_domains is not None:
+            current_filter["exclude_domains"] = exclude_domains
+
+        new_filter = normalize_homekit_filter(current_filter)
+        if pending_filter is None and new_filter == normalize_homekit_filter(written_filter):
+            # The bridge already has this filter: adopt it as the baseline
+            await self.storage.async_set_homekit_synced_filter(entry_id, new_filter)
+            _LOGGER.debug("HomeKit bridge %s filter unchanged, skipping update", entry.title)
+            return None
+        if pending_filter is not None and new_filter == normalize_homekit_filter(pending_filter):
+            _LOGGER.debug("HomeKit bridge %s filter update already scheduled", entry.title)
+            return None
 
-        # Preserve include_entities and exclude_domains (we only manage domains and entity exclusions)
-        new_options = {
-            **current_options,
-            "filter": current_filter,
-        }
+        # Written (and the bridge restarted) once the debounce window
+        # passed; the scheduler's watchdog handles a busy port or a hang
+        with trace_span(trace, "homekit.reload_schedule"):
+            reload_state = self.reload_scheduler.async_schedule(entry_id, current_filter)
+        _LOGGER.info("HomeKit bridge %s update scheduled", entry.title)
+        return reload_state
 
-        # Update the entry
+    async def _async_write_filter(self, entry_id: str, entity_filter: dict[str, Any]) -> None:
+        """Write a filter to a bridge entry (called by the reload scheduler).
+
+        Raises:
+            HomeKitError: If the entry is gone or the update fails.
+        """
+        entry = self.hass.config_entries.async_get_entry(entry_id)
+        if entry is None:
+            raise HomeKitError(f"HomeKit entry not found: {entry_id}")
+
+        # Record what we write before writing it, so the config entry
+        # update event is not mistaken for an outside edit (drift)
+        previous_synced = self.storage.get_homekit_synced_filters().get(entry_id)
+        await self.storage.async_set_homekit_synced_filter(
+            entry_id, normalize_homekit_filter(entity_filter)
+        )
+
+        # Preserve the other options (mode, devices, entity_config, ...)
         try:
             self.hass.config_entries.async_update_entry(
                 entry,
-                options=new_options,
+                options={**(entry.options or {}), "filter": entity_filter},
             )
             _LOGGER.info("Updated HomeKit bridge %s configuration", entry.title)
         except Exception as err:
+            # Nothing was written, so the bridge still matches the old baseline
+            await self.storage.async_set_homekit_synced_filter(entry_id, previous_synced)
             raise HomeKitError(f"Failed to update HomeKit entry: {err}") from err
 
-        # Schedule reload in background so callers don't block waiting for HomeKit
-        # to restart (which can hang if the port is temporarily in use)
-        self.hass.async_create_task(
-            self.hass.config_entries.async_reload(entry_id),
-            "voice_assistant_manager_homekit_reload",
-        )
-        _LOGGER.info("HomeKit bridge %s reload scheduled", entry.title)
-            # Don't raise - config was saved, reload might fail temporarily
+    def _get_filter_config(self) -> dict[str, Any]:
+        """Return the Voice Assistant Manager filter config used for HomeKit."""
+        assistant_key = "homekit" if self.storage.mode != "linked" else None
+        return self.storage.get_filter_config(assistant_key)
 
-    async def async_sync_from_voice_assistant_manager(self) -> dict[str, Any]:
-        """Sync Voice Assistant Manager filter config to HomeKit bridge.
+    def plan_sync(self) -> dict[str, Any]:
+        """Compute the filter each managed bridge would get, without applying it.
 
-        Reads the Voice Assistant Manager homekit_filter_config and applies it
-        to the selected HomeKit bridge.
+        Returns:
+            Dict with sharded, assignments (sharded only, else None) and
+            bridges: one dict per bridge with entry_id, title, update (the
+            filter keys to write), accessories, accessories_before (the
+            estimate for the bridge's current filter), limit and status.
+
+        Raises:
+            HomeKitError: If no bridge is configured or a bridge is missing.
+        """
+        view = self.registry_index.async_get_view()
+        filter_config = self._get_filter_config()
+        sharding = self.storage.get_homekit_sharding()
+        assignments: dict[str, str] | None = None
+
+        if sharding.get("enabled"):
+            entry_ids = list(sharding.get("entry_ids", []))
+            if not entry_ids:
+                raise HomeKitError("No HomeKit bridges configured for sharding")
+            exposed = view.evaluate_filter(filter_config, HOMEKIT_SUPPORTED_DOMAINS)
+            shards, assignments = compute_shards(
+                view,
+                exposed,
+                entry_ids,
+                sharding.get("key", HOMEKIT_SHARD_KEY_AREA),
+                sharding.get("assignments", {}),
+            )
+            updates = {
+                entry_id: {
+                    "include_domains": [],
+                    "include_entities": shards[entry_id],
+                    "exclude_domains": [],
+                    "exclude_entities": [],
+                } if shards[entry_id] else expose_nothing_filter(view)
+                for entry_id in entry_ids
+            }
+        else:
+            entry_id = self.storage.get_homekit_entry_id()
+            if not entry_id:
+                raise HomeKitError("No HomeKit bridge configured in Voice Assistant Manager")
+            updates = {entry_id: build_bridge_filter(view, filter_config)}
+
+        bridges = []
+        for entry_id, update in updates.items():
+            bridge_config = self.get_bridge_config(entry_id)
+            if bridge_config is None:
+                raise HomeKitError(f"HomeKit bridge {entry_id} not found")
+
+            # Keys we don't manage keep their current value on the bridge
+            current_filter = {key: bridge_config[key] for key in HOMEKIT_FILTER_KEYS}
+            accessories = estimate_homekit_accessories(
+                view, {**current_filter, **update}
+            )
+            bridges.append({
+                "entry_id": entry_id,
+                "title": bridge_config["title"],
+                "update": update,
+                "accessories": accessories,
+                "accessories_before": estimate_homekit_accessories(view, current_filter),
+                "limit": HOMEKIT_MAX_ACCESSORIES,
+                "status": accessory_status(accessories),
+            })
+
+        return {
+            "sharded": bool(sharding.get("enabled")),
+            "assignments": assignments,
+            "bridges": bridges,
+        }
+
+    def estimate_accessories(self) -> list[dict[str, Any]]:
+        """Estimate the accessory count of each managed bridge after a sync.
 
         Returns:
-            Dict with sync result (success, message, details).
+            One dict per bridge with entry_id, title, accessories, limit and
+            status, or an empty list if HomeKit is not configured.
+        """
+        try:
+            plan = self.plan_sync()
+        except HomeKitError:
+            return []
+        return [_bridge_estimate(bridge) for bridge in plan["bridges"]]
+
+    def dry_run_sync(self) -> dict[str, Any]:
+        """Describe what a sync would do without touching any config entry.
+
+        Returns:
+            Dict with sharded, assignments, allowed (False if a bridge would
+            grow past the accessory limit), error, warnings, would_reload and
+            bridges: per bridge the new filter, the diff against the
+            current one (added/removed per changed key), the accessory
+            estimate before and after, whether it would be reloaded and
+            its drift (outside edits a sync would overwrite, or None).
 
         Raises:
-            HomeKitError: If no bridge is configured or sync fails.
+            HomeKitError: If no bridge is configured or a bridge is missing.
         """
-        entry_id = self.storage.get_homekit_entry_id()
-        if not entry_id:
-            raise HomeKitError("No HomeKit bridge configured in Voice Assistant Manager")
+        plan = self.plan_sync()
+        error, warnings = _check_accessory_budget(plan)
+        drift = self.get_drift([bridge["entry_id"] for bridge in plan["bridges"]])
 
-        # Get current bridge config
-        bridge_config = self.get_bridge_config(entry_id)
-        if bridge_config is None:
-            raise HomeKitError(f"HomeKit bridge {entry_id} not found")
+        bridges = []
+        for bridge in plan["bridges"]:
+            bridge_config = self.get_bridge_config(bridge["entry_id"]) or {}
+            current = normalize_homekit_filter(bridge_config)
+            new = normalize_homekit_filter({**current, **bridge["update"]})
+            diff = {
+                key: {
+                    "added": sorted(set(new[key]) - set(current[key])),
+                    "removed": sorted(set(current[key]) - set(new[key])),
+                }
+                for key in HOMEKIT_FILTER_KEYS
+                if new[key] != current[key]
+            }
+            bridges.append({
+                **_bridge_estimate(bridge),
+                "filter": new,
+                "diff": diff,
+                "accessories_before": bridge["accessories_before"],
+                "accessory_delta": bridge["accessories"] - bridge["accessories_before"],
+                "would_reload": bool(diff),
+                "drift": drift.get(bridge["entry_id"]),
+            })
 
-        # Get Voice Assistant Manager filter config
-        assistant_key = "homekit" if self.storage.mode != "linked" else None
-        filter_config = self.storage.get_filter_config(assistant_key)
-
-        filter_mode = filter_config.get("filter_mode", FILTER_MODE_EXCLUDE)
-        vm_domains = set(filter_config.get("domains", []))
-        vm_entities = set(filter_config.get("entities", []))
-        vm_devices = filter_config.get("devices", [])
-        vm_overrides = set(filter_config.get("overrides", []))
-
-        # Expand devices to entities
-        ent_reg = er.async_get(self.hass)
-        device_entities = set()
-        for device_id in vm_devices:
-            for entity in ent_reg.entities.values():
-                if entity.device_id == device_id and not entity.disabled:
-                    device_entities.add(entity.entity_id)
-
-        # HomeKit uses a whitelist model:
-        # - include_domains: domains to expose
-        # - exclude_entities: specific entities to hide from those domains
+        return {
+            "sharded": plan["sharded"],
+            "assignments": plan["assignments"],
+            "allowed": error is None,
+            "error": error,
+            "warnings": warnings,
+            "would_reload": any(bridge["would_reload"] for bridge in bridges),
+            "bridges": bridges,
+        }
 
-        if filter_mode == FILTER_MODE_EXCLUDE:
-            # Exclude mode in VM -> HomeKit uses all supported domains minus excluded
-            # include_domains = HOMEKIT_SUPPORTED_DOMAINS - vm_domains
-            include_domains = list(HOMEKIT_SUPPORTED_DOMAINS - vm_domains)
+    def get_drift(self, entry_ids: list[str]) -> dict[str, dict[str, Any]]:
+        """Return the drift of the given bridges that have any.
 
-            # exclude_entities = vm_entities + device_entities - overrides
-            exclude_entities = (vm_entities | device_entities) - vm_overrides
-            exclude_entities = list(exclude_entities)
-        else:
-            # Include mode in VM -> HomeKit uses exactly the selected domains
-            # But only domains that HomeKit supports
-            include_domains = list(vm_domains & HOMEKIT_SUPPORTED_DOMAINS)
-
-            # In include mode, overrides are entities to EXCLUDE from included domains
-            # exclude_entities = overrides
-            exclude_entities = list(vm_overrides)
-
-            # Note: vm_entities in include mode are explicit inclusions,
-            # but HomeKit doesn't support include_entities well with include_domains
-            # So we just use the domains and let entity-level exclusions work
-
-        # Update HomeKit
-        await self.async_update_bridge_config(
-            entry_id,
-            include_domains=sorted(include_domains),
-            exclude_entities=sorted(exclude_entities),
+        Args:
+            entry_ids: HomeKit entry IDs to check.
+
+        Returns:
+            Drift per entry ID (see compute_drift).
+        """
+        synced = self.storage.get_homekit_synced_filters()
+        drift = {}
+        for entry_id in entry_ids:
+            bridge_config = self.get_bridge_config(entry_id)
+            if bridge_config is None:
+                continue
+            bridge_drift = compute_drift(bridge_config, synced.get(entry_id))
+            if bridge_drift is not None:
+                drift[entry_id] = bridge_drift
+        return drift
+
+    async def async_accept_bridge_filters(self) -> None:
+        """Take the managed bridges' current filters as the synced baseline.
+
+        Used after importing from HomeKit, which adopts outside edits.
+        """
+        for entry_id in managed_entry_ids(self.storage):
+            bridge_config = self.get_bridge_config(entry_id)
+            if bridge_config is not None:
+                await self.storage.async_set_homekit_synced_filter(
+                    entry_id, normalize_homekit_filter(bridge_config)
+                )
+
+    async def async_sync_from_voice_assistant_manager(
+        self, force: bool = False, trace: Trace | None = None
+    ) -> dict[str, Any]:
+        """Sync Voice Assistant Manager filter config to HomeKit bridge.
+
+        Reads the Voice Assistant Manager homekit_filter_config and applies it
+        to the selected HomeKit bridge. When multi-bridge sharding is enabled,
+        every shard bridge instead gets an explicit include_entities list of
+        its share of the exposed entities; bridges are then updated with
+        bounded concurrency. Only changed bridges are reloaded.
+
+        The sync is refused if a bridge would grow past HomeKit's accessory
+        limit, since an overflowing bridge fails at startup, and, unless
+        forced, if a bridge was edited outside Voice Assistant Manager since
+        the last sync.
+
+        Args:
+            force: Overwrite bridges even if they drifted.
+            trace: Optional trace receiving the homekit.plan, storage_save,
+                homekit.update and homekit.reload_schedule stages.
+
+        Returns:
+            Dict with sync result (success, message, details).
+
+        Raises:
+            HomeKitDriftError: If a bridge drifted and force is not set.
+            HomeKitError: If no bridge is configured, a bridge would grow
+                past the accessory limit or sync fails.
+        """
+        with trace_span(trace, "homekit.plan"):
+            plan = self.plan_sync()
+
+            if not force:
+                drift = self.get_drift([bridge["entry_id"] for bridge in plan["bridges"]])
+                if drift:
+                    titles = [
+                        bridge["title"] for bridge in plan["bridges"]
+                        if bridge["entry_id"] in drift
+                    ]
+                    raise HomeKitDriftError(
+                        "HomeKit bridge options were changed outside Voice Assistant "
+                        f"Manager: {', '.join(titles)}. Import them or force the sync.",
+                        drift,
+                    )
+
+            error, warnings = _check_accessory_budget(plan)
+        if error is not None:
+            raise HomeKitError(error)
+        for warning in warnings:
+            _LOGGER.warning(warning)
+
+        if plan["sharded"] and plan["assignments"] != self.storage.get_homekit_sharding().get(
+            "assignments", {}
+        ):
+            with trace_span(trace, "storage_save"):
+                await self.storage.async_set_homekit_shard_assignments(plan["assignments"])
+
+        semaphore = asyncio.Semaphore(HOMEKIT_SYNC_CONCURRENCY)
+
+        async def _async_sync_bridge(bridge: dict[str, Any]) -> dict[str, Any]:
+            """Apply one bridge's planned filter."""
+            async with semaphore:
+                with trace_span(trace, "homekit.update"):
+                    reload_state = await self.async_update_bridge_config(
+                        bridge["entry_id"], **bridge["update"], trace=trace
+                    )
+            return {
+                **_bridge_estimate(bridge),
+                **bridge["update"],
+                "changed": reload_state is not None,
+                "reload": reload_state
+                or self.reload_scheduler.async_get_state(bridge["entry_id"]),
+            }
+
+        results = await asyncio.gather(
+            *(_async_sync_bridge(bridge) for bridge in plan["bridges"])
         )
 
+        changed = [result["title"] for result in results if result["changed"]]
+        accessories = [_bridge_estimate(bridge) for bridge in plan["bridges"]]
+
+        if plan["sharded"]:
+            if changed:
+                message = f"Synced to HomeKit bridges: {', '.join(changed)}"
+            else:
+                message = "HomeKit bridges already up to date"
+            return {
+                "success": True,
+                "changed": bool(changed),
+                "message": message,
+                "sharded": True,
+                "bridges": list(results),
+                "assignments": plan["assignments"],
+                "accessories": accessories,
+                "warnings": warnings,
+            }
+
+        result = results[0]
+        if result["changed"]:
+            message = f"Synced to HomeKit bridge: {result['title']}"
+        else:
+            message = f"HomeKit bridge already up to date: {result['title']}"
+
         return {
             "success": True,
-            "message": f"Synced to HomeKit bridge: {bridge_config['title']}",
-            "include_domains": sorted(include_domains),
-            "exclude_entities": sorted(exclude_entities),
+            "changed": result["changed"],
+            "message": message,
+            "include_domains": result["include_domains"],
+            "include_entities": result["include_entities"],
+            "exclude_entities": result["exclude_entities"],
+            "reload": result["reload"],
+            "accessories": accessories,
+            "warnings": warnings,
         }
 
     async def async_import_from_homekit(self) -> dict[str, Any]:
         """Import current HomeKit configuration into Voice Assistant Manager.
 
         Reads the HomeKit bridge config and imports it into
-        Voice Assistant Manager's homekit_filter_config.
+        Voice Assistant Manager's homekit_filter_config. A bridge that was
+        synced before keeps the stored filter mode, with any outside edits
+        carried over; a bridge that never was gets the mode that describes
+        it with fewer domain rules.
 
         Returns:
             Dict with import result.
@@ -274,23 +973,51 @@ class HomeKitManager:
 
         hk_include_domains = set(bridge_config.get("include_domains", []))
         hk_exclude_entities = set(bridge_config.get("exclude_entities", []))
+        hk_include_entities = set(bridge_config.get("include_entities", []))
+        assistant_key = "homekit" if self.storage.mode != "linked" else None
 
-        # Determine filter mode based on HomeKit config
-        # If include_domains contains most supported domains, it's likely exclude mode
-        if len(hk_include_domains) >= len(HOMEKIT_SUPPORTED_DOMAINS) - 3:
-            # Looks like exclude mode (most domains included)
+        baseline = self.storage.get_homekit_synced_filters().get(entry_id)
+        drift = compute_drift(bridge_config, baseline)
+        if not (hk_include_domains or hk_include_entities):
+            # Without includes HomeKit exposes everything not excluded
             filter_mode = FILTER_MODE_EXCLUDE
+            hk_include_domains = HOMEKIT_SUPPORTED_DOMAINS - set(
+                bridge_config.get("exclude_domains", [])
+            )
+        elif baseline is not None:
+            # The bridge was written by a sync from the stored config, so
+            # keep its mode; outside edits (drift) are translated into it
+            filter_mode = self.storage.get_filter_config(assistant_key).get(
+                "filter_mode", FILTER_MODE_EXCLUDE
+            )
+        else:
+            # Never synced: pick the mode that needs fewer domain rules
+            # (both map the bridge's entity lists one to one)
+            excluded_domains = HOMEKIT_SUPPORTED_DOMAINS - hk_include_domains
+            filter_mode = (
+                FILTER_MODE_EXCLUDE
+                if len(excluded_domains) < len(hk_include_domains & HOMEKIT_SUPPORTED_DOMAINS)
+                else FILTER_MODE_INCLUDE
+            )
+
+        if filter_mode == FILTER_MODE_EXCLUDE:
             # Excluded domains = SUPPORTED - included
             vm_domains = list(HOMEKIT_SUPPORTED_DOMAINS - hk_include_domains)
             vm_entities = list(hk_exclude_entities)
-            vm_overrides = []  # Can't determine overrides from HK config
+            # Entities listed outside the included domains re-include them
+            vm_overrides = list(hk_include_entities)
         else:
-            # Looks like include mode (selective domains)
-            filter_mode = FILTER_MODE_INCLUDE
             vm_domains = list(hk_include_domains)
-            vm_entities = []
+            vm_entities = list(hk_include_entities)
             vm_overrides = list(hk_exclude_entities)  # Exclusions become overrides
 
+        if drift:
+            _LOGGER.info(
+                "Importing outside edits of HomeKit bridge %s: %s",
+                bridge_config["title"],
+                ", ".join(sorted(drift)),
+            )
+
         # Build filter config
         filter_config = {
             "filter_mode": filter_mode,
@@ -301,7 +1028,6 @@ class HomeKitManager:
         }
 
         # Save to storage
-        assistant_key = "homekit" if self.storage.mode != "linked" else None
         await self.storage.async_set_filter_config(filter_config, assistant_key)
 
         return {
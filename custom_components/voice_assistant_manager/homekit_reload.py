@@ -0,0 +1,400 @@
+"""HomeKit Bridge reload scheduling for Voice Assistant Manager integration.
+
+Reloading a HomeKit Bridge restarts its HAP server, which takes several
+seconds and drops every accessory in the Home app until it is back. This
+module coalesces filter updates per bridge: the latest filter requested
+within a short debounce window is applied in one reload, and a bridge is
+never reloaded while a reload of it is still running.
+
+HomeKit reloads its entry from an update listener whenever the entry's
+options change, so the options are not written while the bridge runs.
+A reload is an unload (which drops HomeKit's listener), the options
+write, a pre-flight check that the bridge's port can be bound again, and
+a setup; that is the only restart the bridge goes through. Once unloaded, a bridge is always set up again,
+even if the port stays busy, so Home Assistant's own setup retry can take
+over. A watchdog reports attempts that run past a timeout and retries
+failed attempts with backoff. It never cancels the config entry operation
+itself, since an unload or setup interrupted half-way can leave the entry
+in a state later reloads cannot recover from.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import socket
+import time
+from collections.abc import Awaitable, Callable
+from datetime import datetime
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    HOMEKIT_PORT_CHECK_ATTEMPTS,
+    HOMEKIT_PORT_CHECK_INTERVAL,
+    HOMEKIT_RELOAD_ATTEMPTS,
+    HOMEKIT_RELOAD_BACKOFF,
+    HOMEKIT_RELOAD_DEBOUNCE,
+    HOMEKIT_RELOAD_TIMEOUT,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+RELOAD_OUTCOME_SUCCESS = "success"
+RELOAD_OUTCOME_FAILED = "failed"
+RELOAD_OUTCOME_TIMEOUT = "timeout"
+
+# Writes a buffered filter to an (unloaded) bridge entry
+FilterWriter = Callable[[str, dict[str, Any]], Awaitable[None]]
+
+
+def is_port_available(port: int) -> bool:
+    """Check whether a TCP port can be bound locally.
+
+    Blocking; run in the executor.
+
+    Args:
+        port: The port to check.
+
+    Returns:
+        True if the port could be bound.
+    """
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        # Same option the HAP server uses, so TIME_WAIT sockets don't count
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        try:
+            sock.bind(("", port))
+        except OSError:
+            return False
+    return True
+
+
+class BridgeReloadState:
+    """Reload queue state of one bridge.
+
+    Attributes:
+        entry_id: HomeKit config entry ID.
+        running: True while a reload is in progress.
+        pending: True if another reload was requested while running.
+        pending_filter: Latest requested filter not yet written to the entry.
+        requested: Number of reload requests received.
+        coalesced: Number of requests merged into another reload.
+        completed: Number of reloads actually performed.
+        failed: Number of reloads that failed after all attempts.
+        timeouts: Number of attempts that overran the watchdog timeout.
+        last_reload: Time the last reload finished.
+        last_error: Error of the last failed reload.
+        last_outcome: Outcome of the last reload (success, failed), or
+            timeout while an attempt runs past the watchdog timeout.
+        last_duration: Duration of the last reload in seconds.
+        last_attempts: Number of attempts the last reload took.
+        started: Monotonic start time of the running reload.
+    """
+
+    def __init__(self, entry_id: str) -> None:
+        """Initialize the state."""
+        self.entry_id = entry_id
+        self.cancel_debounce: Callable[[], None] | None = None
+        self.running = False
+        self.pending = False
+        self.pending_filter: dict[str, Any] | None = None
+        self.requested = 0
+        self.coalesced = 0
+        self.completed = 0
+        self.failed = 0
+        self.timeouts = 0
+        self.last_reload: datetime | None = None
+        self.last_error: str | None = None
+        self.last_outcome: str | None = None
+        self.last_duration: float | None = None
+        self.last_attempts = 0
+        self.started: float | None = None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the queue state for API responses."""
+        return {
+            "scheduled": self.cancel_debounce is not None,
+            "running": self.running,
+            "pending": self.pending,
+            "update_pending": self.pending_filter is not None,
+            "requested": self.requested,
+            "completed": self.completed,
+            "coalesced": self.coalesced,
+            "failed": self.failed,
+            "timeouts": self.timeouts,
+            "running_for": (
+                round(time.monotonic() - self.started, 1)
+                if self.running and self.started is not None
+                else None
+            ),
+            "last_reload": self.last_reload.isoformat() if self.last_reload else None,
+            "last_error": self.last_error,
+            "last_outcome": self.last_outcome,
+            "last_duration": self.last_duration,
+            "last_attempts": self.last_attempts,
+        }
+
+
+class HomeKitReloadScheduler:
+    """Debounce and serialize HomeKit Bridge filter updates per bridge.
+
+    Attributes:
+        hass: Home Assistant instance.
+    """
+
+    def __init__(self, hass: HomeAssistant, write_filter: FilterWriter) -> None:
+        """Initialize the scheduler.
+
+        Args:
+            hass: Home Assistant instance.
+            write_filter: Coroutine function writing a filter to a bridge
+                entry; called while the bridge is unloaded.
+        """
+        self.hass = hass
+        self._write_filter = write_filter
+        self._bridges: dict[str, BridgeReloadState] = {}
+
+    @callback
+    def async_schedule(self, entry_id: str, entity_filter: dict[str, Any]) -> dict[str, Any]:
+        """Request a filter update of a bridge.
+
+        The filter is written and the bridge reloaded once no further
+        request arrived for HOMEKIT_RELOAD_DEBOUNCE seconds; a later
+        request replaces the buffered filter. If the bridge is reloading
+        right now, one more reload is queued to run after it.
+
+        Args:
+            entry_id: HomeKit config entry ID.
+            entity_filter: The bridge's new options["filter"].
+
+        Returns:
+            The bridge's reload queue state.
+        """
+        state = self._bridges.setdefault(entry_id, BridgeReloadState(entry_id))
+        state.requested += 1
+        state.pending_filter = entity_filter
+
+        if state.pending or state.cancel_debounce is not None:
+            state.coalesced += 1
+
+        if state.running:
+            state.pending = True
+        else:
+            self._async_start_debounce(state)
+
+        return state.as_dict()
+
+    @callback
+    def async_get_pending_filter(self, entry_id: str) -> dict[str, Any] | None:
+        """Return the filter buffered for a bridge, if any."""
+        state = self._bridges.get(entry_id)
+        return state.pending_filter if state is not None else None
+
+    @callback
+    def async_get_state(self, entry_id: str) -> dict[str, Any]:
+        """Return the reload queue state of a bridge."""
+        state = self._bridges.get(entry_id) or BridgeReloadState(entry_id)
+        return state.as_dict()
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Cancel all debounced reloads (running reloads finish on their own).
+
+        Buffered filters that were not written yet are dropped.
+        """
+        for state in self._bridges.values():
+            if state.cancel_debounce is not None:
+                state.cancel_debounce()
+                state.cancel_debounce = None
+            state.pending = False
+            state.pending_filter = None
+
+    @callback
+    def _async_start_debounce(self, state: BridgeReloadState) -> None:
+        """(Re)start the debounce timer of a bridge."""
+        if state.cancel_debounce is not None:
+            state.cancel_debounce()
+
+        @callback
+        def _async_debounced(_now: datetime) -> None:
+            """Start the reload once the debounce window has passed."""
+            state.cancel_debounce = None
+            state.running = True
+            self.hass.async_create_task(
+                self._async_reload(state),
+                f"voice_assistant_manager_homekit_reload_{state.entry_id}",
+            )
+
+        state.cancel_debounce = async_call_later(
+            self.hass, HOMEKIT_RELOAD_DEBOUNCE, _async_debounced
+        )
+
+    async def _async_reload(self, state: BridgeReloadState) -> None:
+        """Apply a bridge's buffered filter under the watchdog.
+
+        Each attempt runs in its own task. If it is still running after
+        HOMEKIT_RELOAD_TIMEOUT it is reported as a timeout, but left to
+        finish instead of being cancelled (and waited for, so no other
+        reload of the bridge overlaps it); its result then counts like any
+        other attempt. Failed attempts are retried after an increasing
+        delay. Outcome, duration and attempt count are recorded on the
+        bridge state. Afterwards the queued reload, if any, is started.
+        """
+        entry = self.hass.config_entries.async_get_entry(state.entry_id)
+        if state.pending_filter is None or (
+            entry is not None and (entry.options or {}).get("filter") == state.pending_filter
+        ):
+            # Already written by an earlier reload, or reverted since
+            _LOGGER.debug("HomeKit bridge %s filter already applied", state.entry_id)
+            state.pending_filter = None
+            self._async_finish(state)
+            return
+
+        state.started = time.monotonic()
+        state.last_attempts = 0
+        outcome = RELOAD_OUTCOME_FAILED
+
+        for attempt in range(HOMEKIT_RELOAD_ATTEMPTS):
+            if attempt:
+                await asyncio.sleep(HOMEKIT_RELOAD_BACKOFF * 2 ** (attempt - 1))
+            state.last_attempts = attempt + 1
+            task = self.hass.async_create_task(
+                self._async_reload_once(state),
+                f"voice_assistant_manager_homekit_reload_attempt_{state.entry_id}",
+            )
+            done, _ = await asyncio.wait({task}, timeout=HOMEKIT_RELOAD_TIMEOUT)
+            if not done:
+                # The unload/setup is still running and must not be
+                # interrupted; report it and wait for its real result
+                state.timeouts += 1
+                state.last_outcome = RELOAD_OUTCOME_TIMEOUT
+                state.last_error = (
+                    f"reload did not finish within {HOMEKIT_RELOAD_TIMEOUT:.0f}s"
+                )
+                _LOGGER.warning(
+                    "HomeKit bridge %s reload still running after %.0fs",
+                    state.entry_id,
+                    HOMEKIT_RELOAD_TIMEOUT,
+                )
+                await asyncio.wait({task})
+
+            if task.cancelled():
+                err: BaseException | None = RuntimeError("reload was cancelled")
+            else:
+                err = task.exception()
+            if err is None:
+                outcome = RELOAD_OUTCOME_SUCCESS
+                state.last_error = None
+                break
+            outcome = RELOAD_OUTCOME_FAILED
+            state.last_error = str(err)
+            _LOGGER.warning(
+                "HomeKit bridge %s reload attempt %d/%d failed: %s",
+                state.entry_id,
+                attempt + 1,
+                HOMEKIT_RELOAD_ATTEMPTS,
+                state.last_error,
+            )
+
+        state.last_reload = dt_util.utcnow()
+        state.last_outcome = outcome
+        state.last_duration = round(time.monotonic() - state.started, 2)
+
+        if outcome == RELOAD_OUTCOME_SUCCESS:
+            state.completed += 1
+            _LOGGER.info(
+                "HomeKit bridge %s reloaded in %.1fs", state.entry_id, state.last_duration
+            )
+        else:
+            state.failed += 1
+            _LOGGER.error(
+                "Failed to reload HomeKit bridge %s after %d attempts: %s",
+                state.entry_id,
+                state.last_attempts,
+                state.last_error,
+            )
+
+        self._async_finish(state)
+
+    @callback
+    def _async_finish(self, state: BridgeReloadState) -> None:
+        """Mark a bridge's reload as done and start the queued one."""
+        state.running = False
+        state.started = None
+
+        if state.pending:
+            state.pending = False
+            self._async_start_debounce(state)
+
+    async def _async_reload_once(self, state: BridgeReloadState) -> None:
+        """Unload a bridge, write its filter, wait for its port, set it up.
+
+        The filter is written while the bridge is unloaded, so HomeKit's
+        own update listener does not restart it a second time. Setup is
+        attempted whenever the unload succeeded, even if the port is still
+        busy: a bridge left unloaded stays down until Home Assistant
+        restarts, while a failed setup is retried by Home Assistant itself.
+
+        Raises:
+            RuntimeError: If the entry is gone or unload/setup did not complete.
+        """
+        entry_id = state.entry_id
+        entry = self.hass.config_entries.async_get_entry(entry_id)
+        if entry is None:
+            raise RuntimeError("config entry no longer exists")
+
+        if not await self.hass.config_entries.async_unload(entry_id):
+            raise RuntimeError("unload did not complete")
+
+        write_error = None
+        entity_filter = state.pending_filter
+        if entity_filter is not None:
+            try:
+                await self._write_filter(entry_id, entity_filter)
+            except Exception as err:
+                write_error = err
+            else:
+                # A newer filter may have been buffered meanwhile
+                if state.pending_filter is entity_filter:
+                    state.pending_filter = None
+
+        port_error = None
+        port = (entry.data or {}).get("port")
+        if port:
+            try:
+                await self._async_wait_for_port(entry_id, port)
+            except Exception as err:
+                port_error = err
+                _LOGGER.warning(
+                    "HomeKit bridge %s: %s, setting it up anyway", entry_id, err
+                )
+
+        if not await self.hass.config_entries.async_setup(entry_id):
+            if port_error is not None:
+                raise RuntimeError(f"setup did not complete ({port_error})")
+            raise RuntimeError("setup did not complete")
+        if write_error is not None:
+            raise RuntimeError(f"options were not written: {write_error}")
+
+    async def _async_wait_for_port(self, entry_id: str, port: int) -> None:
+        """Wait until the bridge's port can be bound again.
+
+        The HAP server may take a moment to release the port after unload;
+        setting up before that makes the bridge fail or hang at startup.
+
+        Raises:
+            RuntimeError: If the port is still in use after all checks.
+        """
+        for check in range(HOMEKIT_PORT_CHECK_ATTEMPTS):
+            if await self.hass.async_add_executor_job(is_port_available, port):
+                return
+            _LOGGER.debug(
+                "HomeKit bridge %s port %s still in use (check %d)",
+                entry_id,
+                port,
+                check + 1,
+            )
+            await asyncio.sleep(HOMEKIT_PORT_CHECK_INTERVAL * 2**check)
+        raise RuntimeError(f"port {port} is still in use")
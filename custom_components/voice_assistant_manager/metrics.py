@@ -0,0 +1,346 @@
+"""Runtime metrics for Voice Assistant Manager integration.
+
+Keeps cheap in-process counters of where time goes: latency, request size
+and reply size histograms per websocket command, cache hit rates and the
+number of full registry walks. Everything is reported through diagnostics,
+so slow installs can be investigated without attaching a profiler.
+Multi-stage commands can also break their own run time down with a Trace.
+"""
+from __future__ import annotations
+
+import time
+from bisect import bisect_left
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from contextvars import ContextVar
+from functools import wraps
+from typing import Any
+
+from homeassistant.components import websocket_api
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.json import json_bytes
+
+from .const import (
+    DOMAIN,
+    METRICS_LATENCY_BUCKETS_MS,
+    METRICS_PAYLOAD_BUCKETS_BYTES,
+    METRICS_SIZE_SAMPLE_EVERY,
+)
+
+AsyncCommandHandler = Callable[
+    [HomeAssistant, websocket_api.ActiveConnection, dict[str, Any]], Awaitable[None]
+]
+
+
+# Child time of the innermost open span in the current task
+_active_span: ContextVar[list[float] | None] = ContextVar("_active_span", default=None)
+
+
+class Histogram:
+    """Fixed-bucket histogram.
+
+    Attributes:
+        bounds: Inclusive upper bounds of the buckets; values above the last
+            bound go to an open-ended bucket.
+        count: Number of recorded values.
+        total: Sum of recorded values.
+        max: Largest recorded value.
+    """
+
+    def __init__(self, bounds: tuple[float, ...]) -> None:
+        """Initialize the histogram.
+
+        Args:
+            bounds: Ascending bucket upper bounds.
+        """
+        self.bounds = bounds
+        self.buckets = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, value: float) -> None:
+        """Add a value."""
+        self.buckets[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the histogram with buckets labelled by their upper bound."""
+        labels = [f"<={bound}" for bound in self.bounds] + [f">{self.bounds[-1]}"]
+        return {
+            "count": self.count,
+            "mean": round(self.total / self.count, 3) if self.count else None,
+            "max": round(self.max, 3),
+            "buckets": dict(zip(labels, self.buckets, strict=True)),
+        }
+
+
+class CommandMetrics:
+    """Latency, message sizes and error count of one websocket command.
+
+    Sizes that would need an extra JSON encoding (requests, and replies not
+    sent pre-encoded) are only measured for sampled calls, so the size
+    histograms may count fewer calls than the latency one.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the command metrics."""
+        self.calls = 0
+        self.latency_ms = Histogram(METRICS_LATENCY_BUCKETS_MS)
+        self.request_bytes = Histogram(METRICS_PAYLOAD_BUCKETS_BYTES)
+        self.payload_bytes = Histogram(METRICS_PAYLOAD_BUCKETS_BYTES)
+        self.errors = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the metrics for diagnostics."""
+        return {
+            "calls": self.calls,
+            "latency_ms": self.latency_ms.as_dict(),
+            "request_bytes": self.request_bytes.as_dict(),
+            "payload_bytes": self.payload_bytes.as_dict(),
+            "errors": self.errors,
+        }
+
+
+class IntegrationMetrics:
+    """In-process metrics of the integration.
+
+    Storage save statistics, lock waits and the preview cache keep their own
+    counters; this class holds what has no natural owner.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the metrics."""
+        self._started = time.monotonic()
+        self._commands: dict[str, CommandMetrics] = {}
+        self._caches: dict[str, dict[str, int]] = {}
+        self._registry_scans: dict[str, int] = {}
+
+    def sample_sizes(self, command: str) -> bool:
+        """Return whether the next call of a command has its sizes measured.
+
+        Args:
+            command: Command name without the integration prefix.
+        """
+        metrics = self._commands.get(command)
+        return metrics is None or metrics.calls % METRICS_SIZE_SAMPLE_EVERY == 0
+
+    def record_command(
+        self,
+        command: str,
+        duration: float,
+        payload_bytes: int | None,
+        success: bool,
+        request_bytes: int | None = None,
+    ) -> None:
+        """Record one handled websocket command.
+
+        Args:
+            command: Command name without the integration prefix.
+            duration: Handler run time in seconds.
+            payload_bytes: Size of the JSON reply, or None if not measured.
+            success: False if the command sent an error or raised.
+            request_bytes: Size of the JSON request, or None if not measured.
+        """
+        metrics = self._commands.get(command)
+        if metrics is None:
+            metrics = self._commands[command] = CommandMetrics()
+        metrics.calls += 1
+        metrics.latency_ms.record(duration * 1000)
+        if request_bytes is not None:
+            metrics.request_bytes.record(request_bytes)
+        if payload_bytes is not None:
+            metrics.payload_bytes.record(payload_bytes)
+        if not success:
+            metrics.errors += 1
+
+    def record_cache(self, cache: str, hit: bool) -> None:
+        """Record a cache lookup."""
+        stats = self._caches.setdefault(cache, {"hits": 0, "misses": 0})
+        stats["hits" if hit else "misses"] += 1
+
+    def record_registry_scan(self, kind: str) -> None:
+        """Record a full walk of a registry."""
+        self._registry_scans[kind] = self._registry_scans.get(kind, 0) + 1
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return all metrics for diagnostics."""
+        return {
+            "uptime": round(time.monotonic() - self._started, 1),
+            "commands": {
+                command: metrics.as_dict()
+                for command, metrics in sorted(self._commands.items())
+            },
+            "caches": {
+                cache: {
+                    **stats,
+                    "hit_rate": (
+                        round(stats["hits"] / (stats["hits"] + stats["misses"]), 3)
+                        if stats["hits"] + stats["misses"]
+                        else None
+                    ),
+                }
+                for cache, stats in sorted(self._caches.items())
+            },
+            "registry_scans": dict(sorted(self._registry_scans.items())),
+        }
+
+
+def get_metrics(hass: HomeAssistant) -> IntegrationMetrics:
+    """Get or create the integration metrics."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if "metrics" not in domain_data:
+        domain_data["metrics"] = IntegrationMetrics()
+    return domain_data["metrics"]
+
+
+class _MeteredConnection:
+    """Connection wrapper that measures the reply of one command.
+
+    Pre-encoded messages are measured as sent. Result objects are only
+    serialized here when the call is sampled (the encoded bytes are then
+    sent instead of the object); otherwise they are passed through and the
+    reply size stays unknown (None).
+    """
+
+    def __init__(self, connection: websocket_api.ActiveConnection, sample: bool) -> None:
+        self._connection = connection
+        self._sample = sample
+        self.payload_bytes: int | None = None
+        self.success = True
+
+    @property
+    def connection(self) -> websocket_api.ActiveConnection:
+        """Return the wrapped connection."""
+        return self._connection
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._connection, name)
+
+    def _add_bytes(self, size: int) -> None:
+        self.payload_bytes = (self.payload_bytes or 0) + size
+
+    def send_result(self, msg_id: int, result: Any | None = None) -> None:
+        if not self._sample:
+            self._connection.send_result(msg_id, result)
+            return
+        payload = json_bytes(result)
+        self._add_bytes(len(payload))
+        self._connection.send_message(
+            websocket_api.messages.construct_result_message(msg_id, payload)
+        )
+
+    def send_message(self, message: Any) -> None:
+        if isinstance(message, str | bytes):
+            self._add_bytes(len(message))
+        self._connection.send_message(message)
+
+    def send_error(self, msg_id: int, code: str, message: str, *args: Any, **kwargs: Any) -> None:
+        self.success = False
+        self._connection.send_error(msg_id, code, message, *args, **kwargs)
+
+
+def unwrap_connection(connection: Any) -> websocket_api.ActiveConnection:
+    """Return the real connection behind a tracked handler's connection.
+
+    Tracked handlers receive a per-command wrapper; anything that keys state
+    on the connection's identity (e.g. the preview tracker) must use this.
+    """
+    if isinstance(connection, _MeteredConnection):
+        return connection.connection
+    return connection
+
+
+def track_command(func: AsyncCommandHandler) -> AsyncCommandHandler:
+    """Record latency, message sizes and outcome of an async websocket handler.
+
+    Apply directly above the handler, below ``websocket_api.async_response``.
+    The request arrives already decoded, so its size is measured by
+    re-encoding it on sampled calls only.
+    """
+
+    @wraps(func)
+    async def _async_tracked(
+        hass: HomeAssistant,
+        connection: websocket_api.ActiveConnection,
+        msg: dict[str, Any],
+    ) -> None:
+        metrics = get_metrics(hass)
+        command = msg["type"].split("/", 1)[-1]
+        sample = metrics.sample_sizes(command)
+        request_bytes = len(json_bytes(msg)) if sample else None
+        metered = _MeteredConnection(connection, sample)
+        start = time.monotonic()
+        try:
+            await func(hass, metered, msg)
+        except Exception:
+            metered.success = False
+            raise
+        finally:
+            metrics.record_command(
+                command,
+                time.monotonic() - start,
+                metered.payload_bytes,
+                metered.success,
+                request_bytes,
+            )
+
+    return _async_tracked
+
+
+class Trace:
+    """Stage timings of one run of a multi-stage command.
+
+    Spans record exclusive time: a span opened inside another is not
+    counted in the outer one, so the spans of sequential stages add up to
+    (about) the total. A span opened several times accumulates. Spans of
+    work running concurrently (one per HomeKit bridge) are summed.
+    """
+
+    def __init__(self) -> None:
+        """Start the trace."""
+        self._start = time.monotonic()
+        self._spans: dict[str, float] = {}
+
+    @contextmanager
+    def span(self, name: str) -> Iterator[None]:
+        """Time a stage.
+
+        Args:
+            name: Stage name, e.g. "google.write".
+        """
+        parent = _active_span.get()
+        children = [0.0]
+        token = _active_span.set(children)
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            elapsed = time.monotonic() - start
+            _active_span.reset(token)
+            self._spans[name] = self._spans.get(name, 0.0) + elapsed - children[0]
+            if parent is not None:
+                parent[0] += elapsed
+
+    @property
+    def total(self) -> float:
+        """Return the seconds since the trace started."""
+        return time.monotonic() - self._start
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the total and the span timings in milliseconds."""
+        return {
+            "total_ms": round(self.total * 1000, 3),
+            "spans_ms": {
+                name: round(duration * 1000, 3) for name, duration in self._spans.items()
+            },
+        }
+
+
+def trace_span(trace: Trace | None, name: str) -> AbstractContextManager[None]:
+    """Return trace.span(name), or a no-op context if there is no trace."""
+    if trace is None:
+        return nullcontext()
+    return trace.span(name)
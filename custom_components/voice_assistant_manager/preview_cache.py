@@ -0,0 +1,100 @@
+"""Preview result cache for Voice Assistant Manager integration.
+
+The panel requests the same YAML preview many times (switching tabs,
+toggling a value back and forth). Rendered previews are kept in a small
+LRU keyed by a hash of everything the output depends on, so repeated
+requests return without regenerating.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+from collections import OrderedDict
+from typing import Any
+
+from .const import PREVIEW_CACHE_SIZE
+
+
+def preview_cache_key(assistant: str, registry_revision: int, inputs: dict[str, Any]) -> str:
+    """Build the cache key for a preview.
+
+    Args:
+        assistant: The assistant type.
+        registry_revision: Current registry index revision.
+        inputs: Effective generator inputs for the assistant.
+
+    Returns:
+        Hex digest identifying the preview output.
+    """
+    payload = json.dumps(
+        [assistant, registry_revision, inputs], sort_keys=True, default=str
+    )
+    return hashlib.sha1(payload.encode("utf-8"), usedforsecurity=False).hexdigest()
+
+
+class PreviewCache:
+    """Small LRU of rendered previews with hit/miss counters.
+
+    Attributes:
+        max_size: Maximum number of cached previews.
+        hits: Number of lookups served from the cache.
+        misses: Number of lookups that required a render.
+    """
+
+    def __init__(self, max_size: int = PREVIEW_CACHE_SIZE) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_size: Maximum number of cached previews.
+        """
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, tuple[str, list[str]]] = OrderedDict()
+
+    def get(self, key: str) -> tuple[str, list[str]] | None:
+        """Return a cached preview and mark it as recently used.
+
+        Args:
+            key: Key from preview_cache_key().
+
+        Returns:
+            Tuple of (yaml_content, warnings) or None on a miss.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        yaml_content, warnings = entry
+        return yaml_content, list(warnings)
+
+    def put(self, key: str, yaml_content: str, warnings: list[str]) -> None:
+        """Store a rendered preview, evicting the least recently used one.
+
+        Args:
+            key: Key from preview_cache_key().
+            yaml_content: Rendered YAML.
+            warnings: Generation warnings.
+        """
+        self._entries[key] = (yaml_content, list(warnings))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached previews (counters are kept)."""
+        self._entries.clear()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return cache statistics for diagnostics."""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else None,
+        }
@@ -0,0 +1,88 @@
+"""Preview request supersession for Voice Assistant Manager integration.
+
+The panel may fire a new preview_yaml for every debounced edit. Only the
+latest preview per connection and assistant is useful, so starting a new
+one marks the previous one as superseded and cancels its pending executor
+work. A preview of all assistants (None) and the per-assistant previews
+of the same connection supersede each other. The stale request then answers with a cheap "superseded" result.
+"""
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+
+class PreviewRequest:
+    """State of one in-flight preview request.
+
+    Attributes:
+        superseded: True once a newer preview replaced this one.
+        future: Executor future currently awaited by the request, if any.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the request."""
+        self.superseded = False
+        self.future: asyncio.Future[Any] | None = None
+
+    def supersede(self) -> None:
+        """Mark the request as superseded and cancel its executor work."""
+        self.superseded = True
+        if self.future is not None:
+            self.future.cancel()
+
+
+class PreviewTracker:
+    """Track the latest preview requests per connection and assistant.
+
+    Connections are keyed by id(); entries are removed as soon as their
+    request finishes, so no reference outlives the request.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the tracker."""
+        self._requests: dict[int, dict[str | None, PreviewRequest]] = {}
+
+    def start(self, connection: Any, assistant: str | None) -> PreviewRequest:
+        """Register a new preview, superseding the previous ones it covers.
+
+        A preview of all assistants supersedes every preview of the
+        connection; a per-assistant preview supersedes the previous one for
+        that assistant and a preview of all assistants.
+
+        Args:
+            connection: The websocket connection sending the preview.
+            assistant: The requested assistant, or None for all.
+
+        Returns:
+            The new request.
+        """
+        requests = self._requests.setdefault(id(connection), {})
+        covered = list(requests) if assistant is None else [assistant, None]
+        for key in covered:
+            previous = requests.pop(key, None)
+            if previous is not None:
+                previous.supersede()
+
+        request = PreviewRequest()
+        requests[assistant] = request
+        return request
+
+    def finish(self, connection: Any, assistant: str | None, request: PreviewRequest) -> None:
+        """Forget a request once it has answered.
+
+        Args:
+            connection: The websocket connection sending the preview.
+            assistant: The requested assistant, or None for all.
+            request: The request returned by start().
+        """
+        requests = self._requests.get(id(connection))
+        if requests is None or requests.get(assistant) is not request:
+            return
+        del requests[assistant]
+        if not requests:
+            del self._requests[id(connection)]
+
+    def __len__(self) -> int:
+        """Return the number of in-flight previews."""
+        return sum(len(requests) for requests in self._requests.values())
@@ -0,0 +1,278 @@
+"""Registry index for Voice Assistant Manager integration.
+
+This module tracks changes to the entity, device and area registries (and
+the parts of the state machine the panel cares about) so that expensive
+derived data can be cached per revision instead of being rebuilt on every
+request.
+"""
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from homeassistant.config_entries import (
+    SIGNAL_CONFIG_ENTRY_CHANGED,
+    ConfigEntry,
+    ConfigEntryChange,
+)
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers import (
+    area_registry as ar,
+)
+from homeassistant.helpers import (
+    device_registry as dr,
+)
+from homeassistant.helpers import (
+    entity_registry as er,
+)
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+
+from .const import FILTER_MODE_EXCLUDE
+from .homekit_manager import HOMEKIT_DOMAIN, creates_homekit_accessory
+from .metrics import get_metrics
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class RegistryView:
+    """Read-only lookup tables over the enabled registry entities.
+
+    Built once per registry index revision and shared by every caller
+    until the next registry change.
+
+    Attributes:
+        revision: Registry index revision the view was built at.
+        enabled: Enabled entity IDs.
+        by_domain: Enabled entity IDs per domain.
+        by_device: Enabled entity IDs per device ID.
+        area_of: Area ID per enabled entity (entity area, else device area).
+        auxiliary: Enabled entities that are hidden or have an entity
+            category (config/diagnostic).
+        no_accessory: Enabled entities HomeKit creates no accessory for
+            (e.g. power or energy sensors).
+    """
+
+    def __init__(self, hass: HomeAssistant, revision: int) -> None:
+        """Build the view from the current registries.
+
+        Args:
+            hass: Home Assistant instance.
+            revision: Registry index revision.
+        """
+        dev_reg = dr.async_get(hass)
+        self.revision = revision
+        self.enabled: list[str] = []
+        self.by_domain: dict[str, list[str]] = {}
+        self.by_device: dict[str, list[str]] = {}
+        self.area_of: dict[str, str | None] = {}
+        self.auxiliary: set[str] = set()
+        self.no_accessory: set[str] = set()
+
+        for entity in er.async_get(hass).entities.values():
+            if entity.disabled:
+                continue
+            entity_id = entity.entity_id
+            self.enabled.append(entity_id)
+            self.by_domain.setdefault(entity_id.split(".")[0], []).append(entity_id)
+            if entity.entity_category is not None or entity.hidden_by is not None:
+                self.auxiliary.add(entity_id)
+            if not creates_homekit_accessory(entity):
+                self.no_accessory.add(entity_id)
+
+            area_id = entity.area_id
+            if entity.device_id:
+                self.by_device.setdefault(entity.device_id, []).append(entity_id)
+                if area_id is None:
+                    device = dev_reg.async_get(entity.device_id)
+                    if device is not None:
+                        area_id = device.area_id
+            self.area_of[entity_id] = area_id
+
+    def entities_in_domains(self, domains: Iterable[str]) -> set[str]:
+        """Return the enabled entities of the given domains."""
+        result: set[str] = set()
+        for domain in domains:
+            result.update(self.by_domain.get(domain, ()))
+        return result
+
+    def entities_of_devices(self, device_ids: Iterable[str]) -> set[str]:
+        """Return the enabled entities of the given devices."""
+        result: set[str] = set()
+        for device_id in device_ids:
+            result.update(self.by_device.get(device_id, ()))
+        return result
+
+    def evaluate_filter(
+        self,
+        filter_config: dict[str, Any],
+        domains: Iterable[str] | None = None,
+    ) -> set[str]:
+        """Return the enabled entities a filter config exposes.
+
+        Uses the same rules as the YAML generator: in exclude mode every
+        entity is exposed except those matched by domain, entity or device
+        (overrides re-include); in include mode only matched entities are
+        exposed (overrides exclude).
+
+        Args:
+            filter_config: Filter config (filter_mode, domains, entities,
+                devices, overrides).
+            domains: Optional domains to restrict the result to (e.g. the
+                domains an assistant supports).
+
+        Returns:
+            Set of exposed entity IDs.
+        """
+        if domains is None:
+            universe = set(self.enabled)
+        else:
+            universe = self.entities_in_domains(domains)
+
+        matched = (
+            self.entities_in_domains(filter_config.get("domains", []))
+            | set(filter_config.get("entities", []))
+            | self.entities_of_devices(filter_config.get("devices", []))
+        )
+        overrides = set(filter_config.get("overrides", []))
+
+        if filter_config.get("filter_mode", FILTER_MODE_EXCLUDE) == FILTER_MODE_EXCLUDE:
+            return universe - (matched - overrides)
+        return (matched - overrides) & universe
+
+
+class RegistryIndex:
+    """Track registry revisions and the set of known entity IDs.
+
+    The revision is bumped whenever something that feeds the panel state
+    changes: an entity, device or area registry update, an entity being
+    added to or removed from the state machine, a friendly name change, or
+    a HomeKit config entry change.
+
+    The known entity IDs (entity registry plus state machine) are built once
+    and then maintained incrementally from the same events, so pruning stale
+    IDs costs only as much as the payload being checked.
+
+    Attributes:
+        hass: Home Assistant instance.
+        revision: Monotonic counter bumped on every relevant change.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the registry index.
+
+        Args:
+            hass: Home Assistant instance.
+        """
+        self.hass = hass
+        self.revision: int = 0
+        self._known_entity_ids: set[str] = set()
+        self._view: RegistryView | None = None
+        self._unsubs: list[Callable[[], None]] = []
+
+    @property
+    def known_entity_ids(self) -> set[str]:
+        """Return all entity IDs known to HA (registry + current states).
+
+        The returned set is shared and must not be modified by callers.
+        """
+        return self._known_entity_ids
+
+    @callback
+    def async_get_view(self) -> RegistryView:
+        """Return lookup tables for the current revision (built on demand)."""
+        metrics = get_metrics(self.hass)
+        if self._view is None or self._view.revision != self.revision:
+            metrics.record_cache("registry_view", False)
+            metrics.record_registry_scan("registry_view")
+            self._view = RegistryView(self.hass, self.revision)
+        else:
+            metrics.record_cache("registry_view", True)
+        return self._view
+
+    @callback
+    def async_setup(self) -> None:
+        """Build the known entity set and subscribe to changes."""
+        self._known_entity_ids = set(er.async_get(self.hass).entities) | set(
+            self.hass.states.async_entity_ids()
+        )
+
+        bus = self.hass.bus
+        self._unsubs = [
+            bus.async_listen(er.EVENT_ENTITY_REGISTRY_UPDATED, self._async_entity_registry_updated),
+            bus.async_listen(dr.EVENT_DEVICE_REGISTRY_UPDATED, self._async_registry_updated),
+            bus.async_listen(ar.EVENT_AREA_REGISTRY_UPDATED, self._async_registry_updated),
+            bus.async_listen(EVENT_STATE_CHANGED, self._async_state_changed),
+            async_dispatcher_connect(
+                self.hass, SIGNAL_CONFIG_ENTRY_CHANGED, self._async_config_entry_changed
+            ),
+        ]
+        _LOGGER.debug("Registry index listeners registered")
+
+    @callback
+    def async_unload(self) -> None:
+        """Remove all listeners."""
+        while self._unsubs:
+            self._unsubs.pop()()
+
+    @callback
+    def _async_bump(self) -> None:
+        """Bump the revision."""
+        self.revision += 1
+
+    @callback
+    def _async_registry_updated(self, event: Event) -> None:
+        """Handle entity, device or area registry updates."""
+        self._async_bump()
+
+    @callback
+    def _async_entity_registry_updated(self, event: Event) -> None:
+        """Handle entity registry updates (create, remove, rename)."""
+        action = event.data.get("action")
+        entity_id = event.data.get("entity_id")
+
+        if action == "create":
+            self._known_entity_ids.add(entity_id)
+        elif action == "remove":
+            if self.hass.states.get(entity_id) is None:
+                self._known_entity_ids.discard(entity_id)
+        elif action == "update" and "old_entity_id" in event.data:
+            old_entity_id = event.data["old_entity_id"]
+            if self.hass.states.get(old_entity_id) is None:
+                self._known_entity_ids.discard(old_entity_id)
+            self._known_entity_ids.add(entity_id)
+
+        self._async_bump()
+
+    @callback
+    def _async_state_changed(self, event: Event) -> None:
+        """Handle state changes that affect the entity catalog.
+
+        Only additions, removals and friendly name changes matter; regular
+        state updates are ignored.
+        """
+        old_state = event.data.get("old_state")
+        new_state = event.data.get("new_state")
+
+        if old_state is None or new_state is None:
+            entity_id = event.data["entity_id"]
+            if new_state is not None:
+                self._known_entity_ids.add(entity_id)
+            elif entity_id not in er.async_get(self.hass).entities:
+                self._known_entity_ids.discard(entity_id)
+            self._async_bump()
+            return
+
+        if old_state.attributes.get("friendly_name") != new_state.attributes.get(
+            "friendly_name"
+        ):
+            self._async_bump()
+
+    @callback
+    def _async_config_entry_changed(
+        self, change: ConfigEntryChange, entry: ConfigEntry
+    ) -> None:
+        """Handle HomeKit config entry changes (bridge list and options)."""
+        if entry.domain == HOMEKIT_DOMAIN:
+            self._async_bump()
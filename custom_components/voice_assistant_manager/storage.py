@@ -5,8 +5,12 @@ using Home Assistant's storage helper.
 """
 from __future__ import annotations
 
+import asyncio
 import copy
 import logging
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from typing import Any
 
 from homeassistant.core import HomeAssistant
@@ -15,22 +19,46 @@ from homeassistant.helpers.storage import Store
 from .const import (
     DEFAULT_DATA,
     DEFAULT_FILTER_CONFIG,
+    DEFAULT_HOMEKIT_SHARDING,
     FILTER_MODE_EXCLUDE,
     MODE_LINKED,
+    SCOPE_LINKED,
+    SCOPE_SETTINGS,
     STORAGE_KEY,
+    STORAGE_SCOPES,
     STORAGE_VERSION,
 )
-from .exceptions import StorageError
+from .exceptions import RevisionConflictError, StorageError, ValidationError
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def is_google_settings_complete(settings: dict[str, Any]) -> bool:
+    """Check if Google settings are complete enough to generate YAML."""
+    if not settings.get("enabled"):
+        return False
+    return bool(settings.get("project_id")) and bool(
+        settings.get("service_account_path")
+    )
+
+
+def is_alexa_settings_complete(settings: dict[str, Any]) -> bool:
+    """Check if Alexa settings are complete enough to generate YAML."""
+    if not settings.get("enabled"):
+        return False
+    return bool(settings.get("advanced_yaml"))
+
+
 class VoiceAssistantManagerStorage:
     """Class to handle Voice Assistant Manager storage.
 
     This class manages all persistent data for the Voice Assistant Manager integration,
     including filter configs, aliases, and assistant settings.
 
+    Mutations are serialized per scope (linked, google, alexa, homekit,
+    settings) with asyncio locks, so edits to independent scopes can run
+    concurrently while each scope stays consistent across awaits.
+
     Attributes:
         hass: Home Assistant instance.
     """
@@ -45,6 +73,18 @@ class VoiceAssistantManagerStorage:
         self._store: Store = Store(hass, STORAGE_VERSION, STORAGE_KEY)
         self._data: dict[str, Any] = copy.deepcopy(DEFAULT_DATA)
         self._loaded: bool = False
+        self._revision: int = 0
+        self._locks: dict[str, asyncio.Lock] = {
+            scope: asyncio.Lock() for scope in STORAGE_SCOPES
+        }
+        self._lock_owners: dict[str, asyncio.Task | None] = {}
+        self._lock_stats: dict[str, dict[str, float]] = {
+            scope: {"acquisitions": 0, "contended": 0, "total_wait": 0.0, "max_wait": 0.0}
+            for scope in STORAGE_SCOPES
+        }
+        self._save_stats: dict[str, float] = {
+            "saves": 0, "failures": 0, "total_duration": 0.0, "max_duration": 0.0
+        }
 
     async def async_load(self) -> dict[str, Any]:
         """Load data from storage.
@@ -165,12 +205,30 @@ class VoiceAssistantManagerStorage:
 
     async def async_save(self) -> None:
         """Save data to storage."""
+        # Bump the revision first so cached responses built from the
+        # in-memory data are invalidated even if the write fails
+        self._revision += 1
+        start = time.monotonic()
         try:
             await self._store.async_save(self._data)
             _LOGGER.debug("Saved Voice Assistant Manager data to storage")
         except Exception as err:
+            self._save_stats["failures"] += 1
             _LOGGER.error("Failed to save Voice Assistant Manager data: %s", err)
             raise StorageError(f"Failed to save data: {err}") from err
+        finally:
+            duration = time.monotonic() - start
+            self._save_stats["saves"] += 1
+            self._save_stats["total_duration"] += duration
+            self._save_stats["max_duration"] = max(self._save_stats["max_duration"], duration)
+
+    def save_stats(self) -> dict[str, float]:
+        """Return save count, failures and durations (seconds)."""
+        return {
+            **self._save_stats,
+            "total_duration": round(self._save_stats["total_duration"], 6),
+            "max_duration": round(self._save_stats["max_duration"], 6),
+        }
 
     def _merge_with_defaults(self, stored: dict[str, Any]) -> dict[str, Any]:
         """Merge stored data with defaults to ensure all keys exist.
@@ -199,26 +257,254 @@ class VoiceAssistantManagerStorage:
         """Return the current data."""
         return self._data
 
+    def snapshot(self) -> dict[str, Any]:
+        """Return a read-only snapshot of the current data.
+
+        Only the top level is copied: storage never mutates a section in
+        place (every write replaces the section), so the nested values of a
+        snapshot stay unchanged while later writes happen.
+
+        Returns:
+            Shallow copy of the data dictionary. Must not be modified.
+        """
+        return dict(self._data)
+
+    @property
+    def revision(self) -> int:
+        """Return the in-memory data revision (bumped on every save).
+
+        Used to invalidate caches; bookkeeping saves (timestamps, HomeKit
+        sync state) bump it too. Clients get content_revision instead.
+        """
+        return self._revision
+
+    @property
+    def content_revision(self) -> int:
+        """Return the revision of the stored content.
+
+        The sum of the section revisions, so only edits bump it (not
+        bookkeeping saves) and it survives restarts. This is the revision
+        clients base their changes on (see async_apply_delta).
+        """
+        return sum(self.revisions.values())
+
     @property
     def mode(self) -> str:
         """Return the current mode (linked or separate)."""
         return self._data.get("mode", MODE_LINKED)
 
-    async def async_set_mode(self, mode: str) -> None:
+    # ============ Section Revisions ============
+
+    @property
+    def revisions(self) -> dict[str, int]:
+        """Return the persisted revision of each storage scope."""
+        stored = self._data.get("revisions", {})
+        return {scope: stored.get(scope, 0) for scope in STORAGE_SCOPES}
+
+    def _mark_changed(self, *assistants: str | None, settings: bool = False) -> None:
+        """Bump the section revisions of the scopes being modified."""
+        scopes = {self._scope(assistant) for assistant in assistants}
+        if settings:
+            scopes.add(SCOPE_SETTINGS)
+        self._bump_revisions(scopes)
+
+    def _bump_revisions(self, scopes: set[str]) -> None:
+        """Bump the section revisions of the given scopes."""
+        revisions = dict(self._data.get("revisions", {}))
+        for scope in scopes:
+            revisions[scope] = revisions.get(scope, 0) + 1
+        self._data["revisions"] = revisions
+
+    def _check_revisions(self, expected: dict[str, int]) -> None:
+        """Check section revisions a caller based its changes on.
+
+        Raises:
+            RevisionConflictError: If any scope moved on since.
+        """
+        current = self.revisions
+        conflicts = sorted(
+            scope for scope, revision in expected.items() if current[scope] != revision
+        )
+        if conflicts:
+            raise RevisionConflictError(
+                f"Data changed in: {', '.join(conflicts)}", self.content_revision, conflicts
+            )
+
+    def get_sections(self, scopes: list[str]) -> dict[str, Any]:
+        """Return the current content of the sections in the given scopes.
+
+        Keys match get_full_state(), so a client can merge the result into
+        its state after a conflict.
+
+        Args:
+            scopes: Storage scopes.
+
+        Returns:
+            Dictionary of state keys to their current values.
+        """
+        sections: dict[str, Any] = {}
+        for scope in scopes:
+            if scope == SCOPE_SETTINGS:
+                sections["google_settings"] = self.get_google_settings()
+                sections["alexa_settings"] = self.get_alexa_settings()
+                sections["homekit_entry_id"] = self.get_homekit_entry_id()
+                sections["homekit_sharding"] = self.get_homekit_sharding()
+                continue
+            prefix = "" if scope == SCOPE_LINKED else f"{scope}_"
+            sections[f"{prefix}filter_config"] = copy.deepcopy(
+                self._data.get(f"{prefix}filter_config", DEFAULT_FILTER_CONFIG)
+            )
+            if f"{prefix}aliases" in self._data:
+                sections[f"{prefix}aliases"] = copy.deepcopy(self._data[f"{prefix}aliases"])
+        return sections
+
+    # ============ Locking ============
+
+    def _scope(self, assistant: str | None) -> str:
+        """Return the lock scope guarding an assistant's filter config and aliases."""
+        if self.mode == MODE_LINKED or assistant is None:
+            return SCOPE_LINKED
+        return assistant
+
+    @asynccontextmanager
+    async def _async_lock_scopes(self, scopes: set[str]) -> AsyncIterator[None]:
+        """Hold the locks of the given scopes.
+
+        Locks are acquired in a fixed (sorted) order to avoid deadlocks.
+        Scopes already held by the current task are skipped, so a caller
+        holding a set of scopes can call storage methods needing a subset.
+        """
+        task = asyncio.current_task()
+        acquired: list[str] = []
+        try:
+            for scope in sorted(scopes):
+                if self._lock_owners.get(scope) is task:
+                    continue
+                lock = self._locks[scope]
+                contended = lock.locked()
+                start = time.monotonic()
+                await lock.acquire()
+                self._lock_owners[scope] = task
+                acquired.append(scope)
+                self._record_lock_wait(scope, time.monotonic() - start, contended)
+            yield
+        finally:
+            for scope in reversed(acquired):
+                self._lock_owners.pop(scope, None)
+                self._locks[scope].release()
+
+    @asynccontextmanager
+    async def async_lock(
+        self,
+        *assistants: str | None,
+        settings: bool = False,
+        expected_revisions: dict[str, int] | None = None,
+    ) -> AsyncIterator[None]:
+        """Hold the locks needed to modify the given assistants' sections.
+
+        Use this around read-modify-write sequences that span awaits (for
+        example reading a filter config, then saving a merged version).
+
+        Args:
+            *assistants: Assistant types whose filter config and aliases are
+                modified (None for linked mode).
+            settings: Also lock the settings scope (assistant settings,
+                HomeKit bridge selection, timestamps).
+            expected_revisions: Section revisions (scope -> revision) the
+                caller based its changes on. Those scopes are locked too and
+                checked once the locks are held.
+
+        Raises:
+            RevisionConflictError: If a section revision does not match.
+        """
+        expected = expected_revisions or {}
+        while True:
+            assistant_scopes = {self._scope(assistant) for assistant in assistants}
+            scopes = assistant_scopes | set(expected)
+            if settings:
+                scopes.add(SCOPE_SETTINGS)
+            async with self._async_lock_scopes(scopes):
+                # The mode may have changed while waiting, which changes the
+                # sections the assistants map to; retry with the new scopes
+                if assistant_scopes == {
+                    self._scope(assistant) for assistant in assistants
+                }:
+                    self._check_revisions(expected)
+                    yield
+                    return
+
+    def _record_lock_wait(self, scope: str, wait: float, contended: bool) -> None:
+        """Record the time spent waiting for a scope lock."""
+        stats = self._lock_stats[scope]
+        stats["acquisitions"] += 1
+        if contended:
+            stats["contended"] += 1
+        stats["total_wait"] += wait
+        stats["max_wait"] = max(stats["max_wait"], wait)
+
+    def lock_stats(self) -> dict[str, dict[str, float]]:
+        """Return lock wait statistics per scope (seconds)."""
+        return {
+            scope: {
+                **stats,
+                "total_wait": round(stats["total_wait"], 6),
+                "max_wait": round(stats["max_wait"], 6),
+            }
+            for scope, stats in self._lock_stats.items()
+        }
+
+    async def async_set_mode(
+        self, mode: str, expected_revisions: dict[str, int] | None = None
+    ) -> None:
         """Set the mode.
 
         Args:
             mode: The mode to set ('linked' or 'separate').
+            expected_revisions: Optional section revisions to check first.
 
         Raises:
             ValidationError: If the mode is invalid.
+            RevisionConflictError: If a section revision does not match.
         """
         from .validators import validate_mode
         validated_mode = validate_mode(mode)
-        self._data["mode"] = validated_mode
-        await self.async_save()
+        # The mode changes which sections every scope maps to
+        async with self._async_lock_scopes(set(STORAGE_SCOPES)):
+            self._check_revisions(expected_revisions or {})
+            self._data["mode"] = validated_mode
+            self._bump_revisions(set(STORAGE_SCOPES))
+            await self.async_save()
         _LOGGER.debug("Mode set to: %s", validated_mode)
 
+    def section_key(self, kind: str, assistant: str | None) -> str:
+        """Return the data key of an assistant's filter config or aliases.
+
+        The same key is used in snapshot() and in preview overlays.
+
+        Args:
+            kind: "filter_config" or "aliases".
+            assistant: The assistant type or None for linked mode.
+
+        Returns:
+            The data key for the current mode.
+
+        Raises:
+            ValueError: If kind is not a per-assistant section.
+        """
+        if kind not in ("filter_config", "aliases"):
+            raise ValueError(f"Unknown section kind: {kind}")
+        if self.mode == MODE_LINKED or assistant is None:
+            return kind
+        return f"{assistant}_{kind}"
+
+    def _filter_config_key(self, assistant: str | None) -> str:
+        """Return the data key holding the filter config for an assistant."""
+        return self.section_key("filter_config", assistant)
+
+    def _aliases_key(self, assistant: str | None) -> str:
+        """Return the data key holding the aliases for an assistant."""
+        return self.section_key("aliases", assistant)
+
     # ============ Filter Config Methods (v2) ============
 
     def get_filter_config(self, assistant: str | None = None) -> dict[str, Any]:
@@ -230,14 +516,8 @@ class VoiceAssistantManagerStorage:
         Returns:
             Dictionary with filter_mode, domains, entities, devices, overrides.
         """
-        if self.mode == MODE_LINKED or assistant is None:
-            return copy.deepcopy(
-                self._data.get("filter_config", DEFAULT_FILTER_CONFIG)
-            )
-
-        key = f"{assistant}_filter_config"
         return copy.deepcopy(
-            self._data.get(key, DEFAULT_FILTER_CONFIG)
+            self._data.get(self._filter_config_key(assistant), DEFAULT_FILTER_CONFIG)
         )
 
     async def async_set_filter_config(
@@ -256,13 +536,10 @@ class VoiceAssistantManagerStorage:
         validated_assistant = validate_assistant(assistant)
         validated_config = validate_filter_config(filter_config)
 
-        if self.mode == MODE_LINKED or validated_assistant is None:
-            self._data["filter_config"] = validated_config
-        else:
-            key = f"{validated_assistant}_filter_config"
-            self._data[key] = validated_config
-
-        await self.async_save()
+        async with self.async_lock(validated_assistant):
+            self._data[self._filter_config_key(validated_assistant)] = validated_config
+            self._mark_changed(validated_assistant)
+            await self.async_save()
 
     async def async_set_filter_mode(
         self,
@@ -280,16 +557,12 @@ class VoiceAssistantManagerStorage:
         validated_mode = validate_filter_mode(filter_mode)
         validated_assistant = validate_assistant(assistant)
 
-        config = self.get_filter_config(validated_assistant)
-        config["filter_mode"] = validated_mode
-
-        if self.mode == MODE_LINKED or validated_assistant is None:
-            self._data["filter_config"] = config
-        else:
-            key = f"{validated_assistant}_filter_config"
-            self._data[key] = config
-
-        await self.async_save()
+        async with self.async_lock(validated_assistant):
+            config = self.get_filter_config(validated_assistant)
+            config["filter_mode"] = validated_mode
+            self._data[self._filter_config_key(validated_assistant)] = config
+            self._mark_changed(validated_assistant)
+            await self.async_save()
         _LOGGER.debug("Filter mode set to %s for %s", validated_mode, validated_assistant or "linked")
 
     async def async_set_domains(
@@ -306,16 +579,13 @@ class VoiceAssistantManagerStorage:
         from .validators import validate_assistant
 
         validated_assistant = validate_assistant(assistant)
-        config = self.get_filter_config(validated_assistant)
-        config["domains"] = list(set(domains))  # Deduplicate
 
-        if self.mode == MODE_LINKED or validated_assistant is None:
-            self._data["filter_config"] = config
-        else:
-            key = f"{validated_assistant}_filter_config"
-            self._data[key] = config
-
-        await self.async_save()
+        async with self.async_lock(validated_assistant):
+            config = self.get_filter_config(validated_assistant)
+            config["domains"] = list(set(domains))  # Deduplicate
+            self._data[self._filter_config_key(validated_assistant)] = config
+            self._mark_changed(validated_assistant)
+            await self.async_save()
 
     async def async_toggle_override(
         self,
@@ -336,25 +606,12 @@ class VoiceAssistantManagerStorage:
         validated_entity_id = validate_entity_id(entity_id)
         validated_assistant = validate_assistant(assistant)
 
-        config = self.get_filter_config(validated_assistant)
-        overrides = set(config.get("overrides", []))
-
-        if validated_entity_id in overrides:
-            overrides.discard(validated_entity_id)
-            added = False
-        else:
-            overrides.add(validated_entity_id)
-            added = True
-
-        config["overrides"] = list(overrides)
-
-        if self.mode == MODE_LINKED or validated_assistant is None:
-            self._data["filter_config"] = config
-        else:
-            key = f"{validated_assistant}_filter_config"
-            self._data[key] = config
-
-        await self.async_save()
+        async with self.async_lock(validated_assistant):
+            config = self.get_filter_config(validated_assistant)
+            added = self._toggle_in_list(config, "overrides", validated_entity_id)
+            self._data[self._filter_config_key(validated_assistant)] = config
+            self._mark_changed(validated_assistant)
+            await self.async_save()
         return added
 
     def is_entity_exposed(
@@ -418,11 +675,7 @@ class VoiceAssistantManagerStorage:
         Returns:
             Dictionary mapping entity IDs to aliases.
         """
-        if self.mode == MODE_LINKED or assistant is None:
-            return copy.deepcopy(self._data.get("aliases", {}))
-
-        key = f"{assistant}_aliases"
-        return copy.deepcopy(self._data.get(key, {}))
+        return copy.deepcopy(self._data.get(self._aliases_key(assistant), {}))
 
     async def async_set_alias(
         self,
@@ -443,21 +696,16 @@ class VoiceAssistantManagerStorage:
         validated_alias = validate_alias(alias)
         validated_assistant = validate_assistant(assistant)
 
-        if self.mode == MODE_LINKED or validated_assistant is None:
+        async with self.async_lock(validated_assistant):
+            key = self._aliases_key(validated_assistant)
+            aliases = dict(self._data.get(key, {}))
             if validated_alias:
-                self._data["aliases"][validated_entity_id] = validated_alias
+                aliases[validated_entity_id] = validated_alias
             else:
-                self._data["aliases"].pop(validated_entity_id, None)
-        else:
-            key = f"{validated_assistant}_aliases"
-            if key not in self._data:
-                self._data[key] = {}
-            if validated_alias:
-                self._data[key][validated_entity_id] = validated_alias
-            else:
-                self._data[key].pop(validated_entity_id, None)
-
-        await self.async_save()
+                aliases.pop(validated_entity_id, None)
+            self._data[key] = aliases
+            self._mark_changed(validated_assistant)
+            await self.async_save()
 
     async def async_set_aliases_bulk(
         self,
@@ -481,21 +729,13 @@ class VoiceAssistantManagerStorage:
             validated_alias = validate_alias(alias)
             validated_aliases[validated_entity_id] = validated_alias
 
-        if self.mode == MODE_LINKED or validated_assistant is None:
-            self._data["aliases"].update(validated_aliases)
+        async with self.async_lock(validated_assistant):
+            key = self._aliases_key(validated_assistant)
+            aliases = {**self._data.get(key, {}), **validated_aliases}
             # Remove empty aliases
-            self._data["aliases"] = {
-                k: v for k, v in self._data["aliases"].items() if v
-            }
-        else:
-            key = f"{validated_assistant}_aliases"
-            if key not in self._data:
-                self._data[key] = {}
-            self._data[key].update(validated_aliases)
-            # Remove empty aliases
-            self._data[key] = {k: v for k, v in self._data[key].items() if v}
-
-        await self.async_save()
+            self._data[key] = {k: v for k, v in aliases.items() if v}
+            self._mark_changed(validated_assistant)
+            await self.async_save()
 
     async def async_replace_aliases(
         self,
@@ -515,13 +755,243 @@ class VoiceAssistantManagerStorage:
 
         validated_assistant = validate_assistant(assistant)
 
-        if self.mode == MODE_LINKED or validated_assistant is None:
-            self._data["aliases"] = {k: v for k, v in aliases.items() if v}
-        else:
-            key = f"{validated_assistant}_aliases"
+        async with self.async_lock(validated_assistant):
+            key = self._aliases_key(validated_assistant)
             self._data[key] = {k: v for k, v in aliases.items() if v}
+            self._mark_changed(validated_assistant)
+            await self.async_save()
 
-        await self.async_save()
+    # ============ Batch Methods ============
+
+    async def async_apply_batch(
+        self,
+        operations: list[dict[str, Any]],
+        expected_revisions: dict[str, int] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Apply an ordered list of operations atomically and save once.
+
+        Operations are applied in order to working copies of the sections
+        they touch (each section is copied at most once). The live data is
+        only replaced, and storage only written, if every operation succeeds.
+
+        Supported operations (already validated by the caller):
+            - set_filter_mode: filter_mode, assistant
+            - set_domains: domains, assistant
+            - toggle_override: entity_id, assistant
+            - set_alias: entity_id, alias, assistant
+            - bulk_update: action, entity_ids, value, device_ids, assistant
+
+        Args:
+            operations: List of operation dictionaries with an "op" key.
+            expected_revisions: Optional section revisions to check first.
+
+        Returns:
+            Per-operation results, in order.
+
+        Raises:
+            ValidationError: If an operation cannot be applied. Nothing is
+                changed in that case.
+            RevisionConflictError: If a section revision does not match.
+        """
+        from .validators import validate_assistant
+
+        assistants = []
+        for index, operation in enumerate(operations):
+            try:
+                assistants.append(validate_assistant(operation.get("assistant")))
+            except ValidationError as err:
+                raise ValidationError(f"Operation {index}: {err}") from err
+
+        async with self.async_lock(*assistants, expected_revisions=expected_revisions):
+            working: dict[str, Any] = {}
+
+            def section(key: str, default: Any) -> Any:
+                """Return the working copy of a data section."""
+                if key not in working:
+                    working[key] = copy.deepcopy(self._data.get(key, default))
+                return working[key]
+
+            results = []
+            for index, operation in enumerate(operations):
+                try:
+                    assistant = assistants[index]
+                    config_key = self._filter_config_key(assistant)
+                    op = operation["op"]
+
+                    if op == "set_filter_mode":
+                        config = section(config_key, DEFAULT_FILTER_CONFIG)
+                        config["filter_mode"] = operation["filter_mode"]
+                        results.append({"success": True, "filter_mode": operation["filter_mode"]})
+                    elif op == "set_domains":
+                        config = section(config_key, DEFAULT_FILTER_CONFIG)
+                        config["domains"] = list(set(operation["domains"]))
+                        results.append({"success": True, "domains": config["domains"]})
+                    elif op == "toggle_override":
+                        added = self._toggle_in_list(
+                            section(config_key, DEFAULT_FILTER_CONFIG),
+                            "overrides",
+                            operation["entity_id"],
+                        )
+                        results.append({
+                            "success": True,
+                            "entity_id": operation["entity_id"],
+                            "added": added,
+                        })
+                    elif op == "set_alias":
+                        aliases = section(self._aliases_key(assistant), {})
+                        if operation["alias"]:
+                            aliases[operation["entity_id"]] = operation["alias"]
+                        else:
+                            aliases.pop(operation["entity_id"], None)
+                        results.append({"success": True})
+                    elif op == "bulk_update":
+                        self._apply_bulk_update(
+                            section(config_key, DEFAULT_FILTER_CONFIG),
+                            section(self._aliases_key(assistant), {}),
+                            operation,
+                        )
+                        results.append({"success": True})
+                    else:
+                        raise ValidationError(f"Unknown operation: {op}")
+                except ValidationError as err:
+                    raise ValidationError(f"Operation {index}: {err}") from err
+
+            self._data.update(working)
+            self._mark_changed(*assistants)
+            await self.async_save()
+        return results
+
+    async def async_apply_delta(
+        self,
+        delta: dict[str, Any],
+        base_revision: int | None = None,
+        expected_revisions: dict[str, int] | None = None,
+    ) -> None:
+        """Apply an incremental (delta) save.
+
+        Only the listed items are touched; existing entries are carried over
+        without being re-validated.
+
+        Args:
+            delta: Validated delta with optional "filter_configs" and
+                "aliases" maps keyed by assistant (None for linked mode).
+                Filter deltas may set "filter_mode" and carry "add"/"remove"
+                lists per list key; alias deltas carry "set" and "delete".
+            base_revision: Optional content revision the client based its
+                changes on (any edit in between is a conflict; bookkeeping
+                saves such as write timestamps are not).
+            expected_revisions: Optional section revisions the client based
+                its changes on (only saves to those sections conflict).
+
+        Raises:
+            RevisionConflictError: If the data changed since base_revision
+                or a section revision does not match.
+        """
+        assistants = [*delta.get("filter_configs", {}), *delta.get("aliases", {})]
+        async with self.async_lock(*assistants, expected_revisions=expected_revisions):
+            if base_revision is not None and base_revision != self.content_revision:
+                raise RevisionConflictError(
+                    f"Data changed since revision {base_revision} "
+                    f"(now {self.content_revision})",
+                    self.content_revision,
+                )
+
+            for assistant, changes in delta.get("filter_configs", {}).items():
+                key = self._filter_config_key(assistant)
+                config = dict(self._data.get(key, DEFAULT_FILTER_CONFIG))
+                if "filter_mode" in changes:
+                    config["filter_mode"] = changes["filter_mode"]
+                for list_key in ("domains", "entities", "devices", "overrides"):
+                    if list_key in changes:
+                        config[list_key] = self._apply_list_delta(
+                            config.get(list_key, []), changes[list_key]
+                        )
+                self._data[key] = config
+
+            for assistant, changes in delta.get("aliases", {}).items():
+                key = self._aliases_key(assistant)
+                aliases = dict(self._data.get(key, {}))
+                for entity_id in changes.get("delete", []):
+                    aliases.pop(entity_id, None)
+                aliases.update(changes.get("set", {}))
+                self._data[key] = aliases
+
+            self._mark_changed(*assistants)
+            await self.async_save()
+
+    @staticmethod
+    def _apply_list_delta(current: list[str], changes: dict[str, list[str]]) -> list[str]:
+        """Return a new list with the delta's additions and removals applied."""
+        remove = set(changes.get("remove", []))
+        result = [value for value in current if value not in remove]
+        present = set(result)
+        for value in changes.get("add", []):
+            if value not in present:
+                result.append(value)
+                present.add(value)
+        return result
+
+    @staticmethod
+    def _toggle_in_list(config: dict[str, Any], key: str, value: str) -> bool:
+        """Toggle a value in a filter config list.
+
+        Returns:
+            True if the value was added, False if removed.
+        """
+        values = set(config.get(key, []))
+        if value in values:
+            values.discard(value)
+            added = False
+        else:
+            values.add(value)
+            added = True
+        config[key] = list(values)
+        return added
+
+    @staticmethod
+    def _apply_bulk_update(
+        config: dict[str, Any],
+        aliases: dict[str, str],
+        operation: dict[str, Any],
+    ) -> None:
+        """Apply a bulk update action to a filter config and alias map.
+
+        Args:
+            config: Filter config to modify in place.
+            aliases: Alias map to modify in place.
+            operation: Validated bulk_update operation.
+
+        Raises:
+            ValidationError: If the action is invalid.
+        """
+        action = operation["action"]
+        entity_ids = operation["entity_ids"]
+
+        if action == "exclude":
+            config["entities"] = list(set(config.get("entities", [])) | set(entity_ids))
+        elif action == "unexclude":
+            config["entities"] = list(set(config.get("entities", [])) - set(entity_ids))
+        elif action == "add_override":
+            config["overrides"] = list(set(config.get("overrides", [])) | set(entity_ids))
+        elif action == "remove_override":
+            config["overrides"] = list(set(config.get("overrides", [])) - set(entity_ids))
+        elif action == "set_alias":
+            value = (operation.get("value") or "").strip()
+            if not value:
+                raise ValidationError("Alias value is required")
+            for entity_id in entity_ids:
+                aliases[entity_id] = value
+        elif action == "clear_alias":
+            for entity_id in entity_ids:
+                aliases.pop(entity_id, None)
+        elif action == "exclude_domain":
+            domains = {entity_id.split(".")[0] for entity_id in entity_ids}
+            config["domains"] = list(set(config.get("domains", [])) | domains)
+        elif action == "exclude_device":
+            devices = set(operation.get("device_ids", []))
+            config["devices"] = list(set(config.get("devices", [])) | devices)
+        else:
+            raise ValidationError(f"Unknown bulk action: {action}")
 
     # ============ Settings Methods ============
 
@@ -536,10 +1006,12 @@ class VoiceAssistantManagerStorage:
         """Set Google Assistant settings."""
         from .validators import validate_google_settings
         validated_settings = validate_google_settings(settings)
-        current = self.get_google_settings()
-        current.update(validated_settings)
-        self._data["google_settings"] = current
-        await self.async_save()
+        async with self.async_lock(settings=True):
+            current = self.get_google_settings()
+            current.update(validated_settings)
+            self._data["google_settings"] = current
+            self._mark_changed(settings=True)
+            await self.async_save()
         _LOGGER.debug("Google settings updated")
 
     def get_alexa_settings(self) -> dict[str, Any]:
@@ -553,10 +1025,12 @@ class VoiceAssistantManagerStorage:
         """Set Alexa settings."""
         from .validators import validate_alexa_settings
         validated_settings = validate_alexa_settings(settings)
-        current = self.get_alexa_settings()
-        current.update(validated_settings)
-        self._data["alexa_settings"] = current
-        await self.async_save()
+        async with self.async_lock(settings=True):
+            current = self.get_alexa_settings()
+            current.update(validated_settings)
+            self._data["alexa_settings"] = current
+            self._mark_changed(settings=True)
+            await self.async_save()
         _LOGGER.debug("Alexa settings updated")
 
     # ============ HomeKit Methods ============
@@ -567,10 +1041,74 @@ class VoiceAssistantManagerStorage:
 
     async def async_set_homekit_entry_id(self, entry_id: str | None) -> None:
         """Set the HomeKit bridge entry ID to manage."""
-        self._data["homekit_entry_id"] = entry_id
-        await self.async_save()
+        async with self.async_lock(settings=True):
+            self._data["homekit_entry_id"] = entry_id
+            self._mark_changed(settings=True)
+            await self.async_save()
         _LOGGER.debug("HomeKit entry ID set to: %s", entry_id)
 
+    def get_homekit_sharding(self) -> dict[str, Any]:
+        """Get the HomeKit multi-bridge sharding config."""
+        return copy.deepcopy(
+            self._data.get("homekit_sharding", DEFAULT_HOMEKIT_SHARDING)
+        )
+
+    async def async_set_homekit_sharding(self, sharding: dict[str, Any]) -> None:
+        """Set the HomeKit multi-bridge sharding config.
+
+        Args:
+            sharding: Validated config with enabled, entry_ids, key and
+                assignments.
+        """
+        async with self.async_lock(settings=True):
+            self._data["homekit_sharding"] = sharding
+            self._mark_changed(settings=True)
+            await self.async_save()
+        _LOGGER.debug("HomeKit sharding updated")
+
+    async def async_set_homekit_shard_assignments(
+        self, assignments: dict[str, str]
+    ) -> None:
+        """Persist the shard assignments computed by a sync.
+
+        Assignments are derived state, so the section revision is not bumped.
+
+        Args:
+            assignments: Shard key value -> HomeKit entry ID.
+        """
+        async with self.async_lock(settings=True):
+            self._data["homekit_sharding"] = {
+                **self.get_homekit_sharding(),
+                "assignments": assignments,
+            }
+            await self.async_save()
+
+    def get_homekit_synced_filters(self) -> dict[str, dict[str, list[str]]]:
+        """Get the HomeKit filter last written to each bridge."""
+        return copy.deepcopy(self._data.get("homekit_synced_filters", {}))
+
+    async def async_set_homekit_synced_filter(
+        self, entry_id: str, entity_filter: dict[str, list[str]] | None
+    ) -> None:
+        """Record the HomeKit filter written to a bridge.
+
+        Bookkeeping only: no lock (callers may hold any scope) and no
+        revision bump. Nothing is saved if the filter is unchanged.
+
+        Args:
+            entry_id: HomeKit config entry ID.
+            entity_filter: Normalized HomeKit entity filter, or None to
+                forget the bridge's baseline.
+        """
+        synced = self._data.get("homekit_synced_filters", {})
+        if synced.get(entry_id) == entity_filter:
+            return
+        synced = {**synced, entry_id: entity_filter}
+        if entity_filter is None:
+            del synced[entry_id]
+        self._data["homekit_synced_filters"] = synced
+        await self.async_save()
+
     # ============ Timestamp Methods ============
 
     def get_last_generated(self, assistant: str) -> str | None:
@@ -579,33 +1117,46 @@ class VoiceAssistantManagerStorage:
 
     async def async_set_last_generated(self, assistant: str, timestamp: str) -> None:
         """Set last generated timestamp for assistant."""
+        await self.async_set_last_generated_bulk([assistant], timestamp)
+
+    async def async_set_last_generated_bulk(
+        self, assistants: list[str], timestamp: str
+    ) -> None:
+        """Set the same last generated timestamp for several assistants.
+
+        Saves once, however many assistants are given.
+
+        Args:
+            assistants: Assistant types (nothing is saved if empty).
+            timestamp: ISO timestamp.
+        """
         from .validators import validate_assistant
-        validated_assistant = validate_assistant(assistant)
-        if "last_generated" not in self._data:
-            self._data["last_generated"] = {}
-        self._data["last_generated"][validated_assistant] = timestamp
-        await self.async_save()
+        validated = [validate_assistant(assistant) for assistant in assistants]
+        if not validated:
+            return
+        # Timestamps are bookkeeping rather than edits, so no revision bump
+        async with self.async_lock(settings=True):
+            self._data["last_generated"] = {
+                **self._data.get("last_generated", {}),
+                **dict.fromkeys(validated, timestamp),
+            }
+            await self.async_save()
 
     # ============ Completion Checks ============
 
     def is_google_complete(self) -> bool:
         """Check if Google settings are complete enough to generate YAML."""
-        settings = self.get_google_settings()
-        if not settings.get("enabled"):
-            return False
-        return bool(settings.get("project_id")) and bool(
-            settings.get("service_account_path")
-        )
+        return is_google_settings_complete(self.get_google_settings())
 
     def is_alexa_complete(self) -> bool:
         """Check if Alexa settings are complete enough to generate YAML."""
-        settings = self.get_alexa_settings()
-        if not settings.get("enabled"):
-            return False
-        return bool(settings.get("advanced_yaml"))
+        return is_alexa_settings_complete(self.get_alexa_settings())
 
     def is_homekit_complete(self) -> bool:
-        """Check if HomeKit is configured (has a bridge selected)."""
+        """Check if HomeKit is configured (a bridge or a shard set selected)."""
+        sharding = self.get_homekit_sharding()
+        if sharding.get("enabled") and sharding.get("entry_ids"):
+            return True
         return self.get_homekit_entry_id() is not None
 
     # ============ Full State for Frontend ============
@@ -617,6 +1168,8 @@ class VoiceAssistantManagerStorage:
             Complete state dictionary for frontend consumption.
         """
         return {
+            "revision": self.content_revision,
+            "revisions": self.revisions,
             "mode": self.mode,
             # New v2 structure
             "filter_config": self.get_filter_config(),
@@ -633,6 +1186,7 @@ class VoiceAssistantManagerStorage:
                 "homekit_filter_config", DEFAULT_FILTER_CONFIG
             ),
             "homekit_entry_id": self.get_homekit_entry_id(),
+            "homekit_sharding": self.get_homekit_sharding(),
             # Settings
             "google_settings": self.get_google_settings(),
             "alexa_settings": self.get_alexa_settings(),
@@ -5,7 +5,10 @@ Google Assistant and Alexa Smart Home integrations.
 """
 from __future__ import annotations
 
+import difflib
 import logging
+import re
+from collections import ChainMap
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -17,11 +20,17 @@ from .const import (
     ALEXA_YAML_PATH,
     ASSISTANT_ALEXA,
     ASSISTANT_GOOGLE,
+    DEFAULT_ALEXA_SETTINGS,
+    DEFAULT_FILTER_CONFIG,
+    DEFAULT_GOOGLE_SETTINGS,
     FILTER_MODE_EXCLUDE,
     GOOGLE_YAML_PATH,
+    MODE_LINKED,
     VERSION,
 )
 from .exceptions import YAMLGenerationError
+from .metrics import Trace, get_metrics, trace_span
+from .storage import is_alexa_settings_complete, is_google_settings_complete
 from .validators import validate_path
 
 if TYPE_CHECKING:
@@ -29,6 +38,9 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+# An entity ID on its own YAML line: an entity_config key or a filter list item
+_DIFF_ENTITY_LINE = re.compile(r"^[+-]\s*(?:-\s+)?([a-z0-9_]+\.[a-z0-9_]+):?\s*$")
+
 
 class YAMLGenerator:
     """Generate YAML files for voice assistants.
@@ -36,20 +48,83 @@ class YAMLGenerator:
     This class handles the generation and writing of YAML configuration
     files for Google Assistant and Alexa integrations.
 
+    The generator reads a snapshot of the storage data taken at construction
+    time, optionally with an overlay of pending (unsaved) values layered on
+    top. Neither is ever modified, so previews never touch live storage and
+    any number of generators can run concurrently.
+
     Attributes:
         hass: Home Assistant instance.
         storage: Voice Assistant Manager storage instance.
     """
 
-    def __init__(self, hass: HomeAssistant, storage: VoiceManagerStorage) -> None:
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        storage: VoiceManagerStorage,
+        overlay: dict[str, Any] | None = None,
+    ) -> None:
         """Initialize the YAML generator.
 
         Args:
             hass: Home Assistant instance.
             storage: Voice Assistant Manager storage instance.
+            overlay: Optional pending values keyed like the storage data
+                (e.g. "google_filter_config", "aliases", "alexa_settings")
+                that take precedence over the stored ones.
         """
         self.hass = hass
         self.storage = storage
+        self._data: ChainMap[str, Any] = ChainMap(overlay or {}, storage.snapshot())
+
+    @property
+    def mode(self) -> str:
+        """Return the effective mode (linked or separate)."""
+        return self._data.get("mode", MODE_LINKED)
+
+    def _get_filter_config(self, assistant: str) -> dict[str, Any]:
+        """Return the effective filter config for an assistant (read-only)."""
+        if self.mode == MODE_LINKED:
+            return self._data.get("filter_config", DEFAULT_FILTER_CONFIG)
+        return self._data.get(f"{assistant}_filter_config", DEFAULT_FILTER_CONFIG)
+
+    def get_google_settings(self) -> dict[str, Any]:
+        """Return the effective Google Assistant settings (read-only)."""
+        return self._data.get("google_settings", DEFAULT_GOOGLE_SETTINGS)
+
+    def get_alexa_settings(self) -> dict[str, Any]:
+        """Return the effective Alexa settings (read-only)."""
+        return self._data.get("alexa_settings", DEFAULT_ALEXA_SETTINGS)
+
+    def is_google_complete(self) -> bool:
+        """Check if the effective Google settings are complete."""
+        return is_google_settings_complete(self.get_google_settings())
+
+    def is_alexa_complete(self) -> bool:
+        """Check if the effective Alexa settings are complete."""
+        return is_alexa_settings_complete(self.get_alexa_settings())
+
+    def get_preview_inputs(self, assistant: str) -> dict[str, Any]:
+        """Return the stored inputs the output for an assistant depends on.
+
+        Together with the registry revision this identifies a preview, so it
+        can be used as a cache key.
+
+        Args:
+            assistant: The assistant type.
+
+        Returns:
+            Dict with the effective filter config, aliases and settings.
+        """
+        if assistant == ASSISTANT_GOOGLE:
+            settings = self.get_google_settings()
+        else:
+            settings = self.get_alexa_settings()
+        return {
+            "filter_config": self._get_filter_config(assistant),
+            "aliases": self._get_effective_aliases(assistant),
+            "settings": settings,
+        }
 
     def _expand_device_to_entities(self, device_ids: list[str]) -> list[str]:
         """Expand device IDs to their entity IDs.
@@ -63,7 +138,9 @@ class YAMLGenerator:
         ent_reg = er.async_get(self.hass)
         entity_ids = []
 
+        metrics = get_metrics(self.hass)
         for device_id in device_ids:
+            metrics.record_registry_scan("yaml_devices")
             for entity in ent_reg.entities.values():
                 if entity.device_id == device_id and not entity.disabled:
                     entity_ids.append(entity.entity_id)
@@ -76,6 +153,7 @@ class YAMLGenerator:
         Returns:
             List of all entity IDs.
         """
+        get_metrics(self.hass).record_registry_scan("yaml_entities")
         ent_reg = er.async_get(self.hass)
         return [
             entity.entity_id
@@ -92,6 +170,7 @@ class YAMLGenerator:
         Returns:
             List of entity IDs in those domains.
         """
+        get_metrics(self.hass).record_registry_scan("yaml_domains")
         ent_reg = er.async_get(self.hass)
         entity_ids = []
 
@@ -114,8 +193,7 @@ class YAMLGenerator:
         Returns:
             List of entity IDs that should be hidden (expose: false).
         """
-        assistant_key = assistant if self.storage.mode != "linked" else None
-        config = self.storage.get_filter_config(assistant_key)
+        config = self._get_filter_config(assistant)
 
         filter_mode = config.get("filter_mode", FILTER_MODE_EXCLUDE)
         domains = set(config.get("domains", []))
@@ -159,9 +237,9 @@ class YAMLGenerator:
         Returns:
             Dictionary mapping entity IDs to aliases.
         """
-        return self.storage.get_aliases(
-            assistant if self.storage.mode != "linked" else None
-        )
+        if self.mode == MODE_LINKED:
+            return self._data.get("aliases", {})
+        return self._data.get(f"{assistant}_aliases", {})
 
     def _parse_advanced_yaml(
         self, yaml_text: str
@@ -202,6 +280,23 @@ class YAMLGenerator:
             warnings.append(f"Invalid YAML in advanced settings: {err}")
             return {}, warnings
 
+    def render_yaml(self, config: dict[str, Any] | None) -> str:
+        """Render a built configuration to YAML.
+
+        This only touches the configuration dict (no registry or storage
+        access), so it is safe to run in the executor.
+
+        Args:
+            config: Configuration from build_google_config() or
+                build_alexa_config(), or None.
+
+        Returns:
+            YAML string, or an empty string if there is no configuration.
+        """
+        if config is None:
+            return ""
+        return self._dict_to_yaml_with_secrets(config)
+
     def _dict_to_yaml_with_secrets(self, data: dict) -> str:
         """Convert dict to YAML string, properly handling !secret values.
 
@@ -240,17 +335,32 @@ class YAMLGenerator:
     def generate_google_yaml(self) -> tuple[str, list[str]]:
         """Generate Google Assistant YAML configuration.
 
+        Returns:
+            Tuple of (yaml_content, warnings).
+        """
+        config, warnings = self.build_google_config()
+        return self.render_yaml(config), warnings
+
+    def build_google_config(
+        self, trace: Trace | None = None
+    ) -> tuple[dict[str, Any] | None, list[str]]:
+        """Build the Google Assistant configuration dict.
+
         Google Assistant uses entity_config with expose: false for exclusions,
         NOT filter like Alexa does. This works for both include and exclude modes.
 
+        Args:
+            trace: Optional trace to time the advanced YAML parse in.
+
         Returns:
-            Tuple of (yaml_content, warnings).
+            Tuple of (config, warnings). Config is None if nothing can be
+            generated.
         """
         warnings = []
-        settings = self.storage.get_google_settings()
+        settings = self.get_google_settings()
 
         if not settings.get("enabled"):
-            return "", ["Google Assistant is disabled"]
+            return None, ["Google Assistant is disabled"]
 
         if not settings.get("project_id"):
             warnings.append("Missing project_id")
@@ -258,7 +368,7 @@ class YAMLGenerator:
             warnings.append("Missing service_account_path")
 
         if warnings:
-            return "", warnings
+            return None, warnings
 
         # Build the configuration
         service_account_path = settings["service_account_path"]
@@ -291,7 +401,8 @@ class YAMLGenerator:
         # Parse and merge advanced YAML
         advanced_yaml = settings.get("advanced_yaml", "")
         if advanced_yaml:
-            advanced_config, adv_warnings = self._parse_advanced_yaml(advanced_yaml)
+            with trace_span(trace, "google.advanced_yaml"):
+                advanced_config, adv_warnings = self._parse_advanced_yaml(advanced_yaml)
             warnings.extend(adv_warnings)
 
             # Merge advanced config (but don't override our entity_config)
@@ -322,36 +433,49 @@ class YAMLGenerator:
         if entity_config:
             ga_config["entity_config"] = entity_config
 
-        # Generate YAML
-        yaml_output = self._dict_to_yaml_with_secrets(config)
-
-        return yaml_output, warnings
+        return config, warnings
 
     def generate_alexa_yaml(self) -> tuple[str, list[str]]:
         """Generate Alexa YAML configuration.
 
+        Returns:
+            Tuple of (yaml_content, warnings).
+        """
+        config, warnings = self.build_alexa_config()
+        return self.render_yaml(config), warnings
+
+    def build_alexa_config(
+        self, trace: Trace | None = None
+    ) -> tuple[dict[str, Any] | None, list[str]]:
+        """Build the Alexa configuration dict.
+
         Alexa supports both include and exclude filters natively.
 
+        Args:
+            trace: Optional trace to time the advanced YAML parse in.
+
         Returns:
-            Tuple of (yaml_content, warnings).
+            Tuple of (config, warnings). Config is None if nothing can be
+            generated.
         """
         warnings = []
-        settings = self.storage.get_alexa_settings()
+        settings = self.get_alexa_settings()
 
         if not settings.get("enabled"):
-            return "", ["Alexa is disabled"]
+            return None, ["Alexa is disabled"]
 
         advanced_yaml = settings.get("advanced_yaml", "")
         if not advanced_yaml:
             warnings.append("Missing advanced_yaml configuration for Alexa")
-            return "", warnings
+            return None, warnings
 
         # Parse advanced YAML
-        advanced_config, adv_warnings = self._parse_advanced_yaml(advanced_yaml)
+        with trace_span(trace, "alexa.advanced_yaml"):
+            advanced_config, adv_warnings = self._parse_advanced_yaml(advanced_yaml)
         warnings.extend(adv_warnings)
 
         if adv_warnings:
-            return "", warnings
+            return None, warnings
 
         # Build the configuration
         config: dict[str, Any] = {"alexa": {"smart_home": {}}}
@@ -364,8 +488,7 @@ class YAMLGenerator:
                 smart_home[key] = value
 
         # Get filter config
-        assistant_key = ASSISTANT_ALEXA if self.storage.mode != "linked" else None
-        filter_config = self.storage.get_filter_config(assistant_key)
+        filter_config = self._get_filter_config(ASSISTANT_ALEXA)
 
         filter_mode = filter_config.get("filter_mode", FILTER_MODE_EXCLUDE)
         domains = filter_config.get("domains", [])
@@ -429,42 +552,57 @@ class YAMLGenerator:
                 if alias:
                     smart_home["entity_config"][entity_id] = {"name": alias}
 
-        # Generate YAML
-        yaml_output = self._dict_to_yaml_with_secrets(config)
+        return config, warnings
 
-        return yaml_output, warnings
-
-    async def async_write_google_yaml(self) -> None:
+    async def async_write_google_yaml(self, trace: Trace | None = None) -> None:
         """Write Google Assistant YAML to file.
 
+        Args:
+            trace: Optional trace receiving the google.exposure,
+                google.advanced_yaml, google.serialize and google.write stages.
+
         Raises:
             YAMLGenerationError: If YAML cannot be generated.
             SecurityError: If the output path is not safe.
         """
-        yaml_content, warnings = self.generate_google_yaml()
+        with trace_span(trace, "google.exposure"):
+            config, warnings = self.build_google_config(trace)
 
         if warnings:
             raise YAMLGenerationError(
                 f"Cannot write Google YAML: {', '.join(warnings)}"
             )
 
-        await self._async_write_file(GOOGLE_YAML_PATH, yaml_content)
+        with trace_span(trace, "google.serialize"):
+            yaml_content = self.render_yaml(config)
+
+        with trace_span(trace, "google.write"):
+            await self._async_write_file(GOOGLE_YAML_PATH, yaml_content)
 
-    async def async_write_alexa_yaml(self) -> None:
+    async def async_write_alexa_yaml(self, trace: Trace | None = None) -> None:
         """Write Alexa YAML to file.
 
+        Args:
+            trace: Optional trace receiving the alexa.exposure,
+                alexa.advanced_yaml, alexa.serialize and alexa.write stages.
+
         Raises:
             YAMLGenerationError: If YAML cannot be generated.
             SecurityError: If the output path is not safe.
         """
-        yaml_content, warnings = self.generate_alexa_yaml()
+        with trace_span(trace, "alexa.exposure"):
+            config, warnings = self.build_alexa_config(trace)
 
         if warnings:
             raise YAMLGenerationError(
                 f"Cannot write Alexa YAML: {', '.join(warnings)}"
             )
 
-        await self._async_write_file(ALEXA_YAML_PATH, yaml_content)
+        with trace_span(trace, "alexa.serialize"):
+            yaml_content = self.render_yaml(config)
+
+        with trace_span(trace, "alexa.write"):
+            await self._async_write_file(ALEXA_YAML_PATH, yaml_content)
 
     async def _async_write_file(self, relative_path: str, content: str) -> None:
         """Write content to a file in the config directory.
@@ -489,17 +627,74 @@ class YAMLGenerator:
         def write() -> None:
             """Write file synchronously."""
             with open(file_path, "w", encoding="utf-8") as f:
-                # Add header comment
-                f.write(
-                    f"# Generated by Voice Assistant Manager v{VERSION} - DO NOT EDIT MANUALLY\n"
-                )
-                f.write(
-                    "# This file will be overwritten when you save changes in Voice Assistant Manager\n\n"
-                )
-                f.write(content)
+                f.write(self._render_file(content))
 
         try:
             await self.hass.async_add_executor_job(write)
             _LOGGER.info("Written YAML to %s", file_path)
         except OSError as err:
             raise YAMLGenerationError(f"Failed to write file: {err}") from err
+
+    @staticmethod
+    def _render_file(content: str) -> str:
+        """Return the full file text (header comment plus YAML content)."""
+        return (
+            f"# Generated by Voice Assistant Manager v{VERSION} - DO NOT EDIT MANUALLY\n"
+            "# This file will be overwritten when you save changes in Voice Assistant Manager\n\n"
+            f"{content}"
+        )
+
+    def diff_with_file(self, relative_path: str, content: str) -> dict[str, Any]:
+        """Compare rendered YAML with the file currently on disk.
+
+        This does blocking I/O and must run in the executor.
+
+        Args:
+            relative_path: Path of the generated file relative to the
+                config directory.
+            content: Rendered YAML content (without header).
+
+        Returns:
+            Dict with the unified diff, whether the file exists, and the
+            number of entity IDs added to and removed from the file.
+
+        Raises:
+            SecurityError: If the path is not safe.
+            YAMLGenerationError: If the existing file cannot be read.
+        """
+        file_path = validate_path(relative_path, Path(self.hass.config.path()))
+
+        exists = file_path.exists()
+        current = ""
+        if exists:
+            try:
+                current = file_path.read_text(encoding="utf-8")
+            except OSError as err:
+                raise YAMLGenerationError(f"Failed to read file: {err}") from err
+
+        diff_lines = list(
+            difflib.unified_diff(
+                current.splitlines(keepends=True),
+                self._render_file(content).splitlines(keepends=True),
+                fromfile=f"a/{relative_path}",
+                tofile=f"b/{relative_path}",
+            )
+        )
+
+        added: set[str] = set()
+        removed: set[str] = set()
+        for line in diff_lines[2:]:
+            match = _DIFF_ENTITY_LINE.match(line)
+            if match is None:
+                continue
+            if line.startswith("+"):
+                added.add(match.group(1))
+            else:
+                removed.add(match.group(1))
+
+        return {
+            "diff": "".join(diff_lines),
+            "exists": exists,
+            "added_entities": len(added - removed),
+            "removed_entities": len(removed - added),
+        }